@@ -0,0 +1,114 @@
+"""Удаление департамента с большим количеством работников.
+
+Сравнивается удаление через сессию ORM с загруженным списком
+работников (ORM обнуляет `department_id` отдельным UPDATE для каждого
+работника) и `DepartmentCRUD.delete`, где ссылки обнуляет сама БД
+по `ON DELETE SET NULL`.
+
+Запуск из корня проекта:
+    python -m benchmarks.department_delete
+"""
+import asyncio
+import os
+import tempfile
+import time
+from datetime import date
+
+from sqlalchemy import event, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import selectinload, sessionmaker
+from sqlalchemy.pool import NullPool
+
+from src.data_base.base import enable_sqlite_foreign_keys
+from src.data_base.crud import DepartmentCRUD
+from src.data_base.models import Base, Department, User
+
+EMPLOYEES: int = 5000
+
+
+async def fill_department(session_maker: sessionmaker) -> int:
+    """Создает департамент с `EMPLOYEES` работниками и возвращает его `id`."""
+    async with session_maker() as session:
+        department = Department(title='Большой отдел')
+        session.add(department)
+        await session.flush()
+        await session.execute(insert(User), [
+            {
+                'first_name': 'Работник',
+                'last_name': 'Отдела',
+                'username': 'worker{}'.format(number),
+                'password': 'hash',
+                'date_of_birth': date(1990, 1, 1),
+                'department_id': department.id,
+            } for number in range(EMPLOYEES)
+        ])
+        await session.commit()
+        return department.id
+
+
+async def delete_with_orm(session: AsyncSession, department_id: int) -> None:
+    department = await session.get(
+        Department,
+        department_id,
+        options=[selectinload(Department.employees)]
+    )
+    await session.delete(department)
+    await session.commit()
+
+
+async def delete_with_crud(session: AsyncSession, department_id: int) -> None:
+    await DepartmentCRUD(session).delete(department_id)
+
+
+async def measure(title: str, session_maker: sessionmaker, engine, delete):
+    department_id = await fill_department(session_maker)
+    # Для executemany учитывается каждый набор параметров
+    statements: list[str] = []
+
+    def before_cursor_execute(
+        conn, cursor, statement, parameters, context, executemany
+    ):
+        statements.extend(
+            [statement] * (len(parameters) if executemany else 1)
+        )
+
+    event.listen(
+        engine.sync_engine, 'before_cursor_execute', before_cursor_execute
+    )
+    async with session_maker() as session:
+        started = time.perf_counter()
+        await delete(session, department_id)
+        elapsed = time.perf_counter() - started
+    event.remove(
+        engine.sync_engine, 'before_cursor_execute', before_cursor_execute
+    )
+    async with session_maker() as session:
+        orphans = await session.scalar(
+            select(func.count()).where(User.department_id.is_(None))
+        )
+        await session.execute(User.__table__.delete())
+        await session.commit()
+    print('{:16} {:8.1f} мс  запросов {:6}  без отдела {:6}'.format(
+        title, elapsed * 1000, len(statements), orphans
+    ))
+
+
+async def main() -> None:
+    path = os.path.join(tempfile.mkdtemp(), 'bench.sqlite3')
+    engine = create_async_engine(
+        'sqlite+aiosqlite:///{}'.format(path), poolclass=NullPool
+    )
+    event.listen(engine.sync_engine, 'connect', enable_sqlite_foreign_keys)
+    session_maker = sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    print('работников в департаменте: {}'.format(EMPLOYEES))
+    await measure('сессия ORM', session_maker, engine, delete_with_orm)
+    await measure('DepartmentCRUD', session_maker, engine, delete_with_crud)
+    await engine.dispose()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,39 @@
+"""Микробенчмарк проверки JWT-токена с кэшем и без него.
+
+Запуск из корня проекта:
+    python -m benchmarks.jwt_decode
+"""
+import timeit
+from datetime import datetime, timedelta
+
+from jose import jwt
+
+from src.core.services.authentication_service import (ALGORITHM, TOKEN_CACHE,
+                                                      AuthenticationService)
+from src.core.settings import settings
+
+NUMBER: int = 20000
+
+
+def main() -> None:
+    token = jwt.encode(
+        {'username': 'bench', 'exp': datetime.utcnow() + timedelta(days=7)},
+        settings.SECRET_KEY,
+        algorithm=ALGORITHM
+    )
+    uncached = timeit.timeit(
+        lambda: jwt.decode(token, settings.SECRET_KEY, algorithms=[ALGORITHM]),
+        number=NUMBER
+    )
+    TOKEN_CACHE.clear()
+    cached = timeit.timeit(
+        lambda: AuthenticationService.get_username_from_token(token),
+        number=NUMBER
+    )
+    print('jwt.decode:    {:8.2f} мкс/вызов'.format(uncached / NUMBER * 1e6))
+    print('с кэшем:       {:8.2f} мкс/вызов'.format(cached / NUMBER * 1e6))
+    print('статистика кэша: {}'.format(TOKEN_CACHE.stats))
+
+
+if __name__ == '__main__':
+    main()
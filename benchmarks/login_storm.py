@@ -0,0 +1,124 @@
+"""Задержка посторонних запросов во время волны логинов.
+
+Пока выполняются `LOGINS` одновременных логинов, каждые
+`PROBE_INTERVAL` секунд отправляется запрос `GET /api/v1/positions/`,
+который не хеширует пароли, и измеряется его задержка. Сравниваются
+проверка пароля прямо в event loop и в пуле исполнителей.
+
+Запуск из корня проекта:
+    python -m benchmarks.login_storm
+"""
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from datetime import date
+from unittest.mock import patch
+
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+
+from src.api_main import create_application
+from src.core.services import password_hasher
+from src.core.services.admission import LOGIN_USERNAME_RATE_LIMITER
+from src.core.services.authentication_service import AuthenticationService
+from src.data_base.base import get_session
+from src.data_base.models import Base, User
+
+LOGINS: int = 20
+PROBE_INTERVAL: float = 0.1
+BASE_URL: str = 'http://bench/api/v1'
+
+
+async def run_inline(func, *args):
+    """Проверяет пароль прямо в event loop, как до выноса в пул."""
+    return func(*args)
+
+
+def report(title: str, latencies: list[float]) -> None:
+    percentiles = statistics.quantiles(latencies, n=100)
+    print('{:16} запросов {:5}  p50 {:8.1f} мс  p99 {:8.1f} мс'.format(
+        title, len(latencies), percentiles[49], percentiles[98]
+    ))
+
+
+async def run_storm(client: AsyncClient, headers: dict) -> list[float]:
+    """Запускает волну логинов и замеряет задержку посторонних запросов.
+
+    Запросы отправляются с постоянным интервалом, задержка отсчитывается
+    от запланированного момента отправки: так учитывается и время,
+    пока заблокированный event loop не мог отправить запрос.
+    """
+    async def login():
+        await client.post('/employees/login/', json={
+            'username': 'bench', 'password': '12345678'
+        })
+
+    async def probe(scheduled: float, latencies: list[float]):
+        await client.get('/positions/', headers=headers)
+        latencies.append((time.perf_counter() - scheduled) * 1000)
+
+    latencies: list[float] = []
+    probes: list[asyncio.Task] = []
+    storm = asyncio.gather(*(login() for _ in range(LOGINS)))
+    started = time.perf_counter()
+    while not storm.done():
+        scheduled = started + len(probes) * PROBE_INTERVAL
+        await asyncio.sleep(max(0, scheduled - time.perf_counter()))
+        probes.append(asyncio.create_task(probe(scheduled, latencies)))
+    await asyncio.gather(storm, *probes)
+    return latencies
+
+
+async def main() -> None:
+    path = os.path.join(tempfile.mkdtemp(), 'bench.sqlite3')
+    engine = create_async_engine(
+        'sqlite+aiosqlite:///{}'.format(path), poolclass=NullPool
+    )
+    session_maker = sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with session_maker() as session:
+        session.add(User(
+            first_name='Тест',
+            last_name='Тестов',
+            username='bench',
+            password=AuthenticationService.get_password_hash('12345678'),
+            date_of_birth=date(1990, 1, 1),
+            status='admin',
+            is_blocked=False
+        ))
+        await session.commit()
+
+    async def override_get_session():
+        async with session_maker() as session:
+            yield session
+
+    # Волна логинов одного пользователя не должна упираться в лимит частоты
+    LOGIN_USERNAME_RATE_LIMITER.capacity = LOGINS * 3
+    app = create_application()
+    app.dependency_overrides[get_session] = override_get_session
+    hasher = password_hasher.PASSWORD_HASHER
+    async with AsyncClient(app=app, base_url=BASE_URL) as client:
+        response = await client.post('/employees/login/', json={
+            'username': 'bench', 'password': '12345678'
+        })
+        headers = {
+            'Authorization': 'Bearer {}'.format(
+                response.json()['access_token']
+            )
+        }
+        with patch.object(hasher, '_run', run_inline):
+            report('в event loop', await run_storm(client, headers))
+        report('в пуле потоков', await run_storm(client, headers))
+    hasher.shutdown()
+    await engine.dispose()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,72 @@
+"""Сериализация страницы работников схемой pydantic и напрямую.
+
+Страница из 10 000 работников с отделом, должностью и заработной платой
+превращается в тело ответа двумя способами:
+- pydantic: `from_orm` схемы, `jsonable_encoder` и `JSONResponse`
+  (так `FastAPI` обрабатывает возвращенный объект);
+- напрямую: `serialized_response` по той же схеме.
+Выводится процессорное время на одну страницу и совпадение тел ответов.
+
+Запуск из корня проекта:
+    python -m benchmarks.response_serialization
+"""
+import time
+from datetime import date
+from decimal import Decimal
+from typing import Callable
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from src.api.v1.response_models.page import PageResponse
+from src.api.v1.response_models.serializers import serialized_response
+from src.api.v1.response_models.user import UserResponse
+from src.data_base.DTO_models import (PageDTO, SalaryShortDTO, TitledDTO,
+                                      UserReadDTO)
+from src.data_base.models import User
+
+USERS: int = 10000
+REPEAT: int = 5
+MODEL = PageResponse[UserResponse]
+PAGE: PageDTO = PageDTO(items=[
+    UserReadDTO(
+        id=number,
+        first_name='Работник',
+        last_name='Отдела',
+        username='user{}'.format(number),
+        date_of_birth=date(1990, 1, 1),
+        is_blocked=False,
+        status=User.Status.EMPLOYEE,
+        department=TitledDTO(number % 50 + 1, 'Отдел'),
+        position=TitledDTO(number % 20 + 1, 'Должность'),
+        salary=SalaryShortDTO(number, Decimal('1000.50'), date(2100, 1, 1))
+    ) for number in range(USERS)
+])
+
+
+def render_pydantic() -> bytes:
+    return JSONResponse(jsonable_encoder(MODEL.from_orm(PAGE))).body
+
+
+def render_direct() -> bytes:
+    return serialized_response(MODEL, PAGE).body
+
+
+def measure(title: str, render: Callable[[], bytes]) -> bytes:
+    started = time.process_time()
+    for _ in range(REPEAT):
+        body = render()
+    elapsed = (time.process_time() - started) / REPEAT
+    print('{:10} {:8.1f} мс'.format(title, elapsed * 1000))
+    return body
+
+
+def main() -> None:
+    print('работников на странице: {}'.format(USERS))
+    expected = measure('pydantic', render_pydantic)
+    body = measure('напрямую', render_direct)
+    print('тела ответов совпадают: {}'.format(body == expected))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+"""Пиковая память выдачи всего списка заработных плат.
+
+Список выдается одним телом JSON, как постраничный ответ без ограничения
+размера страницы, и потоком NDJSON из курсора на стороне сервера.
+Для каждого способа выводятся пиковая память Python (`tracemalloc`),
+время и размер ответа при разном количестве записей.
+
+Запуск из корня проекта:
+    python -m benchmarks.salary_stream
+"""
+import asyncio
+import os
+import tempfile
+import time
+import tracemalloc
+from datetime import date
+from typing import Awaitable, Callable
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import joinedload
+from sqlalchemy.pool import NullPool
+
+from src.api.v1.response_models.page import PageResponse, ndjson_response
+from src.api.v1.response_models.salary import SalaryResponse
+from src.data_base.crud import SalaryCRUD
+from src.data_base.models import Base, Salary
+
+SIZES: tuple[int, ...] = (10000, 50000, 100000)
+
+
+async def export_json(session: AsyncSession) -> int:
+    salaries = (await session.scalars(
+        select(Salary)
+        .options(joinedload(Salary.employee))
+        .order_by(Salary.raise_date, Salary.id)
+    )).all()
+    body = PageResponse[SalaryResponse](items=salaries).json()
+    return len(body.encode())
+
+
+async def export_ndjson(session: AsyncSession) -> int:
+    response = ndjson_response(
+        SalaryCRUD(session).stream_all(), SalaryResponse
+    )
+    size = 0
+    async for line in response.body_iterator:
+        size += len(line.encode())
+    return size
+
+
+async def measure(
+    session: AsyncSession,
+    title: str,
+    export: Callable[[AsyncSession], Awaitable[int]]
+) -> None:
+    tracemalloc.start()
+    started = time.perf_counter()
+    size = await export(session)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    session.expunge_all()
+    print('{:8} {:8.2f} с  пик {:8.1f} МБ  ответ {:8.1f} МБ'.format(
+        title, elapsed, peak / 2 ** 20, size / 2 ** 20
+    ))
+
+
+async def main() -> None:
+    for size in SIZES:
+        path = os.path.join(tempfile.mkdtemp(), 'bench.sqlite3')
+        engine = create_async_engine(
+            'sqlite+aiosqlite:///{}'.format(path), poolclass=NullPool
+        )
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+            await conn.execute(insert(Salary), [
+                {
+                    'amount': 1000 + number % 500,
+                    'raise_date': date(2100, 1, 1 + number % 28)
+                } for number in range(size)
+            ])
+        print('== заработных плат: {}'.format(size))
+        async with AsyncSession(engine) as session:
+            await measure(session, 'JSON', export_json)
+            await measure(session, 'NDJSON', export_ndjson)
+        await engine.dispose()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
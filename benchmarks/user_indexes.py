@@ -0,0 +1,115 @@
+"""Планы и время запросов по внешним ключам и статусу работников.
+
+На большой таблице работников запросы, которыми загружаются
+`Department.employees` и `Position.employees`, обнуляются ссылки при
+удалении зарплаты и проверяется статус, выполняются без индексов
+и с индексами из миграции `bda75a1dae2f`. Для каждого запроса
+выводится план (`EXPLAIN QUERY PLAN`) и среднее время выполнения.
+
+Запуск из корня проекта:
+    python -m benchmarks.user_indexes
+"""
+import asyncio
+import os
+import tempfile
+import time
+from datetime import date
+
+from sqlalchemy import insert, text
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from src.data_base.models import Base, Department, Position, Salary, User
+
+USERS: int = 100000
+DEPARTMENTS: int = 200
+POSITIONS: int = 50
+REPEAT: int = 20
+INDEXED_COLUMNS: tuple[str, ...] = (
+    'department_id', 'position_id', 'salary_id', 'status'
+)
+QUERIES: dict[str, str] = {
+    'Department.employees': (
+        'SELECT id FROM user WHERE department_id IN (17, 42, 101)'
+    ),
+    'Position.employees': 'SELECT id FROM user WHERE position_id IN (7)',
+    'ON DELETE salary': 'SELECT id FROM user WHERE salary_id = 5000',
+    'status IN': (
+        "SELECT id FROM user WHERE username = 'user5000' "
+        "AND status IN ('admin', 'staff')"
+    ),
+    'status (редкий)': "SELECT count(*) FROM user WHERE status = 'admin'",
+}
+
+
+async def seed(conn: AsyncConnection) -> None:
+    """Заполняет БД, затем удаляет индексы, созданные по модели."""
+    await conn.run_sync(Base.metadata.create_all)
+    for column in INDEXED_COLUMNS:
+        await conn.execute(text('DROP INDEX ix_user_{}'.format(column)))
+    await conn.execute(insert(Department), [
+        {'title': 'Отдел {}'.format(number)} for number in range(DEPARTMENTS)
+    ])
+    await conn.execute(insert(Position), [
+        {'title': 'Должность {}'.format(number)}
+        for number in range(POSITIONS)
+    ])
+    await conn.execute(insert(Salary), [
+        {'amount': 1000, 'raise_date': date(2100, 1, 1)}
+        for _ in range(USERS)
+    ])
+    await conn.execute(insert(User), [
+        {
+            'first_name': 'Работник',
+            'last_name': 'Отдела',
+            'username': 'user{}'.format(number),
+            'password': 'hash',
+            'date_of_birth': date(1990, 1, 1),
+            'status': (
+                User.Status.ADMIN if number % 1000 == 0
+                else User.Status.EMPLOYEE
+            ),
+            'department_id': number % DEPARTMENTS + 1,
+            'position_id': number % POSITIONS + 1,
+            'salary_id': number + 1,
+        } for number in range(USERS)
+    ])
+
+
+async def measure(conn: AsyncConnection, title: str) -> None:
+    print('== {}'.format(title))
+    for name, query in QUERIES.items():
+        plan = await conn.execute(text('EXPLAIN QUERY PLAN ' + query))
+        started = time.perf_counter()
+        for _ in range(REPEAT):
+            (await conn.execute(text(query))).all()
+        elapsed = (time.perf_counter() - started) / REPEAT
+        print('{:22} {:8.2f} мс  {}'.format(
+            name,
+            elapsed * 1000,
+            '; '.join(row[-1] for row in plan)
+        ))
+
+
+async def main() -> None:
+    path = os.path.join(tempfile.mkdtemp(), 'bench.sqlite3')
+    engine = create_async_engine(
+        'sqlite+aiosqlite:///{}'.format(path), poolclass=NullPool
+    )
+    async with engine.begin() as conn:
+        await seed(conn)
+    print('работников: {}'.format(USERS))
+    async with engine.begin() as conn:
+        await conn.execute(text('ANALYZE'))
+        await measure(conn, 'без индексов')
+        for column in INDEXED_COLUMNS:
+            await conn.execute(text(
+                'CREATE INDEX ix_user_{0} ON user ({0})'.format(column)
+            ))
+        await conn.execute(text('ANALYZE'))
+        await measure(conn, 'с индексами')
+    await engine.dispose()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,126 @@
+"""Чтение списка работников ORM-объектами и проекцией полей.
+
+Одна и та же выборка работников с отделом, должностью и заработной
+платой читается двумя способами и проверяется схемой `UserResponse`:
+- ORM: объекты `User` с `joinedload` связей (прежний путь чтения);
+- проекция: только поля схемы ответа в `__slots__` DTO
+  (`UserCRUD._get_read_query`).
+Для каждого способа выводятся процессорное время, количество
+и объем выделений памяти (`tracemalloc`) в пересчете на 10 000 строк.
+
+Запуск из корня проекта:
+    python -m benchmarks.user_projection
+"""
+import asyncio
+import os
+import tempfile
+import time
+import tracemalloc
+from datetime import date
+from typing import Any, Awaitable, Callable
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from src.api.v1.response_models.user import UserResponse
+from src.data_base.crud import UserCRUD
+from src.data_base.models import Base, Department, Position, Salary, User
+
+USERS: int = 10000
+DEPARTMENTS: int = 50
+POSITIONS: int = 20
+REPEAT: int = 5
+
+
+async def seed(engine) -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(insert(Department), [
+            {'title': 'Отдел {}'.format(number)}
+            for number in range(DEPARTMENTS)
+        ])
+        await conn.execute(insert(Position), [
+            {'title': 'Должность {}'.format(number)}
+            for number in range(POSITIONS)
+        ])
+        await conn.execute(insert(Salary), [
+            {'amount': 1000 + number % 500, 'raise_date': date(2100, 1, 1)}
+            for number in range(USERS)
+        ])
+        await conn.execute(insert(User), [
+            {
+                'first_name': 'Работник',
+                'last_name': 'Отдела',
+                'username': 'user{}'.format(number),
+                'password': '$2b$12$' + 'x' * 53,
+                'date_of_birth': date(1990, 1, 1),
+                'department_id': number % DEPARTMENTS + 1,
+                'position_id': number % POSITIONS + 1,
+                'salary_id': number + 1,
+            } for number in range(USERS)
+        ])
+
+
+async def read_orm(session: AsyncSession) -> list[Any]:
+    users = await session.scalars(
+        select(User)
+        .options(*UserCRUD._response_options)
+        .order_by(User.id)
+    )
+    return users.unique().all()
+
+
+async def read_projection(session: AsyncSession) -> list[Any]:
+    crud = UserCRUD(session)
+    result = await session.execute(
+        crud._get_read_query().order_by(User.id)
+    )
+    return [crud._to_read_dto(row) for row in result]
+
+
+async def measure(
+    engine, title: str, read: Callable[[AsyncSession], Awaitable[list]]
+) -> None:
+    cpu = 0.0
+    for _ in range(REPEAT):
+        async with AsyncSession(engine) as session:
+            started = time.process_time()
+            users = await read(session)
+            [UserResponse.from_orm(user) for user in users]
+            cpu += time.process_time() - started
+    async with AsyncSession(engine) as session:
+        tracemalloc.start()
+        users = await read(session)
+        [UserResponse.from_orm(user) for user in users]
+        snapshot = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    stats = snapshot.statistics('filename')
+    scale = 10000 / len(users)
+    print(
+        '{:10} CPU {:7.1f} мс  выделений {:8.0f}  {:6.1f} МБ  пик {:6.1f} МБ'
+        .format(
+            title,
+            cpu / REPEAT * 1000 * scale,
+            sum(stat.count for stat in stats) * scale,
+            sum(stat.size for stat in stats) / 2 ** 20 * scale,
+            peak / 2 ** 20 * scale
+        )
+    )
+
+
+async def main() -> None:
+    path = os.path.join(tempfile.mkdtemp(), 'bench.sqlite3')
+    engine = create_async_engine(
+        'sqlite+aiosqlite:///{}'.format(path), poolclass=NullPool
+    )
+    await seed(engine)
+    print('работников: {}, на 10 000 строк:'.format(USERS))
+    await measure(engine, 'ORM', read_orm)
+    await measure(engine, 'проекция', read_projection)
+    await engine.dispose()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -11,3 +11,5 @@ router.include_router(routers.departments_router)
 router.include_router(routers.positions_router)
 router.include_router(routers.salaries_router)
 router.include_router(routers.users_router)
+router.include_router(routers.reports_router)
+router.include_router(routers.metrics_router)
@@ -0,0 +1,22 @@
+import enum
+
+from pydantic import Field, PositiveInt
+
+from src.core.settings import settings
+
+from .base_request import BaseRequest
+
+
+class BulkMode(str, enum.Enum):
+    """Режим обработки ошибок массового запроса."""
+
+    # Любая ошибка отменяет запрос целиком
+    ATOMIC = 'atomic'
+    # Корректные элементы обрабатываются, ошибочные - возвращаются в ответе
+    PARTIAL = 'partial'
+
+
+class LookupRequest(BaseRequest):
+    ids: list[PositiveInt] = Field(
+        min_items=1, max_items=settings.BULK_MAX_ITEMS
+    )
@@ -0,0 +1,31 @@
+from typing import Annotated
+
+from fastapi import Header
+
+
+class ConditionalHeaders:
+    """Заголовок `If-None-Match` условного GET-запроса.
+
+    Содержит ETag представлений, уже полученных клиентом.
+    Теги сравниваются без учета префикса слабого тега `W/`.
+    """
+
+    def __init__(
+        self,
+        if_none_match: Annotated[str | None, Header(
+            description='ETag полученного ранее ответа'
+        )] = None
+    ) -> None:
+        self.etags = frozenset(
+            etag.strip().removeprefix('W/')
+            for etag in (if_none_match or '').split(',')
+            if etag.strip()
+        )
+
+    def matches(self, etag: str) -> bool:
+        """Проверяет, есть ли у клиента представление с тегом `etag`.
+
+        Аргументы:
+            etag: str - ETag текущего представления
+        """
+        return '*' in self.etags or etag in self.etags
@@ -0,0 +1,93 @@
+from typing import Annotated, Callable
+
+from fastapi import Query
+from pydantic import BaseModel
+from pydantic.utils import lenient_issubclass
+
+from src.core.exc import custom_exceptions
+from src.data_base.fields import FieldTree
+
+# Выбранные поля: для вложенного объекта - словарь выбранных в нем полей,
+# `None` - простое поле или вложенный объект целиком
+FieldDict = dict[str, 'FieldDict | None']
+
+
+def get_field_tree(model: type[BaseModel], fields: FieldDict) -> FieldTree:
+    """Упорядочивает выбранные поля по объявлению в схеме ответа.
+
+    Вложенный объект, выбранный целиком, раскрывается во все его поля.
+
+    Аргументы:
+        model: type[BaseModel] - схема ответа
+        fields: FieldDict - выбранные поля схемы
+    """
+    tree = []
+    for name, field in model.__fields__.items():
+        if name not in fields:
+            continue
+        subfields = fields[name]
+        if lenient_issubclass(field.type_, BaseModel):
+            if subfields is None:
+                subfields = dict.fromkeys(field.type_.__fields__)
+            subfields = get_field_tree(field.type_, subfields)
+        tree.append((name, subfields))
+    return tuple(tree)
+
+
+def parse_fields(model: type[BaseModel], raw_fields: str) -> FieldTree:
+    """Разбирает список полей `id,first_name,department.title`.
+
+    Если поле отсутствует в схеме ответа - бросает ошибку.
+
+    Аргументы:
+        model: type[BaseModel] - схема ответа
+        raw_fields: str - поля через запятую, вложенные - через точку
+    """
+    fields: FieldDict = {}
+    invalid: list[str] = []
+    for path in filter(None, map(str.strip, raw_fields.split(','))):
+        current_model, current_fields = model, fields
+        *parents, name = path.split('.')
+        for parent in parents:
+            field = current_model.__fields__.get(parent)
+            if field is None or not lenient_issubclass(field.type_, BaseModel):
+                break
+            current_model = field.type_
+            if parent not in current_fields:
+                current_fields[parent] = {}
+            if current_fields[parent] is None:
+                # Вложенный объект, уже выбранный целиком, не сужается
+                current_fields = {}
+            else:
+                current_fields = current_fields[parent]
+        else:
+            if name in current_model.__fields__:
+                current_fields[name] = None
+                continue
+        invalid.append(path)
+    if invalid or not fields:
+        raise custom_exceptions.InvalidFieldsError(invalid or [raw_fields])
+    return get_field_tree(model, fields)
+
+
+def get_fields_dependency(
+    model: type[BaseModel]
+) -> Callable[..., FieldTree | None]:
+    """Возвращает зависимость, разбирающую query-параметр `fields`.
+
+    Аргументы:
+        model: type[BaseModel] - схема ответа, по которой проверяются поля
+    """
+    def get_fields(
+        fields: Annotated[str | None, Query(
+            description=(
+                'Поля ответа через запятую, вложенные - через точку, '
+                'например `id,first_name,department.title`'
+            )
+        )] = None
+    ) -> FieldTree | None:
+        if fields is None:
+            return None
+        return parse_fields(model, fields)
+
+    return get_fields
@@ -0,0 +1,42 @@
+from typing import Annotated
+
+from fastapi import Header, Query
+
+from src.core.settings import settings
+
+NDJSON_MEDIA_TYPE: str = 'application/x-ndjson'
+
+
+class PaginationQueryParams:
+    """Query-параметры пагинации списков по курсору."""
+
+    def __init__(
+        self,
+        limit: Annotated[int, Query(
+            description='Количество записей на странице',
+            gt=0,
+            le=settings.PAGINATION_MAX_LIMIT
+        )] = settings.PAGINATION_DEFAULT_LIMIT,
+        cursor: Annotated[str | None, Query(
+            description='Курсор `next_cursor` предыдущей страницы'
+        )] = None
+    ) -> None:
+        self.limit = limit
+        self.cursor = cursor
+
+
+class StreamQueryParams:
+    """Выбор потоковой выдачи списка в формате NDJSON.
+
+    Поток включается query-параметром `stream` или заголовком
+    `Accept: application/x-ndjson`.
+    """
+
+    def __init__(
+        self,
+        stream: Annotated[bool, Query(
+            description='Выдать весь список потоком NDJSON без пагинации'
+        )] = False,
+        accept: Annotated[str | None, Header()] = None
+    ) -> None:
+        self.enabled = stream or NDJSON_MEDIA_TYPE in (accept or '')
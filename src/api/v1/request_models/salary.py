@@ -1,6 +1,13 @@
-from pydantic import FutureDate, condecimal
+import enum
+from typing import Annotated
+
+from fastapi import Query
+from pydantic import Field, FutureDate, PositiveInt, condecimal, root_validator
+
+from src.core.settings import settings
 
 from .base_request import BaseRequest
+from .validators import selection_validator
 
 
 class SalaryCreateRequest(BaseRequest):
@@ -11,3 +18,68 @@ class SalaryCreateRequest(BaseRequest):
 class SalaryUpdateRequest(BaseRequest):
     amount: condecimal(gt=0, max_digits=9, decimal_places=2) | None
     raise_date: FutureDate | None
+
+
+class SalaryAdjustRequest(BaseRequest):
+    department: PositiveInt | None
+    position: PositiveInt | None
+    ids: list[PositiveInt] | None = Field(
+        min_items=1, max_items=settings.BULK_MAX_ITEMS
+    )
+    percent: condecimal(gt=-100, max_digits=5, decimal_places=2) | None
+    delta: condecimal(max_digits=9, decimal_places=2) | None
+    raise_date: FutureDate
+    dry_run: bool = False
+
+    _validate_selection = selection_validator('department', 'position', 'ids')
+
+    @root_validator(skip_on_failure=True)
+    def check_change(cls, values):
+        if (values.get('percent') is None) == (values.get('delta') is None):
+            raise ValueError('Необходимо указать `percent` или `delta`')
+        return values
+
+
+class RaisePeriod(str, enum.Enum):
+    """Период группировки календаря повышений заработных плат."""
+
+    WEEK = 'week'
+    MONTH = 'month'
+
+
+class UpcomingRaisesQueryParams:
+    """Query-параметры календаря повышений заработных плат."""
+
+    def __init__(
+        self,
+        days: Annotated[int, Query(
+            description='Горизонт календаря в днях начиная с сегодняшнего',
+            gt=0,
+            le=settings.UPCOMING_RAISES_MAX_DAYS
+        )] = settings.UPCOMING_RAISES_DEFAULT_DAYS,
+        period: Annotated[RaisePeriod, Query(
+            description='Период группировки повышений'
+        )] = RaisePeriod.MONTH,
+        counts_only: Annotated[bool, Query(
+            description='Вернуть только количество и сумму без списка записей'
+        )] = False
+    ) -> None:
+        self.days = days
+        self.period = period
+        self.counts_only = counts_only
+
+
+class RaiseDateQueryParams:
+    """Query-параметры отбора заработных плат по дате повышения."""
+
+    def __init__(
+        self,
+        date_after: Annotated[FutureDate | None, Query(
+            description='Нижняя граница даты повышения (включительно)'
+        )] = None,
+        date_before: Annotated[FutureDate | None, Query(
+            description='Верхняя граница даты повышения (включительно)'
+        )] = None
+    ) -> None:
+        self.date_after = date_after
+        self.date_before = date_before
@@ -1,10 +1,12 @@
 from pydantic import Field, PastDate, PositiveInt, SecretStr, StrictStr
 
+from src.core.settings import settings
 from src.data_base.models import User
 
 from .base_request import BaseRequest
+from .bulk import BulkMode
 from .validators import (first_and_last_name_validator, password_validator,
-                         username_validator)
+                         selection_validator, username_validator)
 
 
 class TokenData(BaseRequest):
@@ -25,6 +27,31 @@ class UserCreateRequest(BaseRequest):
     _validate_password = password_validator('password_repeat')
 
 
+class UserBulkCreateRequest(BaseRequest):
+    items: list[UserCreateRequest] = Field(
+        min_items=1, max_items=settings.BULK_MAX_ITEMS
+    )
+    mode: BulkMode = BulkMode.ATOMIC
+
+
+class UserBulkSelectRequest(BaseRequest):
+    ids: list[PositiveInt] | None = Field(
+        min_items=1, max_items=settings.BULK_MAX_ITEMS
+    )
+    department: PositiveInt | None
+    position: PositiveInt | None
+
+    _validate_selection = selection_validator('department', 'position', 'ids')
+
+
+class UserBulkChangeStatusRequest(UserBulkSelectRequest):
+    status: User.Status
+
+
+class UserBulkTransferRequest(UserBulkSelectRequest):
+    new_department: PositiveInt | None = Field(...)
+
+
 class UserSelfUpdateRequest(BaseRequest):
     first_name: StrictStr | None = Field(min_length=2, max_length=150)
     last_name: StrictStr | None = Field(min_length=2, max_length=150)
@@ -1,6 +1,6 @@
 import re
 
-from pydantic import validator
+from pydantic import root_validator, validator
 
 VALID_FIRST_LAST_NAME = r'^[А-ЯЁ][а-яё]*([-][А-ЯЁа-яё][а-яё]+)*$'
 F_L_NAME_TEXT_ERROR = (
@@ -12,6 +12,8 @@ VALID_USERNAME = r'^[A-z][A-z0-9]+$'
 USERNAME_TEXT_ERROR = ('В поле `{field_name}` могут быть использованы только '
                        'буквы английского алфавита.')
 
+SELECTION_TEXT_ERROR = 'Необходимо указать {fields} или {last_field}.'
+
 VALID_DEPART_POSITION = r'^[А-ЯЁ][А-яЁё]*([- ][а-яё]+)*$'
 DEPART_POSITION_TEXT_ERROR = (
     'В поле `{field_name}` может быть использована только кириллица, '
@@ -62,3 +64,18 @@ def passwords_match(cls, value, values, **kwargs):
 
 def password_validator(field_name: str):
     return validator(field_name, allow_reuse=True)(passwords_match)
+
+
+def selection_validator(*field_names: str):
+    """Требует заполнить хотя бы одно из полей отбора записей."""
+    def check_selection(cls, values):
+        if not any(values.get(field_name) for field_name in field_names):
+            *fields, last_field = ('`{}`'.format(name) for name in field_names)
+            raise ValueError(SELECTION_TEXT_ERROR.format(
+                fields=', '.join(fields), last_field=last_field
+            ))
+        return values
+
+    return root_validator(skip_on_failure=True, allow_reuse=True)(
+        check_selection
+    )
@@ -0,0 +1,38 @@
+from typing import Generic, TypeVar
+
+from pydantic import BaseModel
+from pydantic.generics import GenericModel
+
+ItemType = TypeVar('ItemType')
+
+
+class BulkItemErrorResponse(BaseModel):
+    index: int
+    detail: str
+
+    class Config:
+        orm_mode = True
+
+
+class BulkResponse(GenericModel, Generic[ItemType]):
+    items: list[ItemType]
+    errors: list[BulkItemErrorResponse]
+
+    class Config:
+        orm_mode = True
+
+
+class BulkActionResponse(BaseModel):
+    affected: int
+    ids: list[int]
+
+    class Config:
+        orm_mode = True
+
+
+class LookupResponse(GenericModel, Generic[ItemType]):
+    items: list[ItemType]
+    missing_ids: list[int]
+
+    class Config:
+        orm_mode = True
@@ -0,0 +1,51 @@
+from hashlib import blake2b
+from typing import Any
+
+from fastapi import Response, status
+
+from src.api.v1.request_models.conditional import ConditionalHeaders
+
+NOT_MODIFIED_RESPONSE: dict[int, dict[str, Any]] = {
+    status.HTTP_304_NOT_MODIFIED: {
+        'description': 'Ответ не изменился с получения ETag из `If-None-Match`'
+    }
+}
+
+
+def make_etag(*parts: Any) -> str:
+    """Возвращает сильный ETag по данным, определяющим тело ответа.
+
+    Аргументы:
+        parts: Any - тело ответа (`bytes`) или версия данных
+    """
+    digest = blake2b(digest_size=16)
+    for part in parts:
+        digest.update(part if isinstance(part, bytes) else repr(part).encode())
+    return '"{}"'.format(digest.hexdigest())
+
+
+def not_modified_response(etag: str) -> Response:
+    """Возвращает ответ `304` без тела: у клиента актуальное представление.
+
+    Аргументы:
+        etag: str - ETag текущего представления
+    """
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag}
+    )
+
+
+def conditional_response(
+    response: Response, conditional: ConditionalHeaders
+) -> Response:
+    """Добавляет ответу ETag по его телу или заменяет ответ на `304`.
+
+    Аргументы:
+        response: Response - сформированный ответ
+        conditional: ConditionalHeaders - заголовки условного запроса
+    """
+    etag = make_etag(response.body)
+    if conditional.matches(etag):
+        return not_modified_response(etag)
+    response.headers['ETag'] = etag
+    return response
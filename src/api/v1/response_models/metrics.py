@@ -0,0 +1,28 @@
+from pydantic import BaseModel
+
+
+class LoginMetricsResponse(BaseModel):
+    active: int
+    queue_depth: int
+    rejected_queue_full: int
+    rejected_username_rate: int
+    rejected_ip_rate: int
+
+
+class PasswordHashingMetricsResponse(BaseModel):
+    pending: int
+    rejected: int
+
+
+class CacheMetricsResponse(BaseModel):
+    hits: int
+    misses: int
+    size: int
+
+
+class MetricsResponse(BaseModel):
+    login: LoginMetricsResponse
+    password_hashing: PasswordHashingMetricsResponse
+    bulk_password_hashing: PasswordHashingMetricsResponse
+    token_cache: CacheMetricsResponse
+    principal_cache: CacheMetricsResponse
@@ -0,0 +1,53 @@
+from typing import Any, AsyncIterator, Generic, TypeVar
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from pydantic.generics import GenericModel
+
+from src.api.v1.request_models.pagination import NDJSON_MEDIA_TYPE
+from src.data_base.fields import FieldTree
+
+from .serializers import dump_json
+
+ItemType = TypeVar('ItemType')
+
+
+class PageResponse(GenericModel, Generic[ItemType]):
+    items: list[ItemType]
+    next_cursor: str | None
+
+    class Config:
+        orm_mode = True
+
+
+def get_page_fields(fields: FieldTree | None) -> FieldTree | None:
+    """Возвращает выбранные поля страницы по выбранным полям ее записей.
+
+    Аргументы:
+        fields: FieldTree - выбранные поля записи списка
+    """
+    if fields is None:
+        return None
+    return (('items', fields), ('next_cursor', None))
+
+
+def ndjson_response(
+    objects: AsyncIterator[Any],
+    model: type[BaseModel],
+    fields: FieldTree | None = None
+) -> StreamingResponse:
+    """Возвращает ответ, передающий объекты клиенту по мере их чтения.
+
+    Каждый объект сериализуется схемой `model` в отдельную строку JSON
+    и сразу отправляется, тело ответа целиком в памяти не собирается.
+
+    Аргументы:
+        objects: AsyncIterator[Any] - объекты для выдачи
+        model: type[BaseModel] - схема ответа для одного объекта
+        fields: FieldTree - выбранные поля ответа (по умолчанию - все)
+    """
+    async def generate_lines() -> AsyncIterator[str]:
+        async for obj in objects:
+            yield dump_json(model, obj, fields) + '\n'
+
+    return StreamingResponse(generate_lines(), media_type=NDJSON_MEDIA_TYPE)
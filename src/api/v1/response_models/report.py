@@ -0,0 +1,36 @@
+from typing import Generic, TypeVar
+
+from pydantic import BaseModel
+from pydantic.generics import GenericModel
+
+from src.data_base.models import User
+
+RowType = TypeVar('RowType')
+
+
+class PayrollRowResponse(BaseModel):
+    headcount: int
+    total_amount: float
+    average_amount: float | None
+
+    class Config:
+        orm_mode = True
+
+
+class PayrollGroupResponse(PayrollRowResponse):
+    id: int | None
+    title: str | None
+
+
+class PayrollStatusResponse(PayrollRowResponse):
+    status: User.Status
+
+
+class PayrollReportResponse(GenericModel, Generic[RowType]):
+    rows: list[RowType]
+    headcount: int
+    total_amount: float
+    average_amount: float | None
+
+    class Config:
+        orm_mode = True
@@ -13,3 +13,33 @@ class SalaryResponse(BaseModel):
 
     class Config:
         orm_mode = True
+
+
+class SalaryAdjustResponse(BaseModel):
+    affected: int
+    amount_before: float | None
+    amount_after: float | None
+
+    class Config:
+        orm_mode = True
+
+
+class UpcomingRaisesBucketResponse(BaseModel):
+    period_start: date
+    department_id: int | None
+    department_title: str | None
+    count: int
+    amount: float
+    salaries: list[SalaryResponse] | None
+
+    class Config:
+        orm_mode = True
+
+
+class UpcomingRaisesResponse(BaseModel):
+    date_from: date
+    date_to: date
+    buckets: list[UpcomingRaisesBucketResponse]
+
+    class Config:
+        orm_mode = True
@@ -0,0 +1,134 @@
+import enum
+import json
+from datetime import date
+from functools import cache
+from operator import attrgetter
+from typing import Any, Callable
+
+from fastapi import Response, status
+from pydantic import BaseModel
+from pydantic.fields import SHAPE_LIST, SHAPE_SINGLETON, ModelField
+from pydantic.utils import lenient_issubclass
+
+from src.data_base.fields import FieldTree
+
+Serializer = Callable[[Any], Any]
+
+# Преобразования значений простых типов полей схем ответа в значения JSON
+SCALAR_CONVERTERS: dict[type, Serializer | None] = {
+    int: None,
+    str: None,
+    bool: None,
+    float: float,
+    date: date.isoformat,
+}
+
+
+def get_field_converter(
+    field: ModelField, fields: FieldTree | None = None
+) -> Serializer | None:
+    """Возвращает преобразование значения поля схемы в значение JSON.
+
+    `None` означает, что значение передается в JSON без изменений.
+
+    Аргументы:
+        field: ModelField - поле схемы ответа
+        fields: FieldTree - выбранные поля вложенного объекта
+    """
+    if lenient_issubclass(field.type_, BaseModel):
+        convert = get_serializer(field.type_, fields)
+    elif lenient_issubclass(field.type_, enum.Enum):
+        convert = attrgetter('value')
+    elif field.type_ in SCALAR_CONVERTERS:
+        convert = SCALAR_CONVERTERS[field.type_]
+    else:
+        raise TypeError('Тип поля `{}` не поддерживается'.format(field.name))
+    if field.shape == SHAPE_LIST:
+        if convert is None:
+            return list
+        return lambda values: [convert(value) for value in values]
+    if field.shape != SHAPE_SINGLETON:
+        raise TypeError('Тип поля `{}` не поддерживается'.format(field.name))
+    return convert
+
+
+@cache
+def get_serializer(
+    model: type[BaseModel], fields: FieldTree | None = None
+) -> Serializer:
+    """Возвращает функцию, преобразующую объект в словарь схемы `model`.
+
+    Функция читает атрибуты объекта (ORM-объекта, DTO) по полям схемы
+    и дает тот же результат, что `jsonable_encoder(model.from_orm(obj))`,
+    но без проверки и копирования данных pydantic. Объект должен
+    соответствовать схеме: типы значений не проверяются.
+    Если переданы `fields` - в словарь попадают только выбранные поля.
+
+    Аргументы:
+        model: type[BaseModel] - схема ответа
+        fields: FieldTree - выбранные поля ответа
+    """
+    selected = None if fields is None else dict(fields)
+    converters = [
+        (
+            field.alias,
+            field.name,
+            get_field_converter(field, selected and selected[field.name])
+        )
+        for field in model.__fields__.values()
+        if selected is None or field.name in selected
+    ]
+
+    def serialize(obj: Any) -> dict[str, Any]:
+        data = {}
+        for alias, name, convert in converters:
+            value = getattr(obj, name)
+            if convert is not None and value is not None:
+                value = convert(value)
+            data[alias] = value
+        return data
+
+    return serialize
+
+
+def dump_json(
+    model: type[BaseModel], obj: Any, fields: FieldTree | None = None
+) -> str:
+    """Возвращает JSON объекта по схеме `model` в формате ответов `FastAPI`.
+
+    Аргументы:
+        model: type[BaseModel] - схема ответа
+        obj: Any - объект для сериализации
+        fields: FieldTree - выбранные поля ответа
+    """
+    return json.dumps(
+        get_serializer(model, fields)(obj),
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(',', ':')
+    )
+
+
+def serialized_response(
+    model: type[BaseModel],
+    obj: Any,
+    status_code: int = status.HTTP_200_OK,
+    fields: FieldTree | None = None
+) -> Response:
+    """Возвращает ответ с объектом, сериализованным по схеме `model`.
+
+    Предназначен для объектов, полученных из БД по этой схеме: `FastAPI`
+    не проверяет возвращенный `Response` повторно, а схема ответа
+    в OpenAPI по-прежнему берется из аннотации обработчика.
+
+    Аргументы:
+        model: type[BaseModel] - схема ответа
+        obj: Any - объект для сериализации
+        status_code: int - код ответа
+        fields: FieldTree - выбранные поля ответа (по умолчанию - все)
+    """
+    return Response(
+        content=dump_json(model, obj, fields).encode(),
+        status_code=status_code,
+        media_type='application/json'
+    )
@@ -1,4 +1,6 @@
 from src.api.v1.routers.department import router as departments_router  # noqa
+from src.api.v1.routers.metrics import router as metrics_router  # noqa
 from src.api.v1.routers.position import router as positions_router  # noqa
+from src.api.v1.routers.report import router as reports_router  # noqa
 from src.api.v1.routers.salary import router as salaries_router  # noqa
 from src.api.v1.routers.user import router as users_router  # noqa
@@ -0,0 +1,38 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, status
+
+from src.api.v1.response_models.error import generate_error_responses
+from src.api.v1.response_models.metrics import MetricsResponse
+from src.core.services.metrics_service import MetricsService
+from src.core.services.permissions import is_administrator
+
+router = APIRouter(
+    prefix='/metrics',
+    tags=['Метрики'],
+    dependencies=(Depends(is_administrator),)
+)
+
+
+@router.get(
+    '/',
+    status_code=status.HTTP_200_OK,
+    summary='Получить метрики нагрузки процесса приложения',
+    response_description='Получены метрики нагрузки',
+    responses=generate_error_responses(
+        status.HTTP_403_FORBIDDEN,
+    )
+)
+async def get_metrics(
+    service: Annotated[MetricsService, Depends()]
+) -> MetricsResponse:
+    """
+    Возвращает метрики текущего процесса приложения.
+
+    - **login**: обработка входа - выполняемые запросы, глубина очереди
+    и количество отказов по переполнению очереди и лимитам частоты
+    - **password_hashing**: задачи хеширования паролей в пуле и отказы
+    - **token_cache**: попадания и промахи кэша проверенных токенов
+    - **principal_cache**: попадания и промахи кэша прав доступа
+    """
+    return service.get_metrics()
@@ -2,12 +2,27 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, Path, status
 
+from src.api.v1.request_models.bulk import LookupRequest
+from src.api.v1.request_models.conditional import ConditionalHeaders
+from src.api.v1.request_models.fields import get_fields_dependency
+from src.api.v1.request_models.pagination import PaginationQueryParams
 from src.api.v1.request_models.position import (PositionCreateRequest,
                                                 PositionUpdateRequest)
+from src.api.v1.response_models.bulk import LookupResponse
 from src.api.v1.response_models.error import generate_error_responses
+from src.api.v1.response_models.etag import (NOT_MODIFIED_RESPONSE,
+                                             conditional_response, make_etag,
+                                             not_modified_response)
+from src.api.v1.response_models.page import PageResponse, get_page_fields
 from src.api.v1.response_models.position import PositionResponse
+from src.api.v1.response_models.serializers import serialized_response
 from src.core.services.permissions import is_administrator_or_staff
 from src.core.services.position_service import PositionService
+from src.data_base.fields import FieldTree
+
+PositionFields = Annotated[
+    FieldTree | None, Depends(get_fields_dependency(PositionResponse))
+]
 
 router = APIRouter(
     prefix='/positions',
@@ -20,19 +35,49 @@ router = APIRouter(
     '/',
     status_code=status.HTTP_200_OK,
     summary='Получить список всех должностей',
-    response_description='Получен список всех должностей'
+    response_description='Получен список всех должностей',
+    responses=generate_error_responses(
+        status.HTTP_400_BAD_REQUEST,
+    ) | NOT_MODIFIED_RESPONSE
 )
 async def get_positions(
+    pagination: Annotated[PaginationQueryParams, Depends()],
+    conditional: Annotated[ConditionalHeaders, Depends()],
+    fields: PositionFields,
     service: Annotated[PositionService, Depends()]
-) -> list[PositionResponse]:
+) -> PageResponse[PositionResponse]:
     """
     Возвращает список всех должностей из базы данных.
 
+    Список выдается постранично. Query-параметр `limit` задает
+    количество записей на странице, `cursor` - значение `next_cursor`
+    предыдущей страницы. Если `next_cursor` равен `null` -
+    страница последняя.
+
+    Query-параметр `fields` оставляет в ответе только перечисленные
+    поля, вложенные - через точку (`id,title,employees.last_name`).
+    Из БД запрашиваются только эти поля и нужные для них связи.
+
+    Ответ содержит заголовок `ETag`. Если он передан в `If-None-Match`
+    и данные не изменились, возвращается `304` без тела: записи списка
+    не читаются, версия данных берется из кэша или читается одним
+    запросом. Параметры списка проверяются до сравнения ETag.
+
     - **id**: уникальный идентификатор записи в БД
     - **title**: название должности
     - **employees**: список работников с этой должностью
     """
-    return await service.get_all()
+    etag = make_etag(await service.get_version(cursor=pagination.cursor))
+    if conditional.matches(etag):
+        return not_modified_response(etag)
+    page = await service.get_all(
+        limit=pagination.limit, cursor=pagination.cursor, fields=fields
+    )
+    response = serialized_response(
+        PageResponse[PositionResponse], page, fields=get_page_fields(fields)
+    )
+    response.headers['ETag'] = etag
+    return response
 
 
 @router.post(
@@ -58,28 +103,70 @@ async def create_position(
     return await service.create_position(data=data)
 
 
+@router.post(
+    '/lookup/',
+    status_code=status.HTTP_200_OK,
+    summary='Получить данные должностей по списку id',
+    response_description='Получены данные должностей из БД',
+    responses=generate_error_responses(
+        status.HTTP_422_UNPROCESSABLE_ENTITY
+    )
+)
+async def get_positions_by_ids(
+    data: LookupRequest,
+    service: Annotated[PositionService, Depends()],
+) -> LookupResponse[PositionResponse]:
+    """
+    Возвращает должности из базы данных по списку `id` одним запросом.
+
+    Записи возвращаются в порядке `ids` запроса, повторяющиеся `id`
+    учитываются один раз, а ненайденные перечисляются в `missing_ids`.
+
+    - **id**: уникальный идентификатор записи в БД
+    - **title**: название должности
+    - **employees**: список работников с этой должностью
+    """
+    return serialized_response(
+        LookupResponse[PositionResponse],
+        await service.get_by_ids(ids=data.ids)
+    )
+
+
 @router.get(
     '/{obj_id}/',
     status_code=status.HTTP_200_OK,
     summary='Получить данные отдельной должности из БД',
     response_description='Получены данные должности из БД',
     responses=generate_error_responses(
+        status.HTTP_400_BAD_REQUEST,
         status.HTTP_404_NOT_FOUND,
         status.HTTP_422_UNPROCESSABLE_ENTITY
-    )
+    ) | NOT_MODIFIED_RESPONSE
 )
 async def get_position_by_id(
     obj_id: Annotated[int, Path(description='Значение поля id записи', gt=0)],
+    conditional: Annotated[ConditionalHeaders, Depends()],
+    fields: PositionFields,
     service: Annotated[PositionService, Depends()],
 ) -> PositionResponse:
     """
     Возвращает запись отдельной должности из базы данных по полю `id`.
 
+    Query-параметр `fields` ограничивает поля ответа, как в списке.
+
+    Ответ содержит заголовок `ETag`. Если он передан в `If-None-Match`
+    и запись не изменилась, возвращается `304` без тела.
+
     - **id**: уникальный идентификатор записи в БД
     - **title**: название должности
     - **employees**: список работников с этой должностью
     """
-    return await service.get_by_id(obj_id=obj_id)
+    response = serialized_response(
+        PositionResponse,
+        await service.get_by_id(obj_id=obj_id, fields=fields),
+        fields=fields
+    )
+    return conditional_response(response, conditional)
 
 
 @router.patch(
@@ -0,0 +1,103 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, status
+
+from src.api.v1.request_models.salary import RaiseDateQueryParams
+from src.api.v1.response_models.error import generate_error_responses
+from src.api.v1.response_models.report import (PayrollGroupResponse,
+                                               PayrollReportResponse,
+                                               PayrollStatusResponse)
+from src.core.services.payroll_service import PayrollService
+from src.core.services.permissions import is_administrator_or_staff
+
+router = APIRouter(
+    prefix='/reports',
+    tags=['Отчеты'],
+    dependencies=(Depends(is_administrator_or_staff),)
+)
+
+
+@router.get(
+    '/payroll/departments/',
+    status_code=status.HTTP_200_OK,
+    summary='Получить фонд оплаты труда по отделам',
+    response_description='Получены показатели фонда оплаты труда',
+    responses=generate_error_responses(
+        status.HTTP_400_BAD_REQUEST,
+    )
+)
+async def get_payroll_by_department(
+    params: Annotated[RaiseDateQueryParams, Depends()],
+    service: Annotated[PayrollService, Depends()],
+) -> PayrollReportResponse[PayrollGroupResponse]:
+    """
+    Возвращает численность и заработные платы работников по отделам.
+
+    Показатели считаются в базе данных, ответ содержит одну строку
+    на отдел. Работники без отдела попадают в строку с `id` равным `null`.
+    Query-параметры `date_after` и `date_before` отбирают работников
+    с датой `raise_date` заработной платы в указанном интервале,
+    если `date_after` больше `date_before` - возвращается ошибка `400`.
+
+    - **rows**: строки отчета - **id** и **title** отдела и показатели
+    - **headcount**: количество работников
+    - **total_amount**: сумма заработных плат
+    - **average_amount**: средняя заработная плата (`null`, если
+    заработных плат нет)
+    """
+    return await service.get_by_department(params=params)
+
+
+@router.get(
+    '/payroll/positions/',
+    status_code=status.HTTP_200_OK,
+    summary='Получить фонд оплаты труда по должностям',
+    response_description='Получены показатели фонда оплаты труда',
+    responses=generate_error_responses(
+        status.HTTP_400_BAD_REQUEST,
+    )
+)
+async def get_payroll_by_position(
+    params: Annotated[RaiseDateQueryParams, Depends()],
+    service: Annotated[PayrollService, Depends()],
+) -> PayrollReportResponse[PayrollGroupResponse]:
+    """
+    Возвращает численность и заработные платы работников по должностям.
+
+    Показатели считаются в базе данных, ответ содержит одну строку
+    на должность. Работники без должности попадают в строку с `id`
+    равным `null`. Фильтры по дате - как в отчете по отделам.
+
+    - **rows**: строки отчета - **id** и **title** должности и показатели
+    - **headcount**: количество работников
+    - **total_amount**: сумма заработных плат
+    - **average_amount**: средняя заработная плата
+    """
+    return await service.get_by_position(params=params)
+
+
+@router.get(
+    '/payroll/statuses/',
+    status_code=status.HTTP_200_OK,
+    summary='Получить фонд оплаты труда по статусам работников',
+    response_description='Получены показатели фонда оплаты труда',
+    responses=generate_error_responses(
+        status.HTTP_400_BAD_REQUEST,
+    )
+)
+async def get_payroll_by_status(
+    params: Annotated[RaiseDateQueryParams, Depends()],
+    service: Annotated[PayrollService, Depends()],
+) -> PayrollReportResponse[PayrollStatusResponse]:
+    """
+    Возвращает численность и заработные платы работников по статусам.
+
+    Показатели считаются в базе данных, ответ содержит одну строку
+    на статус. Фильтры по дате - как в отчете по отделам.
+
+    - **rows**: строки отчета - **status** работников и показатели
+    - **headcount**: количество работников
+    - **total_amount**: сумма заработных плат
+    - **average_amount**: средняя заработная плата
+    """
+    return await service.get_by_status(params=params)
@@ -3,12 +3,33 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, Path, status
 from pydantic import FutureDate
 
-from src.api.v1.request_models.salary import (SalaryCreateRequest,
-                                              SalaryUpdateRequest)
+from src.api.v1.request_models.bulk import LookupRequest
+from src.api.v1.request_models.conditional import ConditionalHeaders
+from src.api.v1.request_models.fields import get_fields_dependency
+from src.api.v1.request_models.pagination import (PaginationQueryParams,
+                                                  StreamQueryParams)
+from src.api.v1.request_models.salary import (SalaryAdjustRequest,
+                                              SalaryCreateRequest,
+                                              SalaryUpdateRequest,
+                                              UpcomingRaisesQueryParams)
+from src.api.v1.response_models.bulk import LookupResponse
 from src.api.v1.response_models.error import generate_error_responses
-from src.api.v1.response_models.salary import SalaryResponse
+from src.api.v1.response_models.etag import (NOT_MODIFIED_RESPONSE,
+                                             conditional_response, make_etag,
+                                             not_modified_response)
+from src.api.v1.response_models.page import (PageResponse, get_page_fields,
+                                             ndjson_response)
+from src.api.v1.response_models.salary import (SalaryAdjustResponse,
+                                               SalaryResponse,
+                                               UpcomingRaisesResponse)
+from src.api.v1.response_models.serializers import serialized_response
 from src.core.services.permissions import is_administrator_or_staff
 from src.core.services.salary_service import SalaryService
+from src.data_base.fields import FieldTree
+
+SalaryFields = Annotated[
+    FieldTree | None, Depends(get_fields_dependency(SalaryResponse))
+]
 
 router = APIRouter(
     prefix='/salaries',
@@ -21,16 +42,28 @@ router = APIRouter(
     '/',
     status_code=status.HTTP_200_OK,
     summary='Получить список всех заработных плат',
-    response_description='Получен список всех заработных плат'
+    response_description='Получен список всех заработных плат',
+    responses=generate_error_responses(
+        status.HTTP_400_BAD_REQUEST,
+    ) | NOT_MODIFIED_RESPONSE
 )
 async def get_salaries(
+    pagination: Annotated[PaginationQueryParams, Depends()],
+    stream: Annotated[StreamQueryParams, Depends()],
+    conditional: Annotated[ConditionalHeaders, Depends()],
+    fields: SalaryFields,
     service: Annotated[SalaryService, Depends()],
     date_after: FutureDate | None = None,
     date_before: FutureDate | None = None
-) -> list[SalaryResponse]:
+) -> PageResponse[SalaryResponse]:
     """
     Возвращает список всех заработных плат из базы данных.
 
+    Список выдается постранично. Query-параметр `limit` задает
+    количество записей на странице, `cursor` - значение `next_cursor`
+    предыдущей страницы. Если `next_cursor` равен `null` -
+    страница последняя.
+
     Query-параметры `date_before` и `date_after` позволяют
     фильтровать результаты запроса по датам.
     - **`date_after`** - выводит результаты с датой `raise_date` больше
@@ -39,16 +72,98 @@ async def get_salaries(
     или равной указанной.
     Порядок сортировки результатов определен
     по дате - от ближайшей даты к более поздней.
+    Для следующих страниц передаются те же `date_after` и `date_before`,
+    что и для первой. Если `date_after` больше `date_before` -
+    возвращается ошибка `400`.
+
+    С query-параметром `stream=true` или заголовком
+    `Accept: application/x-ndjson` весь список с учетом фильтров
+    выдается одним потоком `application/x-ndjson` - по записи в строке,
+    без пагинации.
+
+    Query-параметр `fields` оставляет в ответе только перечисленные
+    поля, вложенные - через точку (`id,amount,employee.last_name`).
+    Из БД запрашиваются только эти поля и нужные для них связи.
+
+    Ответ содержит заголовок `ETag`. Если он передан в `If-None-Match`
+    и данные не изменились, возвращается `304` без тела: записи списка
+    не читаются, версия данных берется из кэша или читается одним
+    запросом. Параметры списка проверяются до сравнения ETag.
 
     - **id**: уникальный идентификатор записи в БД
     - **amount**: размер заработной платы
     - **raise_date**: дата следующего повышения заработной платы
     - **employee**: работник с такой заработной платой
     """
-    return await service.get_all(
+    version = await service.get_version(
+        cursor=pagination.cursor,
         date_after=date_after,
         date_before=date_before
     )
+    etag = make_etag(version, stream.enabled)
+    if conditional.matches(etag):
+        return not_modified_response(etag)
+    if stream.enabled:
+        response = ndjson_response(
+            service.stream_all(
+                date_after=date_after, date_before=date_before, fields=fields
+            ),
+            SalaryResponse,
+            fields=fields
+        )
+    else:
+        page = await service.get_all(
+            limit=pagination.limit,
+            cursor=pagination.cursor,
+            date_after=date_after,
+            date_before=date_before,
+            fields=fields
+        )
+        response = serialized_response(
+            PageResponse[SalaryResponse], page, fields=get_page_fields(fields)
+        )
+    response.headers['ETag'] = etag
+    return response
+
+
+@router.get(
+    '/upcoming/',
+    status_code=status.HTTP_200_OK,
+    summary='Получить календарь предстоящих повышений заработных плат',
+    response_description='Получен календарь повышений заработных плат',
+    responses=generate_error_responses(
+        status.HTTP_422_UNPROCESSABLE_ENTITY
+    )
+)
+async def get_upcoming_raises(
+    params: Annotated[UpcomingRaisesQueryParams, Depends()],
+    service: Annotated[SalaryService, Depends()],
+) -> UpcomingRaisesResponse:
+    """
+    Возвращает повышения заработных плат работников на ближайшие дни.
+
+    Повышения с датой `raise_date` от сегодняшней до сегодняшней плюс
+    `days` дней группируются по периоду и отделу работника. Группы
+    отсортированы по началу периода, внутри периода - по `id` отдела.
+
+    - **days**: горизонт календаря в днях (по умолчанию `30`)
+    - **period**: период группировки - `week` (неделя с понедельника)
+    или `month`
+    - **counts_only**: если `true` - группы содержат только количество
+    и сумму, а `salaries` равно `null`
+
+    Поля группы:
+    - **period_start**: дата начала периода
+    - **department_id**, **department_title**: отдел работников
+    (`null` для работников без отдела)
+    - **count**: количество повышений
+    - **amount**: сумма текущих заработных плат
+    - **salaries**: заработные платы группы, отсортированные по дате
+    """
+    return serialized_response(
+        UpcomingRaisesResponse,
+        await service.get_upcoming_raises(params=params)
+    )
 
 
 @router.post(
@@ -75,29 +190,105 @@ async def create_salary(
     return await service.create_salary(data=data)
 
 
+@router.post(
+    '/lookup/',
+    status_code=status.HTTP_200_OK,
+    summary='Получить данные заработных плат по списку id',
+    response_description='Получены данные заработных плат из БД',
+    responses=generate_error_responses(
+        status.HTTP_422_UNPROCESSABLE_ENTITY
+    )
+)
+async def get_salaries_by_ids(
+    data: LookupRequest,
+    service: Annotated[SalaryService, Depends()],
+) -> LookupResponse[SalaryResponse]:
+    """
+    Возвращает заработные платы из базы данных по списку `id` одним запросом.
+
+    Записи возвращаются в порядке `ids` запроса, повторяющиеся `id`
+    учитываются один раз, а ненайденные перечисляются в `missing_ids`.
+
+    - **id**: уникальный идентификатор записи в БД
+    - **amount**: размер заработной платы
+    - **raise_date**: дата следующего повышения заработной платы
+    - **employee**: работник с такой заработной платой
+    """
+    return serialized_response(
+        LookupResponse[SalaryResponse], await service.get_by_ids(ids=data.ids)
+    )
+
+
+@router.post(
+    '/adjust/',
+    status_code=status.HTTP_200_OK,
+    summary='Изменить заработные платы группы работников',
+    response_description='Заработные платы изменены',
+    responses=generate_error_responses(
+        status.HTTP_400_BAD_REQUEST,
+        status.HTTP_422_UNPROCESSABLE_ENTITY
+    )
+)
+async def adjust_salaries(
+    data: SalaryAdjustRequest,
+    service: Annotated[SalaryService, Depends()],
+) -> SalaryAdjustResponse:
+    """
+    Изменяет заработные платы работников одним запросом к базе данных.
+
+    Заработные платы отбираются по отделу, должности и/или списку `id`
+    (условия объединяются через "и") и увеличиваются на процент или
+    фиксированную сумму. Возвращает количество измененных записей.
+    С `dry_run` изменения не выполняются, а в ответе возвращаются суммы
+    заработных плат до и после изменения.
+
+    - **department**: `id` отдела работников
+    - **position**: `id` должности работников
+    - **ids**: список `id` заработных плат
+    - **percent**: изменение в процентах (можно отрицательное)
+    - **delta**: изменение на фиксированную сумму (можно отрицательное)
+    - **raise_date**: новая дата следующего повышения заработной платы
+    - **dry_run**: только посчитать итоги изменения
+    """
+    return await service.adjust_salaries(data=data)
+
+
 @router.get(
     '/{obj_id}/',
     status_code=status.HTTP_200_OK,
     summary='Получить данные отдельной заработной платы из БД',
     response_description='Получены данные заработной платы из БД',
     responses=generate_error_responses(
+        status.HTTP_400_BAD_REQUEST,
         status.HTTP_404_NOT_FOUND,
         status.HTTP_422_UNPROCESSABLE_ENTITY
-    )
+    ) | NOT_MODIFIED_RESPONSE
 )
 async def get_salary_by_id(
     obj_id: Annotated[int, Path(description='Значение поля id записи', gt=0)],
+    conditional: Annotated[ConditionalHeaders, Depends()],
+    fields: SalaryFields,
     service: Annotated[SalaryService, Depends()],
 ) -> SalaryResponse:
     """
     Возвращает запись отдельной заработной платы из базы данных по полю `id`.
 
+    Query-параметр `fields` ограничивает поля ответа, как в списке.
+
+    Ответ содержит заголовок `ETag`. Если он передан в `If-None-Match`
+    и запись не изменилась, возвращается `304` без тела.
+
     - **id**: уникальный идентификатор записи в БД
     - **amount**: размер заработной платы
     - **raise_date**: дата следующего повышения заработной платы
     - **employee**: работник с такой заработной платой
     """
-    return await service.get_by_id(obj_id=obj_id)
+    response = serialized_response(
+        SalaryResponse,
+        await service.get_by_id(obj_id=obj_id, fields=fields),
+        fields=fields
+    )
+    return conditional_response(response, conditional)
 
 
 @router.patch(
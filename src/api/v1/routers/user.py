@@ -1,20 +1,42 @@
+from dataclasses import asdict
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Path, status
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from fastapi import APIRouter, Depends, Path, Request, status
 
+from src.api.v1.request_models.bulk import LookupRequest
+from src.api.v1.request_models.conditional import ConditionalHeaders
+from src.api.v1.request_models.fields import get_fields_dependency
+from src.api.v1.request_models.pagination import (PaginationQueryParams,
+                                                  StreamQueryParams)
 from src.api.v1.request_models.user import (UserAuthenticateRequest,
+                                            UserBulkChangeStatusRequest,
+                                            UserBulkCreateRequest,
+                                            UserBulkSelectRequest,
+                                            UserBulkTransferRequest,
                                             UserChangeStatusRequest,
                                             UserCreateRequest,
                                             UserResetPasswordRequest,
                                             UserSelfUpdateRequest,
                                             UserUpdateRequest)
+from src.api.v1.response_models.bulk import (BulkActionResponse, BulkResponse,
+                                             LookupResponse)
 from src.api.v1.response_models.error import generate_error_responses
+from src.api.v1.response_models.etag import (NOT_MODIFIED_RESPONSE,
+                                             conditional_response, make_etag,
+                                             not_modified_response)
+from src.api.v1.response_models.page import (PageResponse, get_page_fields,
+                                             ndjson_response)
+from src.api.v1.response_models.serializers import serialized_response
 from src.api.v1.response_models.user import (UserAndAccessTokenResponse,
                                              UserResponse, UserShortResponse)
-from src.core.services.permissions import (is_administrator,
+from src.core.services.permissions import (CurrentPrincipal, is_administrator,
                                            is_administrator_or_staff)
 from src.core.services.user_service import AuthenticationService, UserService
+from src.data_base.fields import FieldTree
+
+UserFields = Annotated[
+    FieldTree | None, Depends(get_fields_dependency(UserResponse))
+]
 
 router = APIRouter(
     prefix='/employees',
@@ -29,22 +51,31 @@ router = APIRouter(
     response_description='Аутентификация выполнена',
     responses=generate_error_responses(
         status.HTTP_400_BAD_REQUEST,
-        status.HTTP_403_FORBIDDEN
+        status.HTTP_403_FORBIDDEN,
+        status.HTTP_429_TOO_MANY_REQUESTS
     )
 )
 async def login(
+    request: Request,
     auth_data: UserAuthenticateRequest,
     auth_service: Annotated[AuthenticationService, Depends()]
 ) -> UserAndAccessTokenResponse:
     """Аутентифицировать работника по `username` и паролю.
 
     Вернуть access-токен и информацию о работнике.
+    При превышении частоты попыток входа возвращает ошибку `429`
+    с заголовком `Retry-After`.
     - **username**: логин/никнейм работника
     - **password**: пароль
     """
-    user_and_token = await auth_service.login_user(auth_data=auth_data)
-    user_and_token.user.access_token = user_and_token.access_token
-    return user_and_token.user
+    client_ip = request.client.host if request.client else None
+    user_and_token = await auth_service.login_user(
+        auth_data=auth_data, client_ip=client_ip
+    )
+    return UserAndAccessTokenResponse(
+        access_token=user_and_token.access_token,
+        **asdict(user_and_token.user)
+    )
 
 
 @router.get(
@@ -53,16 +84,39 @@ async def login(
     summary='Получить список всех работников',
     response_description='Получен список всех работников',
     responses=generate_error_responses(
+        status.HTTP_400_BAD_REQUEST,
         status.HTTP_403_FORBIDDEN,
-    ),
+    ) | NOT_MODIFIED_RESPONSE,
     dependencies=(Depends(is_administrator_or_staff),)
 )
 async def get_users(
+    pagination: Annotated[PaginationQueryParams, Depends()],
+    stream: Annotated[StreamQueryParams, Depends()],
+    conditional: Annotated[ConditionalHeaders, Depends()],
+    fields: UserFields,
     user_service: Annotated[UserService, Depends()]
-) -> list[UserResponse]:
+) -> PageResponse[UserResponse]:
     """
     Возвращает список всех работников из базы данных.
 
+    Список выдается постранично. Query-параметр `limit` задает
+    количество записей на странице, `cursor` - значение `next_cursor`
+    предыдущей страницы. Если `next_cursor` равен `null` -
+    страница последняя.
+
+    С query-параметром `stream=true` или заголовком
+    `Accept: application/x-ndjson` весь список выдается одним потоком
+    `application/x-ndjson` - по работнику в строке, без пагинации.
+
+    Query-параметр `fields` оставляет в ответе только перечисленные
+    поля, вложенные - через точку (`id,last_name,department.title`).
+    Из БД запрашиваются только эти поля и нужные для них связи.
+
+    Ответ содержит заголовок `ETag`. Если он передан в `If-None-Match`
+    и данные не изменились, возвращается `304` без тела: записи списка
+    не читаются, версия данных берется из кэша или читается одним
+    запросом. Параметры списка проверяются до сравнения ETag.
+
     - **id**: уникальный идентификатор записи в БД
     - **first_name**: имя работника
     - **last_name**: фамилия работника
@@ -74,7 +128,23 @@ async def get_users(
     - **position**: должность работника
     - **salary**: заработная плата работника
     """
-    return await user_service.get_all()
+    version = await user_service.get_version(cursor=pagination.cursor)
+    etag = make_etag(version, stream.enabled)
+    if conditional.matches(etag):
+        return not_modified_response(etag)
+    if stream.enabled:
+        response = ndjson_response(
+            user_service.stream_all(fields=fields), UserResponse, fields
+        )
+    else:
+        page = await user_service.get_all(
+            limit=pagination.limit, cursor=pagination.cursor, fields=fields
+        )
+        response = serialized_response(
+            PageResponse[UserResponse], page, fields=get_page_fields(fields)
+        )
+    response.headers['ETag'] = etag
+    return response
 
 
 @router.post(
@@ -104,6 +174,229 @@ async def create_user(
     return await user_service.create_user(data=data)
 
 
+@router.post(
+    '/lookup/',
+    status_code=status.HTTP_200_OK,
+    summary='Получить данные работников по списку id',
+    response_description='Получены данные работников из БД',
+    responses=generate_error_responses(
+        status.HTTP_403_FORBIDDEN,
+        status.HTTP_422_UNPROCESSABLE_ENTITY
+    ),
+    dependencies=(Depends(is_administrator_or_staff),)
+)
+async def get_users_by_ids(
+    data: LookupRequest,
+    user_service: Annotated[UserService, Depends()],
+) -> LookupResponse[UserResponse]:
+    """
+    Возвращает работников из базы данных по списку `id` одним запросом.
+
+    Записи возвращаются в порядке `ids` запроса, повторяющиеся `id`
+    учитываются один раз, а ненайденные перечисляются в `missing_ids`.
+
+    - **id**: уникальный идентификатор записи в БД
+    - **first_name**: имя работника
+    - **last_name**: фамилия работника
+    - **username**: логин/никнейм работника
+    - **date_of_birth**: день рождения работника
+    - **is_blocked**: блокировка работника
+    - **status**: статус работника
+    - **department**: отдел в котором работает работник
+    - **position**: должность работника
+    - **salary**: заработная плата работника
+    """
+    return serialized_response(
+        LookupResponse[UserResponse],
+        await user_service.get_by_ids(ids=data.ids)
+    )
+
+
+@router.post(
+    '/bulk/',
+    status_code=status.HTTP_201_CREATED,
+    summary='Создать записи с несколькими работниками в БД',
+    response_description='Созданы записи с работниками в БД',
+    responses=generate_error_responses(
+        status.HTTP_400_BAD_REQUEST,
+        status.HTTP_403_FORBIDDEN,
+        status.HTTP_422_UNPROCESSABLE_ENTITY,
+        status.HTTP_503_SERVICE_UNAVAILABLE
+    ),
+    dependencies=(Depends(is_administrator_or_staff),)
+)
+async def create_users(
+    data: UserBulkCreateRequest,
+    user_service: Annotated[UserService, Depends()]
+) -> BulkResponse[UserResponse]:
+    """
+    Создает записи новых работников в базе данных одной транзакцией.
+
+    Возвращает созданных работников (`items`) и ошибки (`errors`) с
+    индексом элемента запроса. В режиме `atomic` (по умолчанию) любая
+    ошибка отменяет запрос с кодом `400`, в режиме `partial` корректные
+    элементы создаются, а ошибочные возвращаются в `errors`.
+
+    - **items**: список работников, поля как при создании одного работника
+    - **mode**: режим обработки ошибок (`atomic` или `partial`)
+    """
+    return await user_service.create_users(data=data)
+
+
+@router.post(
+    '/bulk/block/',
+    status_code=status.HTTP_200_OK,
+    summary='Заблокировать группу работников',
+    response_description='Работники заблокированы',
+    responses=generate_error_responses(
+        status.HTTP_403_FORBIDDEN,
+        status.HTTP_422_UNPROCESSABLE_ENTITY
+    ),
+    dependencies=(Depends(is_administrator_or_staff),)
+)
+async def set_block_users(
+    data: UserBulkSelectRequest,
+    user_service: Annotated[UserService, Depends()]
+) -> BulkActionResponse:
+    """
+    Блокирует отобранных работников и отзывает их токены.
+
+    Работники отбираются по списку `id`, отделу и/или должности
+    (условия объединяются через "и"). Операция выполняется одним
+    запросом к базе данных, в ответе возвращаются количество и `id`
+    затронутых записей.
+
+    - **ids**: список `id` работников
+    - **department**: `id` отдела работников
+    - **position**: `id` должности работников
+    """
+    return await user_service.set_block_users(data=data)
+
+
+@router.post(
+    '/bulk/unblock/',
+    status_code=status.HTTP_200_OK,
+    summary='Разблокировать группу работников',
+    response_description='Работники разблокированы',
+    responses=generate_error_responses(
+        status.HTTP_403_FORBIDDEN,
+        status.HTTP_422_UNPROCESSABLE_ENTITY
+    ),
+    dependencies=(Depends(is_administrator_or_staff),)
+)
+async def unset_block_users(
+    data: UserBulkSelectRequest,
+    user_service: Annotated[UserService, Depends()]
+) -> BulkActionResponse:
+    """
+    Снимает блокировку с отобранных работников.
+
+    Работники отбираются по списку `id`, отделу и/или должности
+    (условия объединяются через "и"). Операция выполняется одним
+    запросом к базе данных, в ответе возвращаются количество и `id`
+    затронутых записей.
+
+    - **ids**: список `id` работников
+    - **department**: `id` отдела работников
+    - **position**: `id` должности работников
+    """
+    return await user_service.unset_block_users(data=data)
+
+
+@router.post(
+    '/bulk/status/',
+    status_code=status.HTTP_200_OK,
+    summary='Изменить статус группы работников',
+    response_description='Статус работников изменен',
+    responses=generate_error_responses(
+        status.HTTP_403_FORBIDDEN,
+        status.HTTP_422_UNPROCESSABLE_ENTITY
+    ),
+    dependencies=(Depends(is_administrator),)
+)
+async def change_users_status(
+    data: UserBulkChangeStatusRequest,
+    user_service: Annotated[UserService, Depends()]
+) -> BulkActionResponse:
+    """
+    Изменяет статус отобранных работников и отзывает их токены.
+
+    Работники отбираются по списку `id`, отделу и/или должности
+    (условия объединяются через "и"). Операция выполняется одним
+    запросом к базе данных, в ответе возвращаются количество и `id`
+    затронутых записей.
+
+    - **ids**: список `id` работников
+    - **department**: `id` отдела работников
+    - **position**: `id` должности работников
+    - **status**: новый статус работников
+    """
+    return await user_service.change_users_status(data=data)
+
+
+@router.post(
+    '/bulk/transfer/',
+    status_code=status.HTTP_200_OK,
+    summary='Перевести группу работников в другой отдел',
+    response_description='Работники переведены',
+    responses=generate_error_responses(
+        status.HTTP_404_NOT_FOUND,
+        status.HTTP_403_FORBIDDEN,
+        status.HTTP_422_UNPROCESSABLE_ENTITY
+    ),
+    dependencies=(Depends(is_administrator_or_staff),)
+)
+async def transfer_users(
+    data: UserBulkTransferRequest,
+    user_service: Annotated[UserService, Depends()]
+) -> BulkActionResponse:
+    """
+    Переводит отобранных работников в другой отдел.
+
+    Работники отбираются по списку `id`, отделу и/или должности
+    (условия объединяются через "и"). Операция выполняется одним
+    запросом к базе данных, в ответе возвращаются количество и `id`
+    затронутых записей.
+
+    - **ids**: список `id` работников
+    - **department**: `id` отдела работников
+    - **position**: `id` должности работников
+    - **new_department**: `id` нового отдела (`null` - без отдела),
+    поле обязательно: без него возвращается ошибка `422`
+    """
+    return await user_service.transfer_users(data=data)
+
+
+@router.post(
+    '/bulk/delete/',
+    status_code=status.HTTP_200_OK,
+    summary='Удалить группу работников',
+    response_description='Работники удалены',
+    responses=generate_error_responses(
+        status.HTTP_403_FORBIDDEN,
+        status.HTTP_422_UNPROCESSABLE_ENTITY
+    ),
+    dependencies=(Depends(is_administrator_or_staff),)
+)
+async def delete_users(
+    data: UserBulkSelectRequest,
+    user_service: Annotated[UserService, Depends()]
+) -> BulkActionResponse:
+    """
+    Удаляет записи отобранных работников из базы данных.
+
+    Работники отбираются по списку `id`, отделу и/или должности
+    (условия объединяются через "и"). Операция выполняется одним
+    запросом к базе данных, в ответе возвращаются количество и `id`
+    затронутых записей.
+
+    - **ids**: список `id` работников
+    - **department**: `id` отдела работников
+    - **position**: `id` должности работников
+    """
+    return await user_service.delete_users(data=data)
+
+
 @router.get(
     '/me/',
     status_code=status.HTTP_200_OK,
@@ -116,11 +409,11 @@ async def create_user(
     )
 )
 async def get_user_by_self(
-    token: Annotated[HTTPAuthorizationCredentials, Depends(HTTPBearer())],
+    principal: CurrentPrincipal,
     auth_service: Annotated[AuthenticationService, Depends()],
 ) -> UserResponse:
     """Возвращает пользователю запись c его данными из базы."""
-    return await auth_service.get_current_user(token=token)
+    return await auth_service.get_current_user(principal=principal)
 
 
 @router.patch(
@@ -137,9 +430,8 @@ async def get_user_by_self(
 )
 async def update_by_user_himself(
     data: UserSelfUpdateRequest,
-    token: Annotated[HTTPAuthorizationCredentials, Depends(HTTPBearer())],
-    user_service: Annotated[UserService, Depends()],
-    auth_service: Annotated[AuthenticationService, Depends()]
+    principal: CurrentPrincipal,
+    user_service: Annotated[UserService, Depends()]
 ) -> UserResponse:
     """
     Обновляет coбственную запись работника в базе данных.
@@ -150,8 +442,10 @@ async def update_by_user_himself(
     - **last_name**: фамилия работника
     - **date_of_birth**: день рождения работника
     """
-    user = await auth_service.get_current_user(token=token)
-    return await user_service.update_user_himself(data=data, user_obj=user)
+    AuthenticationService.check_principal_is_active(principal)
+    return await user_service.update_user_himself(
+        data=data, user_id=principal.id
+    )
 
 
 @router.get(
@@ -160,21 +454,34 @@ async def update_by_user_himself(
     summary='Получить данные отдельного работника из БД',
     response_description='Получены данные работника из БД',
     responses=generate_error_responses(
+        status.HTTP_400_BAD_REQUEST,
         status.HTTP_404_NOT_FOUND,
         status.HTTP_422_UNPROCESSABLE_ENTITY
-    ),
+    ) | NOT_MODIFIED_RESPONSE,
     dependencies=(Depends(is_administrator_or_staff),)
 )
 async def get_user_by_id(
     obj_id: Annotated[int, Path(description='Значение поля id записи', gt=0)],
+    conditional: Annotated[ConditionalHeaders, Depends()],
+    fields: UserFields,
     user_service: Annotated[UserService, Depends()]
 ) -> UserResponse:
     """
     Возвращает запись отдельного работника из базы данных по полю `id`.
 
+    Query-параметр `fields` ограничивает поля ответа, как в списке.
+
+    Ответ содержит заголовок `ETag`. Если он передан в `If-None-Match`
+    и запись не изменилась, возвращается `304` без тела.
+
     - **obj_id**: уникальный идентификатор записи в БД
     """
-    return await user_service.get_by_id(obj_id=obj_id)
+    response = serialized_response(
+        UserResponse,
+        await user_service.get_by_id(obj_id=obj_id, fields=fields),
+        fields=fields
+    )
+    return conditional_response(response, conditional)
 
 
 @router.patch(
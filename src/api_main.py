@@ -4,6 +4,8 @@ from .api import base_router
 from .core.exc.custom_exceptions import AppBaseError
 from .core.exc.exc_handlers import (application_error_handler,
                                     internal_exception_handler)
+from .core.services.password_hasher import (BULK_PASSWORD_HASHER,
+                                            PASSWORD_HASHER)
 from .core.settings import settings
 
 
@@ -38,6 +40,7 @@ def create_application() -> FastAPI:
     @app.on_event('shutdown')
     async def on_shutdown():
         """Дополнительные действия при остановке приложения."""
-        pass
+        PASSWORD_HASHER.shutdown()
+        BULK_PASSWORD_HASHER.shutdown()
 
     return app
@@ -0,0 +1,86 @@
+import time
+from collections import OrderedDict
+from typing import Any, Hashable
+
+
+class LRUCache:
+    """Ограниченный по размеру кэш с вытеснением давно не используемых записей.
+
+    Каждая запись может иметь собственный момент истечения (`expires_at`,
+    unix-время) - просроченные записи не возвращаются и удаляются при
+    обращении. Кэш живет в памяти процесса и рассчитан на использование
+    из одного event loop, поэтому не использует блокировки.
+
+    Счетчик `generation` увеличивается при каждой очистке кэша или
+    удалении записи: по нему значение, вычисленное до очистки или
+    удаления, можно не сохранять в кэш.
+
+    Аргументы:
+        max_size: int - максимальное количество записей
+        ttl: float - время жизни записи в секундах по умолчанию
+    """
+
+    def __init__(self, max_size: int, ttl: float | None = None) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits: int = 0
+        self.misses: int = 0
+        self.generation: int = 0
+        self.__data: OrderedDict[Hashable, tuple[Any, float | None]] = (
+            OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        return len(self.__data)
+
+    def get(self, key: Hashable) -> Any | None:
+        """Возвращает значение по ключу или `None`, если его нет в кэше."""
+        item = self.__data.get(key)
+        if item is not None:
+            value, expires_at = item
+            if expires_at is None or expires_at > time.time():
+                self.__data.move_to_end(key)
+                self.hits += 1
+                return value
+            del self.__data[key]
+        self.misses += 1
+        return None
+
+    def set(
+        self, key: Hashable, value: Any, expires_at: float | None = None
+    ) -> None:
+        """Сохраняет значение в кэш.
+
+        Аргументы:
+            key: Hashable - ключ записи
+            value: Any - значение записи
+            expires_at: float - момент истечения записи (unix-время),
+                по умолчанию вычисляется из `ttl` кэша
+        """
+        if expires_at is None and self.ttl is not None:
+            expires_at = time.time() + self.ttl
+        self.__data[key] = (value, expires_at)
+        self.__data.move_to_end(key)
+        while len(self.__data) > self.max_size:
+            self.__data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        """Удаляет запись из кэша и увеличивает `generation`."""
+        self.__data.pop(key, None)
+        self.generation += 1
+
+    def clear(self) -> None:
+        """Очищает кэш, сбрасывает счетчики и увеличивает `generation`."""
+        self.__data.clear()
+        self.hits = 0
+        self.misses = 0
+        self.generation += 1
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Возвращает счетчики попаданий, промахов и размер кэша."""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self.__data),
+        }
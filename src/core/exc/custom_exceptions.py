@@ -1,7 +1,9 @@
+from dataclasses import asdict
 from typing import TypeVar
 
 from fastapi import status
 
+from src.data_base.DTO_models import BulkItemErrorDTO
 from src.data_base.models import User
 
 ModelType = TypeVar('ModelType')
@@ -33,6 +35,23 @@ class UnauthorizedError(AppBaseError):
     detail = 'У Вас нет прав для просмотра запрошенной страницы.'
 
 
+class TooManyRequestsError(AppBaseError):
+    status_code: status = status.HTTP_429_TOO_MANY_REQUESTS
+    detail: str = 'Слишком много запросов, повторите попытку позже'
+
+    def __init__(self, retry_after: int) -> None:
+        self.headers = {'Retry-After': str(retry_after)}
+
+
+class ServiceUnavailableError(AppBaseError):
+    status_code: status = status.HTTP_503_SERVICE_UNAVAILABLE
+    detail: str = 'Сервис временно недоступен, повторите запрос позже'
+
+
+class TokenRevokedError(UnauthorizedError):
+    detail = 'Токен доступа отозван, выполните вход повторно.'
+
+
 class ObjectNotExistError(NotFoundError):
     def __init__(self, model: ModelType, obj_id: int) -> None:
         self.detail = 'Объект {} с id {} не найден'.format(
@@ -64,3 +83,33 @@ class UserUnknownStatusError(BadRequestError):
         self.detail = 'Неизвестный пользовательский статус {}'.format(
             status
         )
+
+
+class InvalidCursorError(BadRequestError):
+    detail: str = 'Некорректное значение курсора пагинации'
+
+
+class InvalidDateRangeError(BadRequestError):
+    detail: str = 'Значение `date_after` не может быть больше `date_before`'
+
+
+class ServiceOverloadedError(ServiceUnavailableError):
+    detail: str = 'Очередь обработки паролей переполнена, повторите позже'
+
+
+class BulkOperationError(BadRequestError):
+    def __init__(self, errors: list[BulkItemErrorDTO]) -> None:
+        self.detail = [asdict(error) for error in errors]
+
+
+class SalaryAdjustmentError(BadRequestError):
+    detail: str = (
+        'Размер заработной платы после изменения должен быть больше нуля'
+    )
+
+
+class InvalidFieldsError(BadRequestError):
+    def __init__(self, fields: list[str]) -> None:
+        self.detail = 'Запрошены несуществующие поля: {}'.format(
+            ', '.join(fields)
+        )
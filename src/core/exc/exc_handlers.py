@@ -18,9 +18,12 @@ async def application_error_handler(
     """Хэндлер для кастомных ошибок приложения."""
     status_code = getattr(exc, 'status_code', None)
     error_message = getattr(exc, 'detail', None)
+    headers = getattr(exc, 'headers', None)
 
     if status_code and error_message:
         return JSONResponse(
-            status_code=status_code, content={'detail': error_message}
+            status_code=status_code,
+            content={'detail': error_message},
+            headers=headers
         )
     return await internal_exception_handler(request, exc)
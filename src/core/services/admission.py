@@ -0,0 +1,146 @@
+import asyncio
+import math
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Hashable
+
+from src.core.cache import LRUCache
+from src.core.exc import custom_exceptions
+from src.core.settings import settings
+
+
+class TokenBucket:
+    """Корзина токенов: допускает всплеск до `capacity` запросов.
+
+    Аргументы:
+        capacity: int - максимальное количество токенов в корзине
+        per_minute: int - скорость пополнения корзины (токенов в минуту)
+    """
+
+    __slots__ = ('capacity', 'rate', 'tokens', 'updated_at')
+
+    def __init__(self, capacity: int, per_minute: int) -> None:
+        self.capacity = capacity
+        self.rate = per_minute / 60
+        self.tokens: float = capacity
+        self.updated_at: float = time.monotonic()
+
+    def consume(self) -> float:
+        """Забирает токен из корзины.
+
+        Возвращает `0`, если токен получен, иначе - количество секунд
+        до появления следующего токена.
+        """
+        now = time.monotonic()
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self.updated_at) * self.rate
+        )
+        self.updated_at = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0
+        return (1 - self.tokens) / self.rate
+
+
+class RateLimiter:
+    """Ограничивает частоту запросов по ключу корзинами токенов.
+
+    Количество отслеживаемых ключей ограничено: давно не встречавшиеся
+    ключи вытесняются, их корзины считаются полными.
+
+    Аргументы:
+        capacity: int - размер всплеска запросов для одного ключа
+        per_minute: int - допустимая частота запросов в минуту
+        max_keys: int - максимальное количество отслеживаемых ключей
+    """
+
+    def __init__(self, capacity: int, per_minute: int, max_keys: int) -> None:
+        self.capacity = capacity
+        self.per_minute = per_minute
+        self.rejected: int = 0
+        self.__buckets = LRUCache(max_size=max_keys)
+
+    def check(self, key: Hashable) -> None:
+        """Учитывает запрос по ключу.
+
+        Бросает ошибку `429`, если лимит для ключа исчерпан.
+
+        Аргументы:
+            key: Hashable - ключ ограничения (логин, IP-адрес клиента)
+        """
+        bucket = self.__buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(self.capacity, self.per_minute)
+            self.__buckets.set(key, bucket)
+        retry_after = bucket.consume()
+        if retry_after:
+            self.rejected += 1
+            raise custom_exceptions.TooManyRequestsError(
+                retry_after=math.ceil(retry_after)
+            )
+
+    def clear(self) -> None:
+        """Сбрасывает состояние всех корзин и счетчик отказов."""
+        self.__buckets.clear()
+        self.rejected = 0
+
+
+class ConcurrencyLimiter:
+    """Ограничивает количество одновременно выполняемых операций.
+
+    Операции сверх `max_concurrency` ждут в очереди длиной `queue_size`,
+    при переполнении очереди запрос сразу отклоняется с ошибкой `429`.
+
+    Аргументы:
+        max_concurrency: int - количество одновременно выполняемых операций
+        queue_size: int - количество операций, ожидающих выполнения
+        retry_after: int - рекомендуемая пауза перед повтором (в секундах)
+    """
+
+    def __init__(
+        self, max_concurrency: int, queue_size: int, retry_after: int
+    ) -> None:
+        self.max_concurrency = max_concurrency
+        self.queue_size = queue_size
+        self.retry_after = retry_after
+        self.active: int = 0
+        self.waiting: int = 0
+        self.rejected: int = 0
+        self.__semaphore = asyncio.Semaphore(max_concurrency)
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[None]:
+        """Занимает слот выполнения на время блока `async with`."""
+        if self.__semaphore.locked() and self.waiting >= self.queue_size:
+            self.rejected += 1
+            raise custom_exceptions.TooManyRequestsError(
+                retry_after=self.retry_after
+            )
+        self.waiting += 1
+        try:
+            await self.__semaphore.acquire()
+        finally:
+            self.waiting -= 1
+        self.active += 1
+        try:
+            yield
+        finally:
+            self.active -= 1
+            self.__semaphore.release()
+
+
+LOGIN_LIMITER: ConcurrencyLimiter = ConcurrencyLimiter(
+    max_concurrency=settings.LOGIN_MAX_CONCURRENCY,
+    queue_size=settings.LOGIN_QUEUE_SIZE,
+    retry_after=settings.LOGIN_RETRY_AFTER
+)
+LOGIN_USERNAME_RATE_LIMITER: RateLimiter = RateLimiter(
+    capacity=settings.LOGIN_USERNAME_BURST,
+    per_minute=settings.LOGIN_USERNAME_PER_MINUTE,
+    max_keys=settings.RATE_LIMIT_MAX_KEYS
+)
+LOGIN_IP_RATE_LIMITER: RateLimiter = RateLimiter(
+    capacity=settings.LOGIN_IP_BURST,
+    per_minute=settings.LOGIN_IP_PER_MINUTE,
+    max_keys=settings.RATE_LIMIT_MAX_KEYS
+)
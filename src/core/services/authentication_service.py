@@ -1,23 +1,32 @@
+import hashlib
 from datetime import datetime, timedelta
 from typing import Annotated
 
 from fastapi import Depends
-from fastapi.security import HTTPAuthorizationCredentials
 from jose import JWTError, jwt
-from passlib.context import CryptContext
 
 from src.api.v1.request_models.user import UserAuthenticateRequest
-from src.api.v1.response_models.user import UserResponse
+from src.core.cache import LRUCache
 from src.core.exc import custom_exceptions
+from src.core.services.admission import (LOGIN_IP_RATE_LIMITER, LOGIN_LIMITER,
+                                         LOGIN_USERNAME_RATE_LIMITER)
+from src.core.services.password_hasher import (BULK_PASSWORD_HASHER,
+                                               PASSWORD_CONTEXT,
+                                               PASSWORD_HASHER)
 from src.core.settings import settings
 from src.data_base.crud import UserCRUD
-from src.data_base.DTO_models import UserAndTokenDTO
+from src.data_base.DTO_models import (CredentialsDTO, PrincipalDTO,
+                                      UserAndTokenDTO)
 from src.data_base.models import User
 
 ALGORITHM: str = 'HS256'
 ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 7
-PASSWORD_CONTEXT: CryptContext = CryptContext(
-    schemes=['bcrypt'], deprecated='auto'
+# Кэш полезной нагрузки проверенных токенов по их sha256-дайджесту
+TOKEN_CACHE: LRUCache = LRUCache(max_size=settings.TOKEN_CACHE_MAX_SIZE)
+# Кэш данных для проверки прав доступа по `username` пользователя
+PRINCIPAL_CACHE: LRUCache = LRUCache(
+    max_size=settings.PRINCIPAL_CACHE_MAX_SIZE,
+    ttl=settings.PRINCIPAL_CACHE_TTL
 )
 
 
@@ -30,125 +39,244 @@ class AuthenticationService:
 
     @staticmethod
     def get_password_hash(password: str) -> str:
-        """Хеширует пароль."""
+        """Хеширует пароль синхронно (для скриптов вне event loop)."""
         return PASSWORD_CONTEXT.hash(password)
 
     @staticmethod
-    def get_username_from_token(token: str) -> str:
-        """Декодирует JWT-токен и возвращает `username`.
+    async def hash_password(password: str) -> str:
+        """Хеширует пароль в пуле исполнителей, не блокируя event loop."""
+        return await PASSWORD_HASHER.hash(password)
+
+    @staticmethod
+    async def hash_passwords(passwords: list[str]) -> list[str]:
+        """Хеширует пароли параллельно в пуле массовых операций.
+
+        Пул отделен от пула проверки паролей, поэтому массовое создание
+        работников не задерживает и не отклоняет вход в систему.
+        """
+        return await BULK_PASSWORD_HASHER.hash_many(passwords)
+
+    @staticmethod
+    def decode_token(token: str) -> dict:
+        """Проверяет подпись JWT-токена и возвращает его полезную нагрузку.
+
+        Результат проверки кэшируется до истечения срока действия токена
+        (`exp`), поэтому повторные запросы с тем же токеном не требуют
+        повторного `jwt.decode`.
 
         Аргументы:
             token: str - JWT-токен
         """
+        digest = hashlib.sha256(token.encode()).digest()
+        payload = TOKEN_CACHE.get(digest)
+        if payload is not None:
+            return payload
         try:
             payload = jwt.decode(
                 token, settings.SECRET_KEY, algorithms=[ALGORITHM]
             )
         except JWTError:
             raise custom_exceptions.UnauthorizedError
+        TOKEN_CACHE.set(digest, payload, expires_at=payload.get('exp'))
+        return payload
+
+    @staticmethod
+    def get_username_from_token(token: str) -> str:
+        """Декодирует JWT-токен и возвращает `username`.
+
+        Аргументы:
+            token: str - JWT-токен
+        """
+        payload = AuthenticationService.decode_token(token)
         username = payload.get('username')
         if not username:
             raise custom_exceptions.UnauthorizedError
         return username
 
-    def __verify_password(
+    @staticmethod
+    def invalidate_principal(username: str) -> None:
+        """Удаляет пользователя из кэша прав доступа.
+
+        Вызывается при любом изменении статуса, блокировки или при удалении
+        пользователя, чтобы изменение прав вступало в силу немедленно.
+
+        Аргументы:
+            username: str - никнейм/логин пользователя
+        """
+        PRINCIPAL_CACHE.delete(username)
+
+    async def get_principal(self, username: str) -> PrincipalDTO | None:
+        """Возвращает данные пользователя для проверки прав доступа.
+
+        Данные берутся из кэша, при промахе - из БД. Если за время
+        чтения из БД кэш был сброшен (`invalidate_principal`), прочитанные
+        данные могут быть устаревшими и в кэш не сохраняются.
+
+        Аргументы:
+            username: str - никнейм/логин пользователя
+        """
+        principal = PRINCIPAL_CACHE.get(username)
+        if principal is None:
+            generation = PRINCIPAL_CACHE.generation
+            principal = await self.__crud.get_principal(username)
+            if (
+                principal is not None
+                and generation == PRINCIPAL_CACHE.generation
+            ):
+                PRINCIPAL_CACHE.set(username, principal)
+        return principal
+
+    async def __verify_password(
         self, plain_password: str, hashed_password: str
     ) -> bool:
         """Проверяет правильность введенного пароля сравнением с хешированным.
 
+        Проверка выполняется в пуле исполнителей, не блокируя event loop.
+
         Аргументы:
             plain_password: str - введенный пароль
             hashed_password: str - хешированный пароль
         """
-        return PASSWORD_CONTEXT.verify(plain_password, hashed_password)
+        return await PASSWORD_HASHER.verify(plain_password, hashed_password)
 
     async def __authenticate_user(
         self, auth_data: UserAuthenticateRequest
-    ) -> UserResponse:
+    ) -> CredentialsDTO:
         """Аутентифицирует пользователя по `username` и `password` полям.
 
+        Из БД читаются только поля для проверки прав доступа и хеш
+        пароля, без связанных моделей.
+
         Аргументы:
             auth_data: UserAuthenticateRequest - схема для аутентификации
         """
-        user = await self.__crud.get_by_username(username=auth_data.username)
+        user = await self.__crud.get_credentials(username=auth_data.username)
         if user.is_blocked:
             raise custom_exceptions.UserBlockedError
         password = auth_data.password.get_secret_value()
-        if not self.__verify_password(password, user.password):
-            return custom_exceptions.InvalidAuthenticationDataError
+        if not await self.__verify_password(password, user.password):
+            raise custom_exceptions.InvalidAuthenticationDataError
         return user
 
     def __create_token(
-        self, username: str, expires_delta: timedelta | None = None
+        self, user: PrincipalDTO, expires_delta: timedelta | None = None
     ) -> str:
         """Создает access-токен.
 
+        Помимо `username` токен содержит `id` (`sub`), статус и версию
+        токенов пользователя: по ним права проверяются без запроса к БД,
+        пока версия токена совпадает с актуальной.
+
         Аргументы:
-            username: str - никнейм/логин пользователя
+            user: PrincipalDTO - данные пользователя
             expires_delta: int - время жизни токена
         """
         if expires_delta:
             expire = datetime.utcnow() + timedelta(minutes=expires_delta)
         else:
             expire = datetime.utcnow() + timedelta(minutes=15)
-        to_encode = {'username': username, 'exp': expire}
+        to_encode = {
+            'username': user.username,
+            'sub': str(user.id),
+            'status': user.status.value,
+            'token_version': user.token_version,
+            'exp': expire
+        }
         return jwt.encode(
             to_encode, settings.SECRET_KEY, algorithm=ALGORITHM
         )
 
+    async def get_token_principal(self, token: str) -> PrincipalDTO:
+        """Возвращает данные пользователя по токену, проверяя его версию.
+
+        Если `id` (`sub`) или статус в токене не совпадают с данными
+        пользователя, либо версия токена отличается от актуальной -
+        токен считается отозванным. Сверка `id` не дает токену удаленного
+        пользователя подойти новому пользователю с тем же `username`.
+
+        Аргументы:
+            token: str - JWT-токен
+        """
+        payload = self.decode_token(token)
+        username = payload.get('username')
+        if not username:
+            raise custom_exceptions.UnauthorizedError
+        principal = await self.get_principal(username)
+        if not principal:
+            raise custom_exceptions.ForbiddenError
+        if (
+            payload.get('sub') != str(principal.id)
+            or payload.get('status') != principal.status.value
+            or payload.get('token_version') != principal.token_version
+        ):
+            raise custom_exceptions.TokenRevokedError
+        return principal
+
     async def login_user(
-        self, auth_data: UserAuthenticateRequest
+        self, auth_data: UserAuthenticateRequest, client_ip: str | None = None
     ) -> UserAndTokenDTO:
         """Аутентифицирует пользователя по `username` и `password` полям.
 
         Возвращает информацию об администраторе и `access`- токен.
+        Попытки входа ограничены по частоте для логина и IP-адреса клиента,
+        а количество одновременных проверок пароля - ограничителем
+        с очередью. При превышении лимитов бросает ошибку `429`.
+        Отдел, должность и заработная плата для ответа читаются только
+        после успешной проверки пароля.
 
         Аргументы:
             auth_data: UserAuthenticateRequest - схема для аутентификации
+            client_ip: str - IP-адрес клиента
         """
-        user = await self.__authenticate_user(auth_data=auth_data)
+        if client_ip:
+            LOGIN_IP_RATE_LIMITER.check(client_ip)
+        LOGIN_USERNAME_RATE_LIMITER.check(auth_data.username)
+        async with LOGIN_LIMITER.acquire():
+            user = await self.__authenticate_user(auth_data=auth_data)
         return UserAndTokenDTO(
             access_token=self.__create_token(
-                username=auth_data.username,
+                user=user,
                 expires_delta=ACCESS_TOKEN_EXPIRE_MINUTES
             ),
-            user=user
+            user=await self.__crud.get_read_or_404(obj_id=user.id)
         )
 
-    async def get_current_user(
-        self, token: HTTPAuthorizationCredentials
-    ) -> UserResponse:
-        """Возвращает текущего пользователя по токену.
+    async def get_current_user(self, principal: PrincipalDTO) -> User:
+        """Возвращает текущего пользователя со связанными объектами.
 
         Аргументы:
-            token: HTTPAuthorizationCredentials - схема авторизации
+            principal: PrincipalDTO - данные пользователя из токена
         """
-        username = self.get_username_from_token(token=token.credentials)
-        user = await self.__crud.get_by_username(username=username)
-        if user.is_blocked:
+        self.check_principal_is_active(principal)
+        return await self.__crud.get_or_404(obj_id=principal.id)
+
+    @staticmethod
+    def check_principal_is_active(principal: PrincipalDTO) -> None:
+        """Проверяет, что пользователь не заблокирован.
+
+        Аргументы:
+            principal: PrincipalDTO - данные пользователя из токена
+        """
+        if principal.is_blocked:
             raise custom_exceptions.UserBlockedError
-        return user
 
-    async def check_current_user_exists(
-        self,
-        token: HTTPAuthorizationCredentials,
+    @staticmethod
+    def check_principal_status(
+        principal: PrincipalDTO,
         statuses: list[User.Status] | None = None
     ) -> None:
-        """Производит авторизацию пользователя по токену.
+        """Проверяет наличие у пользователя статуса из списка.
 
-        Выбрасывает исключение если пользователь не обнаружен.
-        Если определен аргумент `statuses` - пользователь дополнительно
-        проверяется на наличие статуса из списка.
+        Если аргумент `statuses` не определен - доступ разрешен любому
+        аутентифицированному пользователю.
 
         Аргументы:
-            token: HTTPAuthorizationCredentials - схема авторизации
+            principal: PrincipalDTO - данные пользователя из токена
             statuses: list[User.Status] - список статусов пользователя
         """
-        username = self.get_username_from_token(token=token.credentials)
         if statuses:
             for status in statuses:
                 if status not in User.Status.__members__.values():
                     raise custom_exceptions.UserUnknownStatusError(status)
-        user_exists = await self.__crud.is_user_exists(username, statuses)
-        if not user_exists:
+        if statuses and principal.status not in statuses:
             raise custom_exceptions.ForbiddenError
@@ -1,10 +1,12 @@
-from typing import Annotated
+from typing import Annotated, Any
 
 from fastapi import Depends
 
 from src.api.v1.request_models.department import (DepartmentCreateRequest,
                                                   DepartmentUpdateRequest)
 from src.data_base.crud import DepartmentCRUD
+from src.data_base.DTO_models import LookupDTO, PageDTO
+from src.data_base.fields import FieldTree
 from src.data_base.models import Department
 
 
@@ -14,9 +16,34 @@ class DepartmentService:
     ) -> None:
         self.__crud = department_crud
 
-    async def get_all(self) -> list[Department]:
-        """Возвращает список всех департаментов из БД."""
-        return await self.__crud.get_all()
+    async def get_version(self, cursor: str | None = None) -> tuple[Any, ...]:
+        """Возвращает версию данных списка департаментов для ETag.
+
+        Курсор проверяется до чтения версии, поэтому на некорректный
+        запрос возвращается ошибка `400`, а не `304`.
+
+        Аргументы:
+            cursor: str - курсор, полученный на предыдущей странице.
+        """
+        self.__crud.check_cursor(cursor)
+        return await self.__crud.get_version()
+
+    async def get_all(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        fields: FieldTree | None = None
+    ) -> PageDTO:
+        """Возвращает страницу списка департаментов из БД.
+
+        Аргументы:
+            limit: int - количество записей на странице,
+            cursor: str - курсор, полученный на предыдущей странице,
+            fields: FieldTree - выбранные поля ответа.
+        """
+        return await self.__crud.get_all(
+            limit=limit, cursor=cursor, fields=fields
+        )
 
     async def create_department(
         self, data: DepartmentCreateRequest
@@ -26,18 +53,26 @@ class DepartmentService:
         Аргументы:
             data: DepartmentCreateRequest - данные для создания объекта.
         """
-        department = Department(**data.dict())
-        return await self.__crud.create(department)
+        return await self.__crud.create(data.dict())
+
+    async def get_by_ids(self, ids: list[int]) -> LookupDTO:
+        """Возвращает записи департаментов из БД по списку `id`.
+
+        Аргументы:
+            ids: list[int] - значения поля `id` записей в БД.
+        """
+        return await self.__crud.get_many(ids)
 
     async def get_by_id(
-        self, obj_id: int
+        self, obj_id: int, fields: FieldTree | None = None
     ) -> Department:
         """Возвращает отдельный департамент из БД.
 
         Аргументы:
-            obj_id: int - значение поля `id` записи в БД.
+            obj_id: int - значение поля `id` записи в БД,
+            fields: FieldTree - выбранные поля ответа.
         """
-        return await self.__crud.get_or_404(obj_id=obj_id)
+        return await self.__crud.get_or_404(obj_id=obj_id, fields=fields)
 
     async def update_department(
         self, obj_id: int, data: DepartmentUpdateRequest
@@ -57,4 +92,4 @@ class DepartmentService:
         Аргументы:
             obj_id: int - значение поля `id` записи в БД.
         """
-        return await self.__crud.delete(obj_id)
+        await self.__crud.delete(obj_id)
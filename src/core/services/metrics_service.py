@@ -0,0 +1,30 @@
+from src.core.services.admission import (LOGIN_IP_RATE_LIMITER, LOGIN_LIMITER,
+                                         LOGIN_USERNAME_RATE_LIMITER)
+from src.core.services.authentication_service import (PRINCIPAL_CACHE,
+                                                      TOKEN_CACHE)
+from src.core.services.password_hasher import (BULK_PASSWORD_HASHER,
+                                               PASSWORD_HASHER)
+
+
+class MetricsService:
+    def get_metrics(self) -> dict:
+        """Возвращает метрики ограничителей нагрузки и кэшей процесса."""
+        return {
+            'login': {
+                'active': LOGIN_LIMITER.active,
+                'queue_depth': LOGIN_LIMITER.waiting,
+                'rejected_queue_full': LOGIN_LIMITER.rejected,
+                'rejected_username_rate': LOGIN_USERNAME_RATE_LIMITER.rejected,
+                'rejected_ip_rate': LOGIN_IP_RATE_LIMITER.rejected,
+            },
+            'password_hashing': {
+                'pending': PASSWORD_HASHER.pending,
+                'rejected': PASSWORD_HASHER.rejected,
+            },
+            'bulk_password_hashing': {
+                'pending': BULK_PASSWORD_HASHER.pending,
+                'rejected': BULK_PASSWORD_HASHER.rejected,
+            },
+            'token_cache': TOKEN_CACHE.stats,
+            'principal_cache': PRINCIPAL_CACHE.stats,
+        }
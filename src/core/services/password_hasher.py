@@ -0,0 +1,139 @@
+import asyncio
+from concurrent.futures import (Executor, ProcessPoolExecutor,
+                                ThreadPoolExecutor)
+from functools import partial
+from typing import Callable, TypeVar
+
+from passlib.context import CryptContext
+
+from src.core.exc import custom_exceptions
+from src.core.settings import settings
+
+ResultType = TypeVar('ResultType')
+
+PASSWORD_CONTEXT: CryptContext = CryptContext(
+    schemes=['bcrypt'], deprecated='auto'
+)
+EXECUTORS: dict[str, type[Executor]] = {
+    'thread': ThreadPoolExecutor,
+    'process': ProcessPoolExecutor,
+}
+
+
+def hash_password(password: str) -> str:
+    """Хеширует пароль (выполняется в пуле исполнителей)."""
+    return PASSWORD_CONTEXT.hash(password)
+
+
+def hash_passwords(passwords: list[str]) -> list[str]:
+    """Хеширует пачку паролей (выполняется в пуле исполнителей)."""
+    return [PASSWORD_CONTEXT.hash(password) for password in passwords]
+
+
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """Сверяет пароль с хешем (выполняется в пуле исполнителей)."""
+    return PASSWORD_CONTEXT.verify(plain_password, hashed_password)
+
+
+class PasswordHasher:
+    """Выполняет хеширование и проверку паролей вне event loop.
+
+    `bcrypt` намеренно медленный, поэтому вызовы передаются в пул потоков
+    или процессов. Количество одновременно ожидающих задач ограничено:
+    при переполнении очереди запрос отклоняется, а не копится в памяти.
+
+    Аргументы:
+        executor_type: str - тип пула (`thread` или `process`)
+        max_workers: int - количество исполнителей в пуле
+        queue_size: int - количество задач, ожидающих свободного исполнителя
+    """
+
+    def __init__(
+        self, executor_type: str, max_workers: int, queue_size: int
+    ) -> None:
+        self.executor_type = executor_type
+        self.max_workers = max_workers
+        self.max_pending = max_workers + queue_size
+        self.pending: int = 0
+        self.rejected: int = 0
+        self.__executor: Executor | None = None
+
+    def __get_executor(self) -> Executor:
+        if self.__executor is None:
+            self.__executor = EXECUTORS[self.executor_type](
+                max_workers=self.max_workers
+            )
+        return self.__executor
+
+    async def _run(
+        self, func: Callable[..., ResultType], *args
+    ) -> ResultType:
+        """Выполняет функцию в пуле с учетом ограничения очереди."""
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            raise custom_exceptions.ServiceOverloadedError
+        self.pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                self.__get_executor(), partial(func, *args)
+            )
+        finally:
+            self.pending -= 1
+
+    async def hash(self, password: str) -> str:
+        """Хеширует пароль.
+
+        Аргументы:
+            password: str - пароль в открытом виде
+        """
+        return await self._run(hash_password, password)
+
+    async def hash_many(self, passwords: list[str]) -> list[str]:
+        """Хеширует пароли параллельно на всех исполнителях пула.
+
+        Пароли делятся на пачки по числу исполнителей, поэтому запрос
+        занимает в очереди не больше `max_workers` мест.
+
+        Аргументы:
+            passwords: list[str] - пароли в открытом виде
+        """
+        chunks = [
+            passwords[start::self.max_workers]
+            for start in range(min(self.max_workers, len(passwords)))
+        ]
+        hashed_chunks = await asyncio.gather(*(
+            self._run(hash_passwords, chunk) for chunk in chunks
+        ))
+        hashed: list[str] = [''] * len(passwords)
+        for start, hashed_chunk in enumerate(hashed_chunks):
+            hashed[start::self.max_workers] = hashed_chunk
+        return hashed
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """Проверяет правильность пароля сравнением с хешированным.
+
+        Аргументы:
+            plain_password: str - введенный пароль
+            hashed_password: str - хешированный пароль
+        """
+        return await self._run(
+            verify_password, plain_password, hashed_password
+        )
+
+    def shutdown(self) -> None:
+        """Останавливает пул исполнителей."""
+        if self.__executor is not None:
+            self.__executor.shutdown(wait=False, cancel_futures=True)
+            self.__executor = None
+
+
+PASSWORD_HASHER: PasswordHasher = PasswordHasher(
+    executor_type=settings.PASSWORD_HASHING_EXECUTOR,
+    max_workers=settings.PASSWORD_HASHING_WORKERS,
+    queue_size=settings.PASSWORD_HASHING_QUEUE_SIZE
+)
+BULK_PASSWORD_HASHER: PasswordHasher = PasswordHasher(
+    executor_type=settings.PASSWORD_HASHING_EXECUTOR,
+    max_workers=settings.BULK_PASSWORD_HASHING_WORKERS,
+    queue_size=settings.BULK_PASSWORD_HASHING_QUEUE_SIZE
+)
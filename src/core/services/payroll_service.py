@@ -0,0 +1,79 @@
+from decimal import Decimal
+from typing import Annotated, Awaitable, Callable
+
+from fastapi import Depends
+from sqlalchemy import Row
+
+from src.api.v1.request_models.salary import RaiseDateQueryParams
+from src.core.exc import custom_exceptions
+from src.data_base.crud import PayrollCRUD
+from src.data_base.DTO_models import PayrollReportDTO
+
+
+class PayrollService:
+    def __init__(
+        self, payroll_crud: Annotated[PayrollCRUD, Depends()]
+    ) -> None:
+        self.__crud = payroll_crud
+
+    @staticmethod
+    async def __get_report(
+        get_rows: Callable[..., Awaitable[list[Row]]],
+        params: RaiseDateQueryParams
+    ) -> PayrollReportDTO:
+        """Возвращает строки отчета и итоги, посчитанные по этим строкам.
+
+        Если нижняя граница даты повышения больше верхней - бросает ошибку.
+
+        Аргументы:
+            get_rows - метод CRUD, возвращающий строки отчета,
+            params: RaiseDateQueryParams - границы даты повышения.
+        """
+        if (
+            params.date_after and params.date_before
+            and params.date_after > params.date_before
+        ):
+            raise custom_exceptions.InvalidDateRangeError
+        rows = await get_rows(
+            date_after=params.date_after, date_before=params.date_before
+        )
+        total_amount = sum((row.total_amount for row in rows), Decimal())
+        salaried = sum(row.salaried for row in rows)
+        return PayrollReportDTO(
+            rows=rows,
+            headcount=sum(row.headcount for row in rows),
+            total_amount=total_amount,
+            average_amount=(
+                round(total_amount / salaried, 2) if salaried else None
+            )
+        )
+
+    async def get_by_department(
+        self, params: RaiseDateQueryParams
+    ) -> PayrollReportDTO:
+        """Возвращает показатели фонда оплаты труда по отделам.
+
+        Аргументы:
+            params: RaiseDateQueryParams - границы даты повышения.
+        """
+        return await self.__get_report(self.__crud.get_by_department, params)
+
+    async def get_by_position(
+        self, params: RaiseDateQueryParams
+    ) -> PayrollReportDTO:
+        """Возвращает показатели фонда оплаты труда по должностям.
+
+        Аргументы:
+            params: RaiseDateQueryParams - границы даты повышения.
+        """
+        return await self.__get_report(self.__crud.get_by_position, params)
+
+    async def get_by_status(
+        self, params: RaiseDateQueryParams
+    ) -> PayrollReportDTO:
+        """Возвращает показатели фонда оплаты труда по статусам работников.
+
+        Аргументы:
+            params: RaiseDateQueryParams - границы даты повышения.
+        """
+        return await self.__get_report(self.__crud.get_by_status, params)
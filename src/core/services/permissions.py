@@ -4,32 +4,40 @@ from fastapi import Depends
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
 from src.core.services.authentication_service import AuthenticationService
+from src.data_base.DTO_models import PrincipalDTO
 from src.data_base.models import User
 
 
-async def is_user_authenticated(
+async def get_current_principal(
     token: Annotated[HTTPAuthorizationCredentials, Depends(HTTPBearer())],
     auth_service: Annotated[AuthenticationService, Depends()]
-) -> None:
+) -> PrincipalDTO:
+    """Возвращает данные пользователя, выполняющего запрос.
+
+    `FastAPI` кэширует результат зависимости в рамках запроса, поэтому
+    токен проверяется, а пользователь запрашивается не более одного раза,
+    сколько бы проверок прав и обработчиков его ни использовали.
+    """
+    return await auth_service.get_token_principal(token.credentials)
+
+
+CurrentPrincipal = Annotated[PrincipalDTO, Depends(get_current_principal)]
+
+
+async def is_user_authenticated(principal: CurrentPrincipal) -> None:
     """Разрешает доступ всем аутентифицированным пользователям."""
-    return await auth_service.check_current_user_exists(token=token)
+    AuthenticationService.check_principal_status(principal)
 
 
-async def is_administrator(
-    token: Annotated[HTTPAuthorizationCredentials, Depends(HTTPBearer())],
-    auth_service: Annotated[AuthenticationService, Depends()]
-) -> None:
+async def is_administrator(principal: CurrentPrincipal) -> None:
     """Разрешает доступ пользователям со статусом `admin`."""
-    return await auth_service.check_current_user_exists(
-        token=token, statuses=[User.Status.ADMIN]
+    AuthenticationService.check_principal_status(
+        principal, statuses=[User.Status.ADMIN]
     )
 
 
-async def is_administrator_or_staff(
-    token: Annotated[HTTPAuthorizationCredentials, Depends(HTTPBearer())],
-    auth_service: Annotated[AuthenticationService, Depends()]
-) -> None:
+async def is_administrator_or_staff(principal: CurrentPrincipal) -> None:
     """Разрешает доступ пользователям со статусом `staff` или `admin`."""
-    return await auth_service.check_current_user_exists(
-        token=token, statuses=[User.Status.ADMIN, User.Status.STAFF]
+    AuthenticationService.check_principal_status(
+        principal, statuses=[User.Status.ADMIN, User.Status.STAFF]
     )
@@ -1,11 +1,18 @@
-from typing import Annotated
+from datetime import date, timedelta
+from typing import Annotated, Any, AsyncIterator
 
 from fastapi import Depends
 from pydantic import FutureDate
 
-from src.api.v1.request_models.salary import (SalaryCreateRequest,
-                                              SalaryUpdateRequest)
+from src.api.v1.request_models.salary import (SalaryAdjustRequest,
+                                              SalaryCreateRequest,
+                                              SalaryUpdateRequest,
+                                              UpcomingRaisesQueryParams)
+from src.core.exc import custom_exceptions
 from src.data_base.crud import SalaryCRUD
+from src.data_base.DTO_models import (LookupDTO, PageDTO, SalaryAdjustmentDTO,
+                                      UpcomingRaisesDTO)
+from src.data_base.fields import FieldTree
 from src.data_base.models import Salary
 
 
@@ -15,17 +22,103 @@ class SalaryService:
     ) -> None:
         self.__crud = salary_crud
 
-    async def get_all(
+    async def get_version(
         self,
+        cursor: str | None = None,
         date_after: FutureDate | None = None,
         date_before: FutureDate | None = None
-    ) -> list[Salary]:
-        """Возвращает список всех заработных плат из БД."""
+    ) -> tuple[Any, ...]:
+        """Возвращает версию данных списка заработных плат для ETag.
+
+        Курсор и интервал дат проверяются до чтения версии, поэтому
+        на некорректный запрос возвращается ошибка `400`, а не `304`.
+
+        Аргументы:
+            cursor: str - курсор, полученный на предыдущей странице,
+            date_after: FutureDate - нижняя граница даты повышения,
+            date_before: FutureDate - верхняя граница даты повышения.
+        """
+        self.__check_date_range(date_after, date_before)
+        self.__crud.check_cursor(cursor)
+        return await self.__crud.get_version()
+
+    @staticmethod
+    def __check_date_range(
+        date_after: FutureDate | None, date_before: FutureDate | None
+    ) -> None:
+        """Бросает ошибку, если нижняя граница даты больше верхней."""
+        if date_after and date_before and date_after > date_before:
+            raise custom_exceptions.InvalidDateRangeError
+
+    async def get_all(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        date_after: FutureDate | None = None,
+        date_before: FutureDate | None = None,
+        fields: FieldTree | None = None
+    ) -> PageDTO:
+        """Возвращает страницу списка заработных плат из БД.
+
+        Если нижняя граница даты повышения больше верхней - бросает ошибку.
+
+        Аргументы:
+            limit: int - количество записей на странице,
+            cursor: str - курсор, полученный на предыдущей странице,
+            date_after: FutureDate - нижняя граница даты повышения,
+            date_before: FutureDate - верхняя граница даты повышения,
+            fields: FieldTree - выбранные поля ответа.
+        """
+        self.__check_date_range(date_after, date_before)
         return await self.__crud.get_all(
+            limit=limit,
+            cursor=cursor,
             date_after=date_after,
-            date_before=date_before
+            date_before=date_before,
+            fields=fields
         )
 
+    def stream_all(
+        self,
+        date_after: FutureDate | None = None,
+        date_before: FutureDate | None = None,
+        fields: FieldTree | None = None
+    ) -> AsyncIterator[Salary]:
+        """Возвращает заработные платы из БД по одному.
+
+        Интервал дат проверяется сразу, до начала выдачи ответа.
+
+        Аргументы:
+            date_after: FutureDate - нижняя граница даты повышения,
+            date_before: FutureDate - верхняя граница даты повышения,
+            fields: FieldTree - выбранные поля ответа.
+        """
+        self.__check_date_range(date_after, date_before)
+        return self.__crud.stream_all(
+            date_after=date_after, date_before=date_before, fields=fields
+        )
+
+    async def get_upcoming_raises(
+        self, params: UpcomingRaisesQueryParams
+    ) -> UpcomingRaisesDTO:
+        """Возвращает календарь повышений заработных плат работников.
+
+        Календарь начинается с сегодняшней даты и охватывает `days` дней.
+
+        Аргументы:
+            params: UpcomingRaisesQueryParams - горизонт, период группировки
+                и признак вывода только итогов.
+        """
+        date_from = date.today()
+        date_to = date_from + timedelta(days=params.days)
+        buckets = await self.__crud.get_upcoming_raises(
+            date_from=date_from,
+            date_to=date_to,
+            period=params.period.value,
+            counts_only=params.counts_only
+        )
+        return UpcomingRaisesDTO(date_from, date_to, buckets)
+
     async def create_salary(
         self, data: SalaryCreateRequest
     ) -> Salary:
@@ -34,18 +127,26 @@ class SalaryService:
         Аргументы:
             data: SalaryCreateRequest - данные для создания объекта.
         """
-        salary = Salary(**data.dict())
-        return await self.__crud.create(salary)
+        return await self.__crud.create(data.dict())
+
+    async def get_by_ids(self, ids: list[int]) -> LookupDTO:
+        """Возвращает записи заработных плат из БД по списку `id`.
+
+        Аргументы:
+            ids: list[int] - значения поля `id` записей в БД.
+        """
+        return await self.__crud.get_many(ids)
 
     async def get_by_id(
-        self, obj_id: int
+        self, obj_id: int, fields: FieldTree | None = None
     ) -> Salary:
         """Возвращает отдельную запись с заработной платой из БД.
 
         Аргументы:
-            obj_id: int - значение поля `id` записи в БД.
+            obj_id: int - значение поля `id` записи в БД,
+            fields: FieldTree - выбранные поля ответа.
         """
-        return await self.__crud.get_or_404(obj_id=obj_id)
+        return await self.__crud.get_or_404(obj_id=obj_id, fields=fields)
 
     async def update_salary(
         self, obj_id: int, data: SalaryUpdateRequest
@@ -59,10 +160,37 @@ class SalaryService:
         data_dict = data.dict(exclude_unset=True)
         return await self.__crud.update(obj_id, data_dict)
 
+    async def adjust_salaries(
+        self, data: SalaryAdjustRequest
+    ) -> SalaryAdjustmentDTO:
+        """Изменяет заработные платы работников отдела, должности или списка.
+
+        В режиме `dry_run` изменения не выполняются, а возвращаются
+        количество заработных плат и их суммы до и после изменения.
+
+        Аргументы:
+            data: SalaryAdjustRequest - условия отбора и размер изменения.
+        """
+        filters = {
+            'department_id': data.department,
+            'position_id': data.position,
+            'ids': data.ids,
+        }
+        if data.dry_run:
+            return await self.__crud.get_adjustment_totals(
+                percent=data.percent, delta=data.delta, **filters
+            )
+        return await self.__crud.adjust(
+            raise_date=data.raise_date,
+            percent=data.percent,
+            delta=data.delta,
+            **filters
+        )
+
     async def delete_salary(self, obj_id: int) -> None:
         """Удаляет запись с данными заработной платы из БД.
 
         Аргументы:
             obj_id: int - значение поля `id` записи в БД.
         """
-        return await self.__crud.delete(obj_id)
+        await self.__crud.delete(obj_id)
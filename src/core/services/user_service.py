@@ -1,56 +1,86 @@
-from typing import Annotated
+from typing import Annotated, Any, AsyncIterator
 
 from fastapi import Depends
+from sqlalchemy import ColumnElement, Row, case, not_
 
-from src.api.v1.request_models.user import (UserChangeStatusRequest,
+from src.api.v1.request_models.bulk import BulkMode
+from src.api.v1.request_models.user import (UserBulkChangeStatusRequest,
+                                            UserBulkCreateRequest,
+                                            UserBulkSelectRequest,
+                                            UserBulkTransferRequest,
+                                            UserChangeStatusRequest,
                                             UserCreateRequest,
                                             UserResetPasswordRequest,
                                             UserSelfUpdateRequest,
                                             UserUpdateRequest)
+from src.core.exc import custom_exceptions
 from src.core.services.authentication_service import AuthenticationService
-from src.data_base.crud import (DepartmentCRUD, PositionCRUD, SalaryCRUD,
-                                UserCRUD)
+from src.data_base.crud import UserCRUD
+from src.data_base.DTO_models import (BulkActionDTO, BulkItemErrorDTO,
+                                      BulkResultDTO, LookupDTO, PageDTO,
+                                      UserReadDTO)
+from src.data_base.fields import FieldTree
 from src.data_base.models import User
 
 
+def bump_token_version(
+    changed: ColumnElement[bool] | None = None
+) -> ColumnElement[int]:
+    """Возвращает SQL-выражение для увеличения версии токенов пользователя.
+
+    Аргументы:
+        changed: ColumnElement[bool] - условие, при котором версия
+            увеличивается (по умолчанию - всегда)
+    """
+    if changed is None:
+        return User.token_version + 1
+    return User.token_version + case((changed, 1), else_=0)
+
+
 class UserService:
     def __init__(
-        self,
-        user_crud: Annotated[UserCRUD, Depends()],
-        department_crud: Annotated[DepartmentCRUD, Depends()],
-        salary_crud: Annotated[SalaryCRUD, Depends()],
-        position_crud: Annotated[PositionCRUD, Depends()],
+        self, user_crud: Annotated[UserCRUD, Depends()]
     ) -> None:
         self.__crud = user_crud
-        self.__department_crud = department_crud
-        self.__salary_crud = salary_crud
-        self.__position_crud = position_crud
 
-    async def __get_nested_instances(
-        self, data: UserCreateRequest
-    ) -> UserCreateRequest:
-        """Получает объекты связываемых экземпляров моделей по `id`.
+    async def get_version(self, cursor: str | None = None) -> tuple[Any, ...]:
+        """Возвращает версию данных списка пользователей для ETag.
+
+        Курсор проверяется до чтения версии, поэтому на некорректный
+        запрос возвращается ошибка `400`, а не `304`.
 
         Аргументы:
-            data: UserCreateRequest - данные для создания объекта.
+            cursor: str - курсор, полученный на предыдущей странице.
+        """
+        self.__crud.check_cursor(cursor)
+        return await self.__crud.get_version()
+
+    async def get_all(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        fields: FieldTree | None = None
+    ) -> PageDTO:
+        """Возвращает страницу списка пользователей из БД.
+
+        Аргументы:
+            limit: int - количество записей на странице,
+            cursor: str - курсор, полученный на предыдущей странице,
+            fields: FieldTree - выбранные поля ответа.
+        """
+        return await self.__crud.get_all(
+            limit=limit, cursor=cursor, fields=fields
+        )
+
+    def stream_all(
+        self, fields: FieldTree | None = None
+    ) -> AsyncIterator[User | UserReadDTO]:
+        """Возвращает всех пользователей из БД по одному.
+
+        Аргументы:
+            fields: FieldTree - выбранные поля ответа.
         """
-        if hasattr(data, 'department') and data.department:
-            data.department = await self.__department_crud.get_or_404(
-                data.department
-            )
-        if hasattr(data, 'position') and data.position:
-            data.position = await self.__position_crud.get_or_404(
-                data.position
-            )
-        if hasattr(data, 'salary') and data.salary:
-            data.salary = await self.__salary_crud.get_or_404(
-                data.salary
-            )
-        return data
-
-    async def get_all(self) -> list[User]:
-        """Возвращает список всех пользователей из БД."""
-        return await self.__crud.get_all()
+        return self.__crud.stream_all(fields=fields)
 
     async def create_user(
         self, data: UserCreateRequest
@@ -60,22 +90,115 @@ class UserService:
         Аргументы:
             data: UserCreateRequest - данные для создания объекта.
         """
-        data.password = AuthenticationService.get_password_hash(
+        data.password = await AuthenticationService.hash_password(
             password=data.password.get_secret_value()
         )
-        data = await self.__get_nested_instances(data=data)
-        user = User(**data.dict(exclude={'password_repeat'}))
-        return await self.__crud.create(user)
+        return await self.__crud.create(data.dict(exclude={'password_repeat'}))
+
+    async def create_users(
+        self, data: UserBulkCreateRequest
+    ) -> BulkResultDTO:
+        """Создает записи с новыми пользователями в БД одной транзакцией.
+
+        Занятость `username` проверяется одним запросом, пароли хешируются
+        параллельно в отдельном пуле исполнителей, записи создаются одним
+        `INSERT`. Элементы с занятым или повторяющимся `username` попадают
+        в список ошибок, в режиме `atomic` при этом не создается ни одна
+        запись. Если `INSERT` нарушил ограничения БД (например, `username`
+        занят параллельным запросом после проверки), в режиме `partial`
+        записи создаются по одной, а нарушения попадают в список ошибок.
+
+        Аргументы:
+            data: UserBulkCreateRequest - данные для создания объектов.
+        """
+        existing = await self.__crud.get_existing_usernames(
+            [item.username for item in data.items]
+        )
+        errors: list[BulkItemErrorDTO] = []
+        valid_items: dict[int, UserCreateRequest] = {}
+        for index, item in enumerate(data.items):
+            if item.username in existing:
+                errors.append(
+                    self.__username_exists_error(index, item.username)
+                )
+                continue
+            existing.add(item.username)
+            valid_items[index] = item
+        if errors and data.mode is BulkMode.ATOMIC:
+            raise custom_exceptions.BulkOperationError(errors=errors)
+        passwords = await AuthenticationService.hash_passwords(
+            [item.password.get_secret_value() for item in valid_items.values()]
+        )
+        rows = {
+            index: item.dict(exclude={'password_repeat'})
+            | {'password': password}
+            for (index, item), password in zip(valid_items.items(), passwords)
+        }
+        try:
+            users = await self.__crud.create_many(list(rows.values()))
+        except custom_exceptions.ObjectAlreadyExistError:
+            if data.mode is BulkMode.ATOMIC:
+                raise
+            return await self.__create_users_one_by_one(rows, errors)
+        users_by_username = {user.username: user for user in users}
+        return BulkResultDTO(
+            items=[
+                users_by_username[item.username]
+                for item in valid_items.values()
+            ],
+            errors=errors
+        )
+
+    async def __create_users_one_by_one(
+        self, rows: dict[int, dict], errors: list[BulkItemErrorDTO]
+    ) -> BulkResultDTO:
+        """Создает записи пользователей по одной, собирая ошибки элементов.
+
+        Аргументы:
+            rows: dict[int, dict] - данные объектов по индексу в запросе,
+            errors: list[BulkItemErrorDTO] - уже найденные ошибки.
+        """
+        users: list[User] = []
+        for index, row in rows.items():
+            try:
+                users.append(await self.__crud.create(row))
+            except custom_exceptions.ObjectAlreadyExistError:
+                errors.append(
+                    self.__username_exists_error(index, row['username'])
+                )
+            except custom_exceptions.AppBaseError as error:
+                errors.append(
+                    BulkItemErrorDTO(index=index, detail=error.detail)
+                )
+        errors.sort(key=lambda error: error.index)
+        return BulkResultDTO(items=users, errors=errors)
+
+    @staticmethod
+    def __username_exists_error(index: int, username: str) -> BulkItemErrorDTO:
+        """Возвращает ошибку элемента с занятым `username`."""
+        return BulkItemErrorDTO(
+            index=index,
+            detail='Работник с username {} уже существует'.format(username)
+        )
+
+    async def get_by_ids(self, ids: list[int]) -> LookupDTO:
+        """Возвращает записи пользователей из БД по списку `id`.
+
+        Аргументы:
+            ids: list[int] - значения поля `id` записей в БД.
+        """
+        return await self.__crud.get_many(ids)
 
     async def get_by_id(
-        self, obj_id: int
-    ) -> User:
+        self, obj_id: int, fields: FieldTree | None = None
+    ) -> User | UserReadDTO:
         """Возвращает отдельную запись с пользователем из БД.
 
         Аргументы:
-            obj_id: int - значение поля `id` записи в БД.
+            obj_id: int - значение поля `id` записи в БД,
+            fields: FieldTree - выбранные поля ответа.
         """
-        return await self.__crud.get_or_404(obj_id=obj_id)
+        return await self.__crud.get_read_or_404(obj_id=obj_id, fields=fields)
 
     async def update_user(
         self, obj_id: int, data: UserUpdateRequest
@@ -86,60 +209,77 @@ class UserService:
             obj_id: int - значение поля `id` записи в БД,
             data: UserUpdateRequest - данные для создания объекта.
         """
-        data = await self.__get_nested_instances(data=data)
         data_dict = data.dict(exclude_unset=True)
         return await self.__crud.update(obj_id, data_dict)
 
     async def update_user_himself(
         self,
         data: UserSelfUpdateRequest,
-        user_obj: User
+        user_id: int
     ) -> User:
         """Обновляет данные записи с пользователем в БД.
 
         Аргументы:
-            user_obj: User - объект пользователя,
-            data: UserUpdateRequest - данные для создания объекта.
+            data: UserSelfUpdateRequest - данные для создания объекта,
+            user_id: int - значение поля `id` записи пользователя в БД.
         """
-        data = await self.__get_nested_instances(data=data)
         data_dict = data.dict(exclude_unset=True)
-        return await self.__crud.update_by_obj(obj=user_obj, data=data_dict)
+        return await self.__crud.update(user_id, data_dict)
 
     async def change_user_status(
         self, obj_id: int, data: UserChangeStatusRequest
     ) -> User:
         """Изменяет статус пользователя в записи в БД.
 
+        При смене статуса ранее выданные пользователю токены отзываются.
+
         Аргументы:
             obj_id: int - значение поля `id` записи в БД,
             data: UserChangeStatusRequest - новый статус
         """
         data_dict = data.dict(exclude_unset=True)
-        return await self.__crud.update(obj_id, data_dict)
+        data_dict['token_version'] = bump_token_version(
+            User.status != data.status
+        )
+        user = await self.__crud.update(obj_id, data_dict)
+        AuthenticationService.invalidate_principal(user.username)
+        return user
 
     async def change_user_password(
         self, obj_id: int, data: UserResetPasswordRequest
     ) -> User:
-        """Изменяет статус пользователя в записи в БД.
+        """Изменяет пароль пользователя в записи в БД.
+
+        Ранее выданные пользователю токены отзываются.
 
         Аргументы:
             obj_id: int - значение поля `id` записи в БД,
             data: UserResetPasswordRequest - данные с новым паролем
         """
-        data.password = AuthenticationService.get_password_hash(
+        data.password = await AuthenticationService.hash_password(
             password=data.password.get_secret_value()
         )
         data_dict = data.dict(exclude={'password_repeat'}, exclude_unset=True)
-        return await self.__crud.update(obj_id, data_dict)
+        data_dict['token_version'] = bump_token_version()
+        user = await self.__crud.update(obj_id, data_dict)
+        AuthenticationService.invalidate_principal(user.username)
+        return user
 
     async def set_block_user(self, obj_id: int) -> User:
         """Блокирует пользователя.
 
+        Ранее выданные пользователю токены отзываются.
+
         Аргументы:
             obj_id: int - значение поля `id` записи в БД
         """
-        data_dict: dict = {'is_blocked': True}
-        return await self.__crud.update(obj_id, data_dict)
+        data_dict: dict = {
+            'is_blocked': True,
+            'token_version': bump_token_version(not_(User.is_blocked))
+        }
+        user = await self.__crud.update(obj_id, data_dict)
+        AuthenticationService.invalidate_principal(user.username)
+        return user
 
     async def unset_block_user(self, obj_id: int) -> User:
         """Снимает блокировку с пользователя.
@@ -148,7 +288,9 @@ class UserService:
             obj_id: int - значение поля `id` записи в БД
         """
         data_dict: dict = {'is_blocked': False}
-        return await self.__crud.update(obj_id, data_dict)
+        user = await self.__crud.update(obj_id, data_dict)
+        AuthenticationService.invalidate_principal(user.username)
+        return user
 
     async def delete_user(self, obj_id: int) -> None:
         """Удаляет запись с данными пользователя из БД.
@@ -156,4 +298,114 @@ class UserService:
         Аргументы:
             obj_id: int - значение поля `id` записи в БД.
         """
-        return await self.__crud.delete(obj_id)
+        user = await self.__crud.delete(obj_id)
+        AuthenticationService.invalidate_principal(user.username)
+
+    def __get_selection_filters(
+        self, data: UserBulkSelectRequest
+    ) -> list[ColumnElement[bool]]:
+        """Возвращает условия отбора работников из массового запроса.
+
+        Аргументы:
+            data: UserBulkSelectRequest - условия отбора работников
+        """
+        return self.__crud.get_selection_filters(
+            ids=data.ids,
+            department_id=data.department,
+            position_id=data.position
+        )
+
+    @staticmethod
+    def __get_action_result(rows: list[Row]) -> BulkActionDTO:
+        """Сбрасывает кэш прав доступа затронутых работников.
+
+        Аргументы:
+            rows: list[Row] - `id` и `username` затронутых работников
+        """
+        for _, username in rows:
+            AuthenticationService.invalidate_principal(username)
+        return BulkActionDTO(
+            affected=len(rows), ids=[user_id for user_id, _ in rows]
+        )
+
+    async def __update_users(
+        self, data: UserBulkSelectRequest, data_dict: dict
+    ) -> BulkActionDTO:
+        """Обновляет отобранных работников одним запросом.
+
+        Аргументы:
+            data: UserBulkSelectRequest - условия отбора работников,
+            data_dict: dict - новые значения полей
+        """
+        rows = await self.__crud.update_many(
+            self.__get_selection_filters(data),
+            data_dict,
+            User.id,
+            User.username
+        )
+        return self.__get_action_result(rows)
+
+    async def set_block_users(
+        self, data: UserBulkSelectRequest
+    ) -> BulkActionDTO:
+        """Блокирует отобранных пользователей.
+
+        Ранее выданные пользователям токены отзываются.
+
+        Аргументы:
+            data: UserBulkSelectRequest - условия отбора работников
+        """
+        return await self.__update_users(data, {
+            'is_blocked': True,
+            'token_version': bump_token_version(not_(User.is_blocked))
+        })
+
+    async def unset_block_users(
+        self, data: UserBulkSelectRequest
+    ) -> BulkActionDTO:
+        """Снимает блокировку с отобранных пользователей.
+
+        Аргументы:
+            data: UserBulkSelectRequest - условия отбора работников
+        """
+        return await self.__update_users(data, {'is_blocked': False})
+
+    async def change_users_status(
+        self, data: UserBulkChangeStatusRequest
+    ) -> BulkActionDTO:
+        """Изменяет статус отобранных пользователей.
+
+        При смене статуса ранее выданные пользователям токены отзываются.
+
+        Аргументы:
+            data: UserBulkChangeStatusRequest - условия отбора и статус
+        """
+        return await self.__update_users(data, {
+            'status': data.status,
+            'token_version': bump_token_version(User.status != data.status)
+        })
+
+    async def transfer_users(
+        self, data: UserBulkTransferRequest
+    ) -> BulkActionDTO:
+        """Переводит отобранных пользователей в другой отдел.
+
+        Аргументы:
+            data: UserBulkTransferRequest - условия отбора и новый отдел
+        """
+        return await self.__update_users(
+            data, {'department_id': data.new_department}
+        )
+
+    async def delete_users(
+        self, data: UserBulkSelectRequest
+    ) -> BulkActionDTO:
+        """Удаляет записи отобранных пользователей из БД.
+
+        Аргументы:
+            data: UserBulkSelectRequest - условия отбора работников
+        """
+        rows = await self.__crud.delete_many(
+            self.__get_selection_filters(data), User.id, User.username
+        )
+        return self.__get_action_result(rows)
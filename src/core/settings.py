@@ -1,5 +1,6 @@
 import uuid
 from functools import lru_cache
+from typing import Literal
 
 from pydantic import BaseSettings, PostgresDsn
 
@@ -26,6 +27,61 @@ class Settings(BaseSettings):
     # Тестовая база данных для режима разработки
     DB_DEV_TEST: str = 'sqlite+aiosqlite:///./db.sqlite3_tests'
 
+    # Количество записей на странице списка по умолчанию
+    PAGINATION_DEFAULT_LIMIT: int = 100
+    # Максимально допустимое количество записей на странице списка
+    PAGINATION_MAX_LIMIT: int = 1000
+    # Количество строк, читаемых из курсора БД за раз при потоковой выдаче
+    STREAM_YIELD_PER: int = 500
+
+    # Максимальное количество проверенных JWT-токенов в кэше
+    TOKEN_CACHE_MAX_SIZE: int = 10000
+    # Максимальное количество пользователей в кэше прав доступа
+    PRINCIPAL_CACHE_MAX_SIZE: int = 10000
+    # Время жизни записи кэша прав доступа (в секундах). Ограничивает
+    # устаревание данных в других процессах приложения, в текущем процессе
+    # кэш сбрасывается сразу при изменении пользователя
+    PRINCIPAL_CACHE_TTL: int = 60
+    # Время жизни версии данных списка для ETag (в секундах). В текущем
+    # процессе кэш сбрасывается при фиксации любой транзакции, изменения
+    # из других процессов становятся видны не позже чем через это время
+    VERSION_CACHE_TTL: int = 5
+
+    # Пул для хеширования паролей вне event loop (thread/process)
+    PASSWORD_HASHING_EXECUTOR: Literal['thread', 'process'] = 'thread'
+    # Количество исполнителей в пуле хеширования паролей
+    PASSWORD_HASHING_WORKERS: int = 4
+    # Количество задач хеширования, ожидающих свободного исполнителя
+    PASSWORD_HASHING_QUEUE_SIZE: int = 64
+    # Отдельный пул для массового создания работников: хеширование пачки
+    # паролей не занимает исполнителей, проверяющих пароли при входе
+    BULK_PASSWORD_HASHING_WORKERS: int = 2
+    # Количество задач массового хеширования, ожидающих исполнителя
+    BULK_PASSWORD_HASHING_QUEUE_SIZE: int = 2
+
+    # Количество одновременно обрабатываемых запросов на вход
+    LOGIN_MAX_CONCURRENCY: int = 4
+    # Количество запросов на вход, ожидающих обработки
+    LOGIN_QUEUE_SIZE: int = 32
+    # Пауза перед повтором входа при переполнении очереди (в секундах)
+    LOGIN_RETRY_AFTER: int = 1
+    # Всплеск и частота (в минуту) попыток входа под одним логином
+    LOGIN_USERNAME_BURST: int = 10
+    LOGIN_USERNAME_PER_MINUTE: int = 10
+    # Всплеск и частота (в минуту) попыток входа с одного IP-адреса
+    LOGIN_IP_BURST: int = 100
+    LOGIN_IP_PER_MINUTE: int = 300
+    # Максимальное количество ключей, отслеживаемых ограничителями частоты
+    RATE_LIMIT_MAX_KEYS: int = 100000
+
+    # Максимальное количество элементов в одном массовом запросе
+    BULK_MAX_ITEMS: int = 500
+
+    # Горизонт календаря повышений заработных плат по умолчанию (в днях)
+    UPCOMING_RAISES_DEFAULT_DAYS: int = 30
+    # Максимальный горизонт календаря повышений заработных плат (в днях)
+    UPCOMING_RAISES_MAX_DAYS: int = 366
+
     # База данных
     POSTGRES_DB: str
     POSTGRES_USER: str
@@ -1,9 +1,144 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from datetime import date
+from decimal import Decimal
+from typing import Any, NamedTuple
 
 from src.data_base.models import User
 
 
+@dataclass(frozen=True, slots=True)
+class TitledDTO:
+    """Отдел или должность работника в ответе на чтение."""
+
+    id: int
+    title: str
+
+
+@dataclass(frozen=True, slots=True)
+class SalaryShortDTO:
+    """Заработная плата работника в ответе на чтение."""
+
+    id: int
+    amount: Decimal
+    raise_date: date
+
+
+@dataclass(frozen=True, slots=True)
+class UserReadDTO:
+    """Работник, прочитанный из БД без создания ORM-объекта.
+
+    Содержит только поля схемы ответа `UserResponse`.
+    """
+
+    id: int
+    first_name: str
+    last_name: str
+    username: str
+    date_of_birth: date
+    is_blocked: bool
+    status: User.Status
+    department: TitledDTO | None
+    position: TitledDTO | None
+    salary: SalaryShortDTO | None
+
+
 @dataclass
 class UserAndTokenDTO:
-    user: User
+    user: UserReadDTO
     access_token: str
+
+
+@dataclass(frozen=True)
+class PrincipalDTO:
+    """Данные пользователя, необходимые для проверки прав доступа."""
+
+    id: int
+    username: str
+    status: User.Status
+    is_blocked: bool
+    token_version: int
+
+
+@dataclass(frozen=True)
+class CredentialsDTO(PrincipalDTO):
+    """Данные пользователя для входа: данные прав доступа и хеш пароля."""
+
+    password: str = field(repr=False)
+
+
+class PageDTO(NamedTuple):
+    """Страница списка объектов модели.
+
+    Не является `dataclass`, чтобы `FastAPI` не копировал
+    ORM-объекты при подготовке ответа.
+    """
+
+    items: list[Any]
+    next_cursor: str | None = None
+
+
+@dataclass(frozen=True)
+class BulkItemErrorDTO:
+    """Ошибка обработки элемента массового запроса."""
+
+    index: int
+    detail: str
+
+
+class LookupDTO(NamedTuple):
+    """Объекты, найденные по списку `id`, и отсутствующие `id`."""
+
+    items: list[Any]
+    missing_ids: list[int]
+
+
+class BulkResultDTO(NamedTuple):
+    """Результат массового запроса: обработанные объекты и ошибки."""
+
+    items: list[Any]
+    errors: list[BulkItemErrorDTO]
+
+
+@dataclass(frozen=True)
+class SalaryAdjustmentDTO:
+    """Итоги массового изменения заработных плат."""
+
+    affected: int
+    amount_before: Decimal | None = None
+    amount_after: Decimal | None = None
+
+
+@dataclass(frozen=True)
+class BulkActionDTO:
+    """Результат массовой операции над записями."""
+
+    affected: int
+    ids: list[int]
+
+
+class UpcomingRaisesBucketDTO(NamedTuple):
+    """Повышения заработных плат отдела за один период календаря."""
+
+    period_start: date
+    department_id: int | None
+    department_title: str | None
+    count: int
+    amount: Decimal
+    salaries: list[Any] | None = None
+
+
+class UpcomingRaisesDTO(NamedTuple):
+    """Календарь повышений заработных плат за интервал дат."""
+
+    date_from: date
+    date_to: date
+    buckets: list[UpcomingRaisesBucketDTO]
+
+
+class PayrollReportDTO(NamedTuple):
+    """Сводные показатели фонда оплаты труда по группам и в целом."""
+
+    rows: list[Any]
+    headcount: int
+    total_amount: Decimal
+    average_amount: Decimal | None
@@ -1,5 +1,6 @@
 from typing import AsyncGenerator
 
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
@@ -7,6 +8,18 @@ from ..core.settings import settings  # noqa
 
 echo: bool = True if settings.DEBUG else False
 
+
+def enable_sqlite_foreign_keys(dbapi_connection, connection_record) -> None:
+    """Включает проверку внешних ключей для соединения с SQLite.
+
+    Без нее SQLite игнорирует `ON DELETE`, а удаление записей одним
+    запросом полагается на то, что ссылки на них обнуляет сама БД.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute('PRAGMA foreign_keys=ON')
+    cursor.close()
+
+
 if not settings.DEVELOPMENT:
     db_url: str = settings.get_postgresql_url
     engine = create_async_engine(
@@ -21,6 +34,7 @@ else:
         echo=echo,
         connect_args={'check_same_thread': False},
     )
+    event.listen(engine.sync_engine, 'connect', enable_sqlite_foreign_keys)
 
 async_session = sessionmaker(
     bind=engine, class_=AsyncSession, expire_on_commit=False
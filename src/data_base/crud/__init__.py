@@ -1,5 +1,6 @@
 from .base_crud import BaseCRUD  # noqa
 from .department_crud import DepartmentCRUD  # noqa
+from .payroll_crud import PayrollCRUD  # noqa
 from .position_crud import PositionCRUD  # noqa
 from .salary_crud import SalaryCRUD  # noqa
 from .user_crud import UserCRUD  # noqa
@@ -1,65 +1,465 @@
 from abc import ABC
-from typing import TypeVar
+from typing import Any, AsyncIterator, Callable, TypeVar
 
-from sqlalchemy import select
+from sqlalchemy import (ColumnElement, Row, Select, delete, event, exists,
+                        func, insert, inspect, select, tuple_, update)
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import MANYTOONE, Session
+from sqlalchemy.orm.interfaces import ORMOption
 
+from src.core.cache import LRUCache
 from src.core.exc import custom_exceptions
+from src.core.settings import settings
+from src.data_base.DTO_models import LookupDTO, PageDTO
+from src.data_base.fields import FieldTree, get_load_options
+from src.data_base.pagination import decode_cursor, encode_cursor
 
 ModelType = TypeVar('ModelType')
+RowFactory = Callable[[Row], Any]
+# Кэш версий данных списков для ETag по имени модели
+VERSION_CACHE: LRUCache = LRUCache(
+    max_size=64, ttl=settings.VERSION_CACHE_TTL
+)
+
+
+@event.listens_for(Session, 'after_commit')
+def reset_version_cache(session: Session) -> None:
+    """Сбрасывает кэш версий данных после фиксации любой транзакции."""
+    VERSION_CACHE.clear()
 
 
 class BaseCRUD(ABC):
     """Базовый класс для реализации CRUD-операций."""
 
+    # Поля ключа пагинации: уникальный набор, по которому сортируется список
+    _cursor_fields: tuple[str, ...] = ('id',)
+    # Стратегии загрузки связей, необходимые схеме ответа модели
+    _response_options: tuple[ORMOption, ...] = ()
+    # Стратегии загрузки связей для объектов из `UPDATE ... RETURNING`:
+    # к такому запросу нельзя добавить JOIN, поэтому связи догружаются
+    # отдельными запросами через `IN` (`selectinload`)
+    _returning_options: tuple[ORMOption, ...] = ()
+    # Стратегии загрузки связей для объектов из `INSERT ... RETURNING`:
+    # у только что созданной записи еще нет ссылающихся на нее объектов,
+    # поэтому такие связи не запрашиваются (`noload`)
+    _insert_options: tuple[ORMOption, ...] = ()
+
     def __init__(self, session: AsyncSession, model: ModelType) -> None:
         self._session = session
         self._model = model
 
-    async def get_or_none(self, obj_id: int) -> ModelType | None:
+    def _get_load_options(
+        self, fields: FieldTree | None = None
+    ) -> tuple[ORMOption, ...]:
+        """Возвращает стратегии загрузки полей и связей для ответа.
+
+        Без `fields` загружается все, что нужно схеме ответа модели,
+        иначе - только выбранные поля, выбранные связи и ключ пагинации.
+
+        Аргументы:
+            fields: FieldTree - выбранные поля ответа
+        """
+        if fields is None:
+            return self._response_options
+        return get_load_options(self._model, fields, self._cursor_fields)
+
+    async def get_or_none(
+        self, obj_id: int, fields: FieldTree | None = None
+    ) -> ModelType | None:
         """Возвращает объект модели из БД по `id` или `None`."""
-        return await self._session.get(self._model, obj_id)
+        return await self._session.get(
+            self._model, obj_id, options=self._get_load_options(fields)
+        )
 
-    async def get_or_404(self, obj_id: int) -> ModelType:
+    async def get_or_404(
+        self, obj_id: int, fields: FieldTree | None = None
+    ) -> ModelType:
         """Возвращает объект модели из БД по `id` или ошибку `404`."""
-        obj = await self.get_or_none(obj_id=obj_id)
+        obj = await self.get_or_none(obj_id=obj_id, fields=fields)
         if not obj:
             raise custom_exceptions.ObjectNotExistError(
                 model=self._model, obj_id=obj_id
             )
         return obj
 
-    async def get_all(self) -> list[ModelType]:
-        """Возвращает список всех объектов модели."""
-        objects = await self._session.scalars(select(self._model))
-        return objects.unique().all()
+    async def get_version(self) -> tuple[Any, ...]:
+        """Возвращает версию данных, из которых строится ответ модели.
+
+        Для модели и каждой связанной с ней модели (их поля входят
+        в схему ответа) - количество записей, наибольшие `id`
+        и `updated_at`. Добавление, изменение или удаление любой из этих
+        записей меняет версию. Каждое значение - отдельный подзапрос:
+        наибольшие значения читаются по индексам без просмотра таблиц.
+
+        Версия кэшируется (`VERSION_CACHE`), поэтому агрегаты считаются
+        не при каждом чтении списка, а после изменения данных.
+        """
+        key = self._model.__name__
+        version = VERSION_CACHE.get(key)
+        if version is not None:
+            return version
+        generation = VERSION_CACHE.generation
+        version = await self._query_version()
+        if generation == VERSION_CACHE.generation:
+            VERSION_CACHE.set(key, version)
+        return version
+
+    async def _query_version(self) -> tuple[Any, ...]:
+        """Читает версию данных ответа модели из БД одним запросом."""
+        models = [self._model] + [
+            relationship.mapper.class_
+            for relationship in inspect(self._model).relationships
+        ]
+        result = await self._session.execute(select(*(
+            select(aggregate).scalar_subquery()
+            for model in models
+            for aggregate in (
+                func.count(model.id),
+                func.max(model.id),
+                func.max(model.updated_at)
+            )
+        )))
+        return tuple(result.one())
+
+    def check_cursor(self, cursor: str | None) -> None:
+        """Проверяет курсор пагинации без запроса к БД.
+
+        В случае некорректного курсора бросает ошибку.
+
+        Аргументы:
+            cursor: str - курсор, полученный на предыдущей странице
+        """
+        if cursor:
+            decode_cursor(cursor, [
+                getattr(self._model, name) for name in self._cursor_fields
+            ])
+
+    async def get_many(self, ids: list[int]) -> LookupDTO:
+        """Возвращает объекты модели по списку `id` одним запросом.
+
+        Объекты возвращаются в порядке `ids` без повторов,
+        ненайденные `id` перечисляются отдельно.
+
+        Аргументы:
+            ids: list[int] - значения поля `id` записей в БД
+        """
+        ids = list(dict.fromkeys(ids))
+        objects = await self._session.scalars(
+            select(self._model)
+            .where(self._model.id.in_(ids))
+            .options(*self._response_options)
+        )
+        found = {obj.id: obj for obj in objects.unique()}
+        return LookupDTO(
+            items=[found[obj_id] for obj_id in ids if obj_id in found],
+            missing_ids=[obj_id for obj_id in ids if obj_id not in found]
+        )
+
+    async def _get_page(
+        self,
+        query: Select,
+        limit: int,
+        cursor: str | None = None,
+        row_factory: RowFactory | None = None,
+        fields: FieldTree | None = None
+    ) -> PageDTO:
+        """Возвращает страницу результатов запроса по ключу (keyset).
+
+        Записи сортируются по полям `_cursor_fields`, следующая страница
+        начинается строго после записи, закодированной в `cursor`.
+        Запрос отдельных полей (проекция) передается вместе с `row_factory`:
+        строки результата превращаются в DTO без создания ORM-объектов.
 
-    async def create(self, instance: ModelType) -> ModelType:
-        """Создает объект модели и сохраняет в БД."""
-        self._session.add(instance)
+        Аргументы:
+            query: Select - запрос к модели или к ее полям
+            limit: int - количество записей на странице
+            cursor: str - курсор, полученный на предыдущей странице
+            row_factory: RowFactory - преобразование строки проекции в DTO
+            fields: FieldTree - выбранные поля ответа (для запроса к модели)
+        """
+        limit = min(limit, settings.PAGINATION_MAX_LIMIT)
+        columns = [getattr(self._model, name) for name in self._cursor_fields]
+        if cursor:
+            values = decode_cursor(cursor, columns)
+            query = query.where(tuple_(*columns) > tuple_(*values))
+        query = query.order_by(*columns).limit(limit + 1)
+        if row_factory is None:
+            query = query.options(*self._get_load_options(fields))
+            objects = (await self._session.scalars(query)).unique().all()
+        else:
+            result = await self._session.execute(query)
+            objects = [row_factory(row) for row in result]
+        if len(objects) <= limit:
+            return PageDTO(items=objects)
+        objects = objects[:limit]
+        next_cursor = encode_cursor(*(
+            getattr(objects[-1], name) for name in self._cursor_fields
+        ))
+        return PageDTO(items=objects, next_cursor=next_cursor)
+
+    async def get_all(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        fields: FieldTree | None = None
+    ) -> PageDTO:
+        """Возвращает страницу списка объектов модели.
+
+        Аргументы:
+            limit: int - количество записей на странице
+            cursor: str - курсор, полученный на предыдущей странице
+            fields: FieldTree - выбранные поля ответа
+        """
+        return await self._get_page(
+            select(self._model), limit, cursor, fields=fields
+        )
+
+    async def _stream(
+        self,
+        query: Select,
+        row_factory: RowFactory | None = None,
+        fields: FieldTree | None = None
+    ) -> AsyncIterator[Any]:
+        """Возвращает объекты результата запроса по одному.
+
+        Строки читаются из курсора на стороне сервера пачками
+        по `STREAM_YIELD_PER`, поэтому память не зависит от количества
+        строк. Порядок записей совпадает с постраничным списком.
+
+        Аргументы:
+            query: Select - запрос к модели или к ее полям
+            row_factory: RowFactory - преобразование строки проекции в DTO
+            fields: FieldTree - выбранные поля ответа (для запроса к модели)
+        """
+        columns = [getattr(self._model, name) for name in self._cursor_fields]
+        query = query.order_by(*columns).execution_options(
+            yield_per=settings.STREAM_YIELD_PER
+        )
+        if row_factory is None:
+            result = await self._session.stream_scalars(
+                query.options(*self._get_load_options(fields))
+            )
+            async for obj in result:
+                yield obj
+        else:
+            result = await self._session.stream(query)
+            async for row in result:
+                yield row_factory(row)
+
+    def stream_all(
+        self, fields: FieldTree | None = None
+    ) -> AsyncIterator[ModelType]:
+        """Возвращает все объекты модели по одному без загрузки в память."""
+        return self._stream(select(self._model), fields=fields)
+
+    async def create(self, data: dict) -> ModelType:
+        """Создает объект модели и сохраняет в БД.
+
+        Объект создается одним запросом `INSERT ... RETURNING`,
+        существование связанных объектов проверяют внешние ключи БД.
+
+        Аргументы:
+            data: dict - значения полей нового объекта
+        """
+        values = self._get_column_values(data)
         try:
-            await self._session.commit()
+            obj = await self._session.scalar(
+                insert(self._model)
+                .values(**values)
+                .returning(self._model)
+                .options(*self._insert_options)
+            )
         except IntegrityError: # noqa
+            await self._session.rollback()
+            raise await self._get_integrity_error(values)
+        await self._session.commit()
+        return obj
+
+    async def create_many(self, data: list[dict]) -> list[ModelType]:
+        """Создает объекты модели и сохраняет в БД в одной транзакции.
+
+        Объекты создаются одним запросом `INSERT ... RETURNING` на пачку
+        строк. Порядок возвращаемых объектов не гарантируется: требование
+        порядка (`sort_by_parameter_order`) на SQLite разбивает запрос
+        на отдельный `INSERT` для каждой строки.
+
+        Аргументы:
+            data: list[dict] - значения полей новых объектов
+        """
+        if not data:
+            return []
+        try:
+            objects = await self._session.scalars(
+                insert(self._model)
+                .returning(self._model)
+                .options(*self._insert_options),
+                [self._get_column_values(item) for item in data]
+            )
+            objects = objects.all()
+        except IntegrityError: # noqa
+            await self._session.rollback()
             raise custom_exceptions.ObjectAlreadyExistError(
                 model=self._model
             )
+        await self._session.commit()
+        return list(objects)
 
-        await self._session.refresh(instance)
-        return instance
+    def _get_column_values(self, data: dict) -> dict:
+        """Заменяет связанные объекты или их `id` значениями внешних ключей.
 
-    async def update(self, obj_id: int, data: dict) -> ModelType:
-        """Обновляет данные объекта модели в БД."""
-        obj = await self.get_or_404(obj_id=obj_id)
+        Аргументы:
+            data: dict - данные объекта модели
+        """
+        relationships = inspect(self._model).relationships
+        values: dict = {}
         for key, value in data.items():
-            setattr(obj, key, value)
-        self._session.add(obj)
+            if key in relationships:
+                column, = relationships[key].local_columns
+                key, value = column.key, getattr(value, 'id', value)
+            values[key] = value
+        return values
+
+    async def _get_integrity_error(
+        self, values: dict
+    ) -> custom_exceptions.AppBaseError:
+        """Определяет ошибку по нарушению ограничений БД при записи объекта.
+
+        Если запись ссылается на несуществующие объекты, возвращает
+        ошибку `404` для первого из них, иначе - ошибку существования
+        объекта. Все ссылки проверяются одним запросом.
+
+        Аргументы:
+            values: dict - значения полей объекта, отправленные в БД
+        """
+        references = [
+            (relationship.mapper.class_, values[column.key])
+            for relationship in inspect(self._model).relationships
+            if relationship.direction is MANYTOONE
+            for column in relationship.local_columns
+            if values.get(column.key) is not None
+        ]
+        if references:
+            found = (await self._session.execute(select(*(
+                exists().where(model.id == obj_id)
+                for model, obj_id in references
+            )))).one()
+            for (model, obj_id), is_found in zip(references, found):
+                if not is_found:
+                    return custom_exceptions.ObjectNotExistError(
+                        model=model, obj_id=obj_id
+                    )
+        return custom_exceptions.ObjectAlreadyExistError(model=self._model)
+
+    async def update(self, obj_id: int, data: dict) -> ModelType:
+        """Обновляет данные объекта модели в БД.
+
+        Изменение выполняется одним запросом `UPDATE ... RETURNING`,
+        отсутствие объекта определяется по пустому результату запроса.
+        Значениями полей могут быть SQL-выражения.
+
+        Аргументы:
+            obj_id: int - значение поля `id` записи в БД
+            data: dict - новые значения полей объекта
+        """
+        if not data:
+            return await self.get_or_404(obj_id=obj_id)
+        values = self._get_column_values(data)
+        try:
+            obj = await self._session.scalar(
+                update(self._model)
+                .where(self._model.id == obj_id)
+                .values(**values)
+                .returning(self._model)
+                .options(*self._returning_options)
+                .execution_options(populate_existing=True)
+            )
+        except IntegrityError: # noqa
+            await self._session.rollback()
+            raise await self._get_integrity_error(values)
+        if obj is None:
+            await self._session.rollback()
+            raise custom_exceptions.ObjectNotExistError(
+                model=self._model, obj_id=obj_id
+            )
         await self._session.commit()
-        await self._session.refresh(obj)
         return obj
 
-    async def delete(self, obj_id: int) -> None:
-        """Удаляет объект модели из БД по `id`."""
-        obj = await self.get_or_404(obj_id=obj_id)
-        await self._session.delete(obj)
+    async def delete(self, obj_id: int) -> ModelType:
+        """Удаляет объект модели из БД по `id` и возвращает его.
+
+        Объект удаляется одним запросом `DELETE ... RETURNING` без
+        загрузки связей: ссылки на него обнуляет сама БД (`ON DELETE`).
+        Возвращаемый объект содержит только собственные поля модели.
+
+        Аргументы:
+            obj_id: int - значение поля `id` записи в БД
+        """
+        obj = await self._session.scalar(
+            delete(self._model)
+            .where(self._model.id == obj_id)
+            .returning(self._model)
+        )
+        if obj is None:
+            await self._session.rollback()
+            raise custom_exceptions.ObjectNotExistError(
+                model=self._model, obj_id=obj_id
+            )
+        await self._session.commit()
+        return obj
+
+    async def update_many(
+        self,
+        filters: list[ColumnElement[bool]],
+        data: dict,
+        *returning: ColumnElement
+    ) -> list[Row]:
+        """Обновляет данные объектов модели, отобранных условиями.
+
+        Изменение выполняется одним запросом `UPDATE ... RETURNING`.
+        Возвращает значения полей `returning` (по умолчанию - `id`)
+        измененных записей.
+
+        Аргументы:
+            filters: list[ColumnElement[bool]] - условия отбора записей
+            data: dict - новые значения полей объектов
+            returning: ColumnElement - возвращаемые поля записей
+        """
+        values = self._get_column_values(data)
+        try:
+            result = await self._session.execute(
+                update(self._model)
+                .where(*filters)
+                .values(**values)
+                .returning(*(returning or (self._model.id,)))
+                .execution_options(synchronize_session=False)
+            )
+            rows = result.all()
+        except IntegrityError: # noqa
+            await self._session.rollback()
+            raise await self._get_integrity_error(values)
+        await self._session.commit()
+        return rows
+
+    async def delete_many(
+        self, filters: list[ColumnElement[bool]], *returning: ColumnElement
+    ) -> list[Row]:
+        """Удаляет из БД объекты модели, отобранные условиями.
+
+        Удаление выполняется одним запросом `DELETE ... RETURNING`.
+        Возвращает значения полей `returning` (по умолчанию - `id`)
+        удаленных записей.
+
+        Аргументы:
+            filters: list[ColumnElement[bool]] - условия отбора записей
+            returning: ColumnElement - возвращаемые поля записей
+        """
+        result = await self._session.execute(
+            delete(self._model)
+            .where(*filters)
+            .returning(*(returning or (self._model.id,)))
+            .execution_options(synchronize_session=False)
+        )
+        rows = result.all()
         await self._session.commit()
+        return rows
@@ -0,0 +1,104 @@
+from datetime import date
+from typing import Annotated
+
+from fastapi import Depends
+from sqlalchemy import ColumnElement, Row, Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.data_base.base import get_session
+from src.data_base.crud import BaseCRUD
+from src.data_base.models import Department, Position, Salary, User
+
+
+class PayrollCRUD(BaseCRUD):
+    """Класс для расчета сводных показателей фонда оплаты труда.
+
+    Показатели считаются агрегирующими запросами `GROUP BY` по работникам:
+    ответ содержит по одной строке на группу независимо от размера таблиц.
+    """
+
+    def __init__(
+        self, session: Annotated[AsyncSession, Depends(get_session)]
+    ) -> None:
+        super().__init__(session, User)
+
+    @staticmethod
+    def _get_report_query(
+        *group_columns: ColumnElement,
+        date_after: date | None = None,
+        date_before: date | None = None
+    ) -> Select:
+        """Возвращает запрос численности и сумм заработных плат по группам.
+
+        Без фильтров по дате учитываются все работники, в том числе
+        без заработной платы. С фильтрами - только работники, дата
+        повышения заработной платы которых попадает в интервал.
+
+        Аргументы:
+            group_columns: ColumnElement - поля группировки
+            date_after: date - нижняя граница даты повышения
+            date_before: date - верхняя граница даты повышения
+        """
+        query = (
+            select(
+                *group_columns,
+                func.count(User.id).label('headcount'),
+                func.count(Salary.id).label('salaried'),
+                func.coalesce(func.sum(Salary.amount), 0).label(
+                    'total_amount'
+                ),
+                func.round(func.avg(Salary.amount), 2).label(
+                    'average_amount'
+                )
+            )
+            .select_from(User)
+            .outerjoin(Salary, Salary.id == User.salary_id)
+            .group_by(*group_columns)
+        )
+        if date_after:
+            query = query.where(Salary.raise_date >= date_after)
+        if date_before:
+            query = query.where(Salary.raise_date <= date_before)
+        return query
+
+    async def get_by_department(self, **filters: date | None) -> list[Row]:
+        """Возвращает показатели по отделам, работники без отдела - в `null`.
+
+        Аргументы:
+            filters - границы даты повышения `date_after`, `date_before`
+        """
+        result = await self._session.execute(
+            self._get_report_query(
+                User.department_id.label('id'), Department.title, **filters
+            )
+            .outerjoin(Department, Department.id == User.department_id)
+            .order_by(User.department_id.nulls_last())
+        )
+        return result.all()
+
+    async def get_by_position(self, **filters: date | None) -> list[Row]:
+        """Возвращает показатели по должностям, без должности - в `null`.
+
+        Аргументы:
+            filters - границы даты повышения `date_after`, `date_before`
+        """
+        result = await self._session.execute(
+            self._get_report_query(
+                User.position_id.label('id'), Position.title, **filters
+            )
+            .outerjoin(Position, Position.id == User.position_id)
+            .order_by(User.position_id.nulls_last())
+        )
+        return result.all()
+
+    async def get_by_status(self, **filters: date | None) -> list[Row]:
+        """Возвращает показатели по статусам работников.
+
+        Аргументы:
+            filters - границы даты повышения `date_after`, `date_before`
+        """
+        result = await self._session.execute(
+            self._get_report_query(User.status, **filters)
+            .order_by(User.status)
+        )
+        return result.all()
@@ -2,6 +2,8 @@ from typing import Annotated
 
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import noload, selectinload
+from sqlalchemy.orm.interfaces import ORMOption
 
 from src.data_base.base import get_session
 from src.data_base.crud import BaseCRUD
@@ -11,6 +13,15 @@ from src.data_base.models import Position
 class PositionCRUD(BaseCRUD):
     """Класс для реализации CRUD модели `Position`."""
 
+    # Работники подгружаются отдельным запросом `IN`, без размножения строк
+    _response_options: tuple[ORMOption, ...] = (
+        selectinload(Position.employees),
+    )
+    _returning_options: tuple[ORMOption, ...] = _response_options
+    _insert_options: tuple[ORMOption, ...] = (
+        noload(Position.employees),
+    )
+
     def __init__(
         self, session: Annotated[AsyncSession, Depends(get_session)]
     ) -> None:
@@ -1,18 +1,47 @@
-from typing import Annotated
+from datetime import date
+from decimal import Decimal
+from typing import Annotated, AsyncIterator
 
 from fastapi import Depends
 from pydantic import FutureDate
-from sqlalchemy import select
+from sqlalchemy import (ColumnElement, Date, Select, cast, func, select,
+                        type_coerce, update)
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import contains_eager, joinedload, noload, selectinload
+from sqlalchemy.orm.interfaces import ORMOption
 
+from src.core.exc import custom_exceptions
 from src.data_base.base import get_session
 from src.data_base.crud import BaseCRUD
-from src.data_base.models import Salary
+from src.data_base.DTO_models import (PageDTO, SalaryAdjustmentDTO,
+                                      UpcomingRaisesBucketDTO)
+from src.data_base.fields import FieldTree
+from src.data_base.models import Department, Salary, User
+
+# Модификаторы функции `date()` SQLite, приводящие дату к началу периода:
+# в SQLite нет `date_trunc`, а неделя начинается с понедельника
+SQLITE_PERIOD_MODIFIERS: dict[str, tuple[str, ...]] = {
+    'week': ('-6 days', 'weekday 1'),
+    'month': ('start of month',),
+}
 
 
 class SalaryCRUD(BaseCRUD):
     """Класс для реализации CRUD модели `Salary`."""
 
+    _cursor_fields: tuple[str, ...] = ('raise_date', 'id')
+    # Связь "один к одному" подгружается тем же запросом через JOIN
+    _response_options: tuple[ORMOption, ...] = (
+        joinedload(Salary.employee),
+    )
+    _returning_options: tuple[ORMOption, ...] = (
+        selectinload(Salary.employee),
+    )
+    _insert_options: tuple[ORMOption, ...] = (
+        noload(Salary.employee),
+    )
+
     def __init__(
         self, session: Annotated[AsyncSession, Depends(get_session)]
     ) -> None:
@@ -20,18 +49,222 @@ class SalaryCRUD(BaseCRUD):
 
     async def get_all(
         self,
+        limit: int,
+        cursor: str | None = None,
         date_after: FutureDate | None = None,
-        date_before: FutureDate | None = None
-    ) -> list[Salary]:
-        """Возвращает список всех объектов модели.
+        date_before: FutureDate | None = None,
+        fields: FieldTree | None = None
+    ) -> PageDTO:
+        """Возвращает страницу списка объектов модели.
 
+        Записи отсортированы по дате повышения - от ближайшей к более поздней,
+        записи с одной датой - по `id`. Этот порядок совпадает с индексом
+        `ix_salary_raise_date_id`, поэтому страница читается диапазоном
+        индекса независимо от размера таблицы.
         При получении аргументов `date_before`, `date_after` -
         фильтрует результаты запросов по этим датам.
+        При выборе полей `fields` загружаются только они.
+        """
+        return await self._get_page(
+            self._get_date_query(date_after, date_before),
+            limit,
+            cursor,
+            fields=fields
+        )
+
+    def stream_all(
+        self,
+        date_after: FutureDate | None = None,
+        date_before: FutureDate | None = None,
+        fields: FieldTree | None = None
+    ) -> AsyncIterator[Salary]:
+        """Возвращает все объекты модели по одному без загрузки в память.
+
+        Порядок записей, фильтры по дате и выбор полей - как в `get_all`.
         """
+        return self._stream(
+            self._get_date_query(date_after, date_before), fields=fields
+        )
+
+    def _get_date_query(
+        self,
+        date_after: FutureDate | None = None,
+        date_before: FutureDate | None = None
+    ) -> Select:
+        """Возвращает запрос записей с датой повышения в интервале."""
         query = select(self._model)
         if date_after:
             query = query.filter(self._model.raise_date >= date_after)
         if date_before:
             query = query.filter(self._model.raise_date <= date_before)
-        objects = await self._session.scalars(query)
-        return objects.unique().all()
+        return query
+
+    @staticmethod
+    def _get_adjustment_filters(
+        department_id: int | None = None,
+        position_id: int | None = None,
+        ids: list[int] | None = None
+    ) -> list[ColumnElement[bool]]:
+        """Возвращает условия отбора заработных плат для изменения.
+
+        Отбор по отделу и должности добавляет в запрос таблицу работников.
+
+        Аргументы:
+            department_id: int - `id` отдела работников
+            position_id: int - `id` должности работников
+            ids: list[int] - список `id` заработных плат
+        """
+        filters: list[ColumnElement[bool]] = []
+        if ids:
+            filters.append(Salary.id.in_(ids))
+        if department_id or position_id:
+            filters.append(Salary.id == User.salary_id)
+        if department_id:
+            filters.append(User.department_id == department_id)
+        if position_id:
+            filters.append(User.position_id == position_id)
+        return filters
+
+    @staticmethod
+    def _get_adjusted_amount(
+        percent: Decimal | None = None, delta: Decimal | None = None
+    ) -> ColumnElement[Decimal]:
+        """Возвращает SQL-выражение для нового размера заработной платы.
+
+        Аргументы:
+            percent: Decimal - изменение в процентах
+            delta: Decimal - изменение на фиксированную сумму
+        """
+        if percent is not None:
+            return func.round(Salary.amount * (1 + percent / 100), 2)
+        return Salary.amount + delta
+
+    async def adjust(
+        self,
+        raise_date: date,
+        percent: Decimal | None = None,
+        delta: Decimal | None = None,
+        **filters: int | list[int] | None
+    ) -> SalaryAdjustmentDTO:
+        """Изменяет размер и дату повышения отобранных заработных плат.
+
+        Изменение выполняется одним запросом `UPDATE salary ... FROM user`.
+
+        Аргументы:
+            raise_date: date - новая дата повышения
+            percent: Decimal - изменение в процентах
+            delta: Decimal - изменение на фиксированную сумму
+            filters - условия отбора `department_id`, `position_id`, `ids`
+        """
+        try:
+            result = await self._session.execute(
+                update(Salary)
+                .where(*self._get_adjustment_filters(**filters))
+                .values(
+                    amount=self._get_adjusted_amount(percent, delta),
+                    raise_date=raise_date
+                )
+                .execution_options(synchronize_session=False)
+            )
+        except IntegrityError: # noqa
+            await self._session.rollback()
+            raise custom_exceptions.SalaryAdjustmentError
+        await self._session.commit()
+        return SalaryAdjustmentDTO(affected=result.rowcount)
+
+    async def get_adjustment_totals(
+        self,
+        percent: Decimal | None = None,
+        delta: Decimal | None = None,
+        **filters: int | list[int] | None
+    ) -> SalaryAdjustmentDTO:
+        """Возвращает итоги изменения заработных плат без его выполнения.
+
+        Итоги считаются одним агрегирующим запросом.
+
+        Аргументы:
+            percent: Decimal - изменение в процентах
+            delta: Decimal - изменение на фиксированную сумму
+            filters - условия отбора `department_id`, `position_id`, `ids`
+        """
+        result = await self._session.execute(
+            select(
+                func.count(Salary.id),
+                func.sum(Salary.amount),
+                func.sum(self._get_adjusted_amount(percent, delta))
+            ).where(*self._get_adjustment_filters(**filters))
+        )
+        return SalaryAdjustmentDTO(*result.one())
+
+    def _get_period_start(self, period: str) -> ColumnElement[date]:
+        """Возвращает SQL-выражение для начала периода даты повышения.
+
+        Аргументы:
+            period: str - период группировки (`week` или `month`)
+        """
+        if self._session.get_bind().dialect.name == 'sqlite':
+            return type_coerce(
+                func.date(Salary.raise_date, *SQLITE_PERIOD_MODIFIERS[period]),
+                Date
+            )
+        return cast(func.date_trunc(period, Salary.raise_date), Date)
+
+    async def get_upcoming_raises(
+        self,
+        date_from: date,
+        date_to: date,
+        period: str,
+        counts_only: bool = False
+    ) -> list[UpcomingRaisesBucketDTO]:
+        """Возвращает повышения заработных плат работников за интервал дат.
+
+        Повышения сгруппированы в SQL по периоду и отделу работника,
+        записи отбираются диапазоном индекса `ix_salary_raise_date_id`.
+        Без `counts_only` вторым запросом загружаются сами записи
+        с ключом группы, вычисленным тем же SQL-выражением.
+
+        Аргументы:
+            date_from: date - нижняя граница даты повышения
+            date_to: date - верхняя граница даты повышения
+            period: str - период группировки (`week` или `month`)
+            counts_only: bool - вернуть только количество и сумму
+        """
+        period_start = self._get_period_start(period).label('period_start')
+        in_range = Salary.raise_date.between(date_from, date_to)
+        result = await self._session.execute(
+            select(
+                period_start,
+                User.department_id,
+                Department.title,
+                func.count(Salary.id),
+                func.sum(Salary.amount)
+            )
+            .join(User, User.salary_id == Salary.id)
+            .outerjoin(Department, Department.id == User.department_id)
+            .where(in_range)
+            .group_by(period_start, User.department_id, Department.title)
+            .order_by(period_start, User.department_id.nulls_last())
+        )
+        buckets = [
+            UpcomingRaisesBucketDTO(*row, salaries=None if counts_only else [])
+            for row in result
+        ]
+        if counts_only:
+            return buckets
+        groups = {
+            (bucket.period_start, bucket.department_id): bucket.salaries
+            for bucket in buckets
+        }
+        result = await self._session.execute(
+            select(Salary, period_start, User.department_id)
+            .join(Salary.employee)
+            .options(contains_eager(Salary.employee))
+            .where(in_range)
+            .order_by(Salary.raise_date, Salary.id)
+        )
+        for salary, salary_period_start, department_id in result:
+            # Запись, добавленная между запросами, не попадает в календарь
+            group = groups.get((salary_period_start, department_id))
+            if group is not None:
+                group.append(salary)
+        return buckets
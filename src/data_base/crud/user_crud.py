@@ -1,38 +1,209 @@
-from typing import Annotated
+from typing import Annotated, AsyncIterator
 
 from fastapi import Depends
-from sqlalchemy import select
+from sqlalchemy import ColumnElement, Row, Select, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm.interfaces import ORMOption
 
 from src.core.exc import custom_exceptions
 from src.data_base.base import get_session
 from src.data_base.crud import BaseCRUD
-from src.data_base.models import User
+from src.data_base.DTO_models import (CredentialsDTO, PageDTO, PrincipalDTO,
+                                      SalaryShortDTO, TitledDTO, UserReadDTO)
+from src.data_base.fields import FieldTree
+from src.data_base.models import Department, Position, Salary, User
 
 
 class UserCRUD(BaseCRUD):
     """Класс для реализации CRUD модели `User`."""
 
+    # Связи "многие к одному" подгружаются одним запросом через JOIN
+    _response_options: tuple[ORMOption, ...] = (
+        joinedload(User.department),
+        joinedload(User.position),
+        joinedload(User.salary),
+    )
+    _returning_options: tuple[ORMOption, ...] = (
+        selectinload(User.department),
+        selectinload(User.position),
+        selectinload(User.salary),
+    )
+    _insert_options: tuple[ORMOption, ...] = _returning_options
+
     def __init__(
         self, session: Annotated[AsyncSession, Depends(get_session)]
     ) -> None:
         super().__init__(session, User)
 
-    async def get_by_username(self, username: str) -> User:
-        """Получает из БД работника по его `username`.
+    @staticmethod
+    def _get_read_query() -> Select:
+        """Возвращает запрос полей работника, необходимых схеме ответа.
+
+        Отдел, должность и заработная плата присоединяются тем же запросом,
+        пароль и служебные поля не запрашиваются.
+        """
+        return (
+            select(
+                User.id,
+                User.first_name,
+                User.last_name,
+                User.username,
+                User.date_of_birth,
+                User.is_blocked,
+                User.status,
+                Department.id,
+                Department.title,
+                Position.id,
+                Position.title,
+                Salary.id,
+                Salary.amount,
+                Salary.raise_date
+            )
+            .select_from(User)
+            .outerjoin(Department, Department.id == User.department_id)
+            .outerjoin(Position, Position.id == User.position_id)
+            .outerjoin(Salary, Salary.id == User.salary_id)
+        )
+
+    @staticmethod
+    def _to_read_dto(row: Row) -> UserReadDTO:
+        """Преобразует строку запроса `_get_read_query` в DTO работника."""
+        (
+            *user_fields,
+            department_id, department_title,
+            position_id, position_title,
+            salary_id, amount, raise_date
+        ) = row
+        return UserReadDTO(
+            *user_fields,
+            department=(
+                TitledDTO(department_id, department_title)
+                if department_id is not None else None
+            ),
+            position=(
+                TitledDTO(position_id, position_title)
+                if position_id is not None else None
+            ),
+            salary=(
+                SalaryShortDTO(salary_id, amount, raise_date)
+                if salary_id is not None else None
+            )
+        )
+
+    async def get_all(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        fields: FieldTree | None = None
+    ) -> PageDTO:
+        """Возвращает страницу списка работников.
 
-        В случае отсутствия бросает ошибку.
+        Работники читаются проекцией полей схемы ответа, без создания
+        и отслеживания ORM-объектов. При выборе полей `fields`
+        запрашиваются только они и только нужные для них связи.
+
+        Аргументы:
+            limit: int - количество записей на странице
+            cursor: str - курсор, полученный на предыдущей странице
+            fields: FieldTree - выбранные поля ответа
+        """
+        if fields is not None:
+            return await super().get_all(limit, cursor, fields)
+        return await self._get_page(
+            self._get_read_query(), limit, cursor, self._to_read_dto
+        )
+
+    def stream_all(
+        self, fields: FieldTree | None = None
+    ) -> AsyncIterator[User | UserReadDTO]:
+        """Возвращает всех работников по одному без загрузки в память."""
+        if fields is not None:
+            return super().stream_all(fields)
+        return self._stream(self._get_read_query(), self._to_read_dto)
+
+    async def get_read_or_404(
+        self, obj_id: int, fields: FieldTree | None = None
+    ) -> User | UserReadDTO:
+        """Возвращает работника для чтения по `id` или ошибку `404`.
+
+        Аргументы:
+            obj_id: int - значение поля `id` записи в БД
+            fields: FieldTree - выбранные поля ответа
+        """
+        if fields is not None:
+            return await self.get_or_404(obj_id, fields)
+        result = await self._session.execute(
+            self._get_read_query().where(User.id == obj_id)
+        )
+        row = result.first()
+        if not row:
+            raise custom_exceptions.ObjectNotExistError(
+                model=self._model, obj_id=obj_id
+            )
+        return self._to_read_dto(row)
+
+    def _get_principal_query(self, *columns: ColumnElement) -> Select:
+        """Возвращает запрос полей работника для проверки прав доступа.
+
+        Аргументы:
+            columns: ColumnElement - дополнительные поля работника.
+        """
+        return select(
+            self._model.id,
+            self._model.username,
+            self._model.status,
+            self._model.is_blocked,
+            self._model.token_version,
+            *columns
+        )
+
+    async def get_credentials(self, username: str) -> CredentialsDTO:
+        """Получает из БД данные работника для входа по его `username`.
+
+        Запрашивает только поля для проверки прав доступа и хеш пароля,
+        без связанных моделей. В случае отсутствия бросает ошибку.
 
         Аргументы:
             username: str - никнейм/логин работника.
         """
-        user = await self._session.scalars(
-            select(self._model).where(self._model.username == username)
+        result = await self._session.execute(
+            self._get_principal_query(self._model.password)
+            .where(self._model.username == username)
         )
-        user = user.first()
-        if not user:
+        row = result.first()
+        if not row:
             raise custom_exceptions.UserNotFoundError
-        return user
+        return CredentialsDTO(*row)
+
+    async def get_principal(self, username: str) -> PrincipalDTO | None:
+        """Получает из БД данные работника для проверки прав доступа.
+
+        Запрашивает только необходимые поля, без связанных моделей.
+
+        Аргументы:
+            username: str - никнейм/логин работника.
+        """
+        result = await self._session.execute(
+            self._get_principal_query()
+            .where(self._model.username == username)
+        )
+        row = result.first()
+        if not row:
+            return None
+        return PrincipalDTO(*row)
+
+    async def get_existing_usernames(self, usernames: list[str]) -> set[str]:
+        """Возвращает те из `username`, что уже заняты в БД.
+
+        Аргументы:
+            usernames: list[str] - проверяемые никнеймы/логины работников.
+        """
+        existing = await self._session.scalars(
+            select(self._model.username)
+            .where(self._model.username.in_(usernames))
+        )
+        return set(existing.all())
 
     async def is_user_exists(
         self, username: str, statuses: list[User.Status] | None = None
@@ -43,23 +214,32 @@ class UserCRUD(BaseCRUD):
             username: str - никнейм/логин пользователя
             statuses: list[User.Status] - список статусов пользователя
         """
-        query = select(self._model).where(self._model.username == username)
+        query = select(self._model.id).where(
+            self._model.username == username
+        )
         if statuses:
             query = query.where(self._model.status.in_(statuses))
         user_exists = await self._session.scalars(select(query.exists()))
         return user_exists.first()
 
-    async def update_by_obj(self, obj: User, data: dict | None = None) -> User:
-        """Обновляет данные полученного объекта модели в БД.
+    @staticmethod
+    def get_selection_filters(
+        ids: list[int] | None = None,
+        department_id: int | None = None,
+        position_id: int | None = None
+    ) -> list[ColumnElement[bool]]:
+        """Возвращает условия отбора работников для массовых операций.
 
         Аргументы:
-            obj: User - объект данных пользователя
-            data: dict - данные пользователя
+            ids: list[int] - список `id` работников
+            department_id: int - `id` отдела работников
+            position_id: int - `id` должности работников
         """
-        if data:
-            for key, value in data.items():
-                setattr(obj, key, value)
-        self._session.add(obj)
-        await self._session.commit()
-        await self._session.refresh(obj)
-        return obj
+        filters: list[ColumnElement[bool]] = []
+        if ids:
+            filters.append(User.id.in_(ids))
+        if department_id:
+            filters.append(User.department_id == department_id)
+        if position_id:
+            filters.append(User.position_id == position_id)
+        return filters
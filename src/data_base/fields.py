@@ -0,0 +1,44 @@
+from sqlalchemy import inspect
+from sqlalchemy.orm import joinedload, load_only, selectinload
+from sqlalchemy.orm.interfaces import ORMOption
+
+# Выбранные поля ответа: имя поля и выбранные поля вложенного объекта
+# (`None` для простого поля) в порядке объявления полей схемы ответа
+FieldTree = tuple[tuple[str, 'FieldTree | None'], ...]
+
+
+def get_load_options(
+    model: type, fields: FieldTree, required: tuple[str, ...] = ()
+) -> tuple[ORMOption, ...]:
+    """Возвращает стратегии загрузки только выбранных полей модели.
+
+    Запрашиваются выбранные столбцы модели, связи присоединяются
+    только выбранные: "многие к одному" - через JOIN, коллекции -
+    отдельным запросом `IN`. Обращение к незагруженному полю
+    бросает ошибку, а не выполняет скрытый запрос.
+
+    Аргументы:
+        model: type - модель БД
+        fields: FieldTree - выбранные поля ответа
+        required: tuple[str, ...] - поля, загружаемые всегда
+            (например, ключ пагинации)
+    """
+    mapper = inspect(model)
+    names = dict.fromkeys((
+        *(column.key for column in mapper.primary_key),
+        *required,
+        *(name for name, _ in fields)
+    ))
+    columns = [
+        getattr(model, name) for name in names if name in mapper.column_attrs
+    ]
+    options: list[ORMOption] = [load_only(*columns, raiseload=True)]
+    for name, subfields in fields:
+        relationship = mapper.relationships.get(name)
+        if relationship is None:
+            continue
+        loader = selectinload if relationship.uselist else joinedload
+        options.append(loader(getattr(model, name)).options(
+            *get_load_options(relationship.mapper.class_, subfields)
+        ))
+    return tuple(options)
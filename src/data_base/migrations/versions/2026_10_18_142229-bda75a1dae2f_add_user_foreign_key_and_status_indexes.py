@@ -0,0 +1,40 @@
+"""Add user foreign key and status indexes
+
+Revision ID: bda75a1dae2f
+Revises: d7dab3d7fffb
+Create Date: 2026-10-18 14:22:29.074423
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'bda75a1dae2f'
+down_revision = 'd7dab3d7fffb'
+branch_labels = None
+depends_on = None
+
+USER_INDEXED_COLUMNS = ('department_id', 'position_id', 'salary_id', 'status')
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY не блокирует запись в таблицу, но не может
+    # выполняться внутри транзакции
+    with op.get_context().autocommit_block():
+        for column in USER_INDEXED_COLUMNS:
+            op.create_index(
+                op.f('ix_user_{}'.format(column)),
+                'user',
+                [column],
+                unique=False,
+                postgresql_concurrently=True
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for column in USER_INDEXED_COLUMNS:
+            op.drop_index(
+                op.f('ix_user_{}'.format(column)),
+                table_name='user',
+                postgresql_concurrently=True
+            )
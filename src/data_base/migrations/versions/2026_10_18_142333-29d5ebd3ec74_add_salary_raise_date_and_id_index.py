@@ -0,0 +1,48 @@
+"""Add salary raise date and id index
+
+Revision ID: 29d5ebd3ec74
+Revises: bda75a1dae2f
+Create Date: 2026-10-18 14:23:33.951644
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '29d5ebd3ec74'
+down_revision = 'bda75a1dae2f'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Составной индекс покрывает и поиск по raise_date, поэтому
+    # индекс по одной колонке удаляется после создания нового
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_salary_raise_date_id',
+            'salary',
+            ['raise_date', 'id'],
+            unique=False,
+            postgresql_concurrently=True
+        )
+        op.drop_index(
+            op.f('ix_salary_raise_date'),
+            table_name='salary',
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f('ix_salary_raise_date'),
+            'salary',
+            ['raise_date'],
+            unique=False,
+            postgresql_concurrently=True
+        )
+        op.drop_index(
+            'ix_salary_raise_date_id',
+            table_name='salary',
+            postgresql_concurrently=True
+        )
@@ -0,0 +1,38 @@
+"""Add updated_at indexes
+
+Revision ID: 437f122317b3
+Revises: 29d5ebd3ec74
+Create Date: 2026-10-18 14:44:12.318205
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '437f122317b3'
+down_revision = '29d5ebd3ec74'
+branch_labels = None
+depends_on = None
+
+TABLES: tuple[str, ...] = ('department', 'position', 'salary', 'user')
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table in TABLES:
+            op.create_index(
+                op.f('ix_{}_updated_at'.format(table)),
+                table,
+                ['updated_at'],
+                unique=False,
+                postgresql_concurrently=True
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table in TABLES:
+            op.drop_index(
+                op.f('ix_{}_updated_at'.format(table)),
+                table_name=table,
+                postgresql_concurrently=True
+            )
@@ -1,15 +1,45 @@
 import enum
 from datetime import date, datetime
 
-from sqlalchemy import (TIMESTAMP, CheckConstraint, Enum, ForeignKey, Numeric,
-                        String, func)
+from sqlalchemy import (TIMESTAMP, CheckConstraint, Enum, ForeignKey, Index,
+                        Numeric, String, func)
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import (Mapped, as_declarative, declared_attr,
                             mapped_column, relationship)
+from sqlalchemy.sql.functions import FunctionElement
+
+
+class precise_timestamp(FunctionElement):
+    """Текущее время с долями секунды.
+
+    `CURRENT_TIMESTAMP` в SQLite отбрасывает доли секунды, и несколько
+    изменений записи за одну секунду дали бы одинаковый `updated_at`,
+    по которому вычисляется ETag списков.
+    """
+
+    type = TIMESTAMP()
+    inherit_cache = True
+
+
+@compiles(precise_timestamp)
+def compile_precise_timestamp(element, compiler, **kwargs) -> str:
+    return 'CURRENT_TIMESTAMP'
+
+
+@compiles(precise_timestamp, 'sqlite')
+def compile_sqlite_precise_timestamp(element, compiler, **kwargs) -> str:
+    return "strftime('%Y-%m-%d %H:%M:%f', 'now')"
 
 
 @as_declarative()
 class Base:
-    """Базовая модель."""
+    """Базовая модель.
+
+    Связи моделей не загружаются неявно (`lazy='raise'`): каждый запрос
+    CRUD-слоя явно указывает стратегии загрузки, нужные схеме ответа.
+    Ссылки на удаляемую запись обнуляет сама БД (`ON DELETE SET NULL`),
+    поэтому связи "один ко многим" объявлены с `passive_deletes=True`.
+    """
 
     @declared_attr
     def __tablename__(cls): # noqa
@@ -20,10 +50,13 @@ class Base:
         TIMESTAMP(),
         server_default=func.current_timestamp(),
     )
+    # Индекс позволяет получить max(updated_at) для ETag списков
+    # без чтения таблицы
     updated_at: Mapped[datetime] = mapped_column(
         TIMESTAMP(),
         server_default=func.current_timestamp(),
-        onupdate=func.current_timestamp(),
+        onupdate=precise_timestamp(),
+        index=True,
     )
 
 
@@ -51,27 +84,35 @@ class User(Base):
             Status,
             name='user_status',
             values_callable=lambda obj: [e.value for e in obj],
-        ), server_default=Status.EMPLOYEE.value
+        ), server_default=Status.EMPLOYEE.value, index=True
     )
     is_blocked: Mapped[bool] = mapped_column(default=True)
+    # Версия токенов доступа: увеличивается при блокировке, смене статуса
+    # или пароля, после чего ранее выданные токены считаются отозванными
+    token_version: Mapped[int] = mapped_column(default=0, server_default='0')
     department_id: Mapped[int] = mapped_column(
-        ForeignKey('department.id', ondelete='SET NULL'), nullable=True
+        ForeignKey('department.id', ondelete='SET NULL'),
+        nullable=True,
+        index=True
     )
     department: Mapped['Department'] = relationship(
-        back_populates='employees', lazy='joined'
+        back_populates='employees', lazy='raise'
     )
     position_id: Mapped[int] = mapped_column(
-        ForeignKey('position.id', ondelete='SET NULL'), nullable=True
+        ForeignKey('position.id', ondelete='SET NULL'),
+        nullable=True,
+        index=True
     )
     position: Mapped['Position'] = relationship(
-        back_populates='employees', lazy='joined'
+        back_populates='employees', lazy='raise'
     )
     salary_id: Mapped[int] = mapped_column(
         ForeignKey('salary.id', ondelete='SET NULL'),
-        nullable=True
+        nullable=True,
+        index=True
     )
     salary: Mapped['Salary'] = relationship(
-        back_populates='employee', lazy='joined'
+        back_populates='employee', lazy='raise'
     )
 
 
@@ -80,14 +121,16 @@ class Salary(Base):
 
     __table_args__ = (
         CheckConstraint('raise_date >= {}'.format(func.current_timestamp())),
+        # Ключ пагинации списка: страницы читаются по индексу без сортировки
+        Index('ix_salary_raise_date_id', 'raise_date', 'id'),
     )
 
     amount: Mapped[float] = mapped_column(
         Numeric(9, 2), CheckConstraint('amount > 0')
     )
-    raise_date: Mapped[date] = mapped_column(index=True)
+    raise_date: Mapped[date]
     employee: Mapped['User'] = relationship(
-        back_populates='salary', lazy='joined'
+        back_populates='salary', lazy='raise', passive_deletes=True
     )
 
 
@@ -95,7 +138,7 @@ class Department(Base):
 
     title: Mapped[str] = mapped_column(String(length=256), unique=True)
     employees: Mapped[list['User']] = relationship(
-        back_populates='department', lazy='joined'
+        back_populates='department', lazy='raise', passive_deletes=True
     )
 
 
@@ -103,5 +146,5 @@ class Position(Base):
 
     title: Mapped[str] = mapped_column(String(length=100), unique=True)
     employees: Mapped[list['User']] = relationship(
-        back_populates='position', lazy='joined'
+        back_populates='position', lazy='raise', passive_deletes=True
     )
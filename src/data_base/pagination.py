@@ -0,0 +1,70 @@
+import binascii
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import date
+from typing import Any
+
+from sqlalchemy.orm import InstrumentedAttribute
+
+from src.core.exc import custom_exceptions
+
+# Границы значений целочисленных полей ключа (знаковое 64-битное целое)
+BIGINT_MIN: int = -2 ** 63
+BIGINT_MAX: int = 2 ** 63 - 1
+
+
+def encode_cursor(*values: Any) -> str:
+    """Кодирует значения ключа последней записи страницы в курсор.
+
+    Курсор непрозрачен для клиента: это `base64` от JSON-массива значений.
+
+    Аргументы:
+        values: Any - значения полей ключа пагинации
+    """
+    raw = json.dumps([
+        value.isoformat() if isinstance(value, date) else value
+        for value in values
+    ])
+    return urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_value(value: Any, column: InstrumentedAttribute) -> Any:
+    """Преобразует значение из курсора к типу поля ключа пагинации.
+
+    Для целочисленного поля допускается только целое число JSON
+    в пределах знакового 64-битного целого. В случае некорректного
+    значения бросает `ValueError` или `TypeError`.
+
+    Аргументы:
+        value: Any - значение из JSON-массива курсора
+        column: InstrumentedAttribute - поле ключа пагинации
+    """
+    if column.type.python_type is date:
+        return date.fromisoformat(value)
+    if type(value) is not int or not BIGINT_MIN <= value <= BIGINT_MAX:
+        raise ValueError
+    return value
+
+
+def decode_cursor(
+    cursor: str, columns: list[InstrumentedAttribute]
+) -> tuple[Any, ...]:
+    """Декодирует курсор в значения полей ключа пагинации.
+
+    В случае некорректного курсора бросает ошибку.
+
+    Аргументы:
+        cursor: str - курсор, полученный клиентом на предыдущей странице
+        columns: list[InstrumentedAttribute] - поля ключа пагинации
+    """
+    try:
+        raw = urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        values = json.loads(raw)
+        if not isinstance(values, list) or len(values) != len(columns):
+            raise ValueError
+        return tuple(
+            decode_value(value, column)
+            for column, value in zip(columns, values)
+        )
+    except (binascii.Error, ValueError, TypeError, OverflowError):
+        raise custom_exceptions.InvalidCursorError
@@ -6,18 +6,23 @@ from typing import AsyncGenerator
 import pytest
 from fastapi import FastAPI
 from httpx import AsyncClient
-from sqlalchemy import MetaData
+from sqlalchemy import MetaData, event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import NullPool
 
 from src.api_main import create_application
-from src.core.services.authentication_service import AuthenticationService
+from src.core.services.admission import (LOGIN_IP_RATE_LIMITER,
+                                         LOGIN_USERNAME_RATE_LIMITER)
+from src.core.services.authentication_service import (PRINCIPAL_CACHE,
+                                                      TOKEN_CACHE,
+                                                      AuthenticationService)
 from src.core.services.permissions import (is_administrator,
                                            is_administrator_or_staff,
                                            is_user_authenticated)
 from src.core.settings import settings
-from src.data_base.base import get_session
+from src.data_base.base import enable_sqlite_foreign_keys, get_session
+from src.data_base.crud.base_crud import VERSION_CACHE
 from src.data_base.models import Base, Department, Position, Salary, User
 
 database_url_test: str = settings.get_test_base_url
@@ -32,6 +37,10 @@ metadata: MetaData = Base.metadata
 base_url: str = 'http://test/api/v1'
 
 engine_test = create_async_engine(database_url_test, poolclass=NullPool)
+if settings.DEVELOPMENT:
+    event.listen(
+        engine_test.sync_engine, 'connect', enable_sqlite_foreign_keys
+    )
 async_session_maker = sessionmaker(
     engine_test, class_=AsyncSession, expire_on_commit=False
 )
@@ -45,9 +54,9 @@ def dependency_overrides(func):
         app.dependency_overrides[is_administrator] = lambda: None
         app.dependency_overrides[is_administrator_or_staff] = lambda: None
         await func(*args, **kwargs)
-        app.dependency_overrides[is_user_authenticated] = {}
-        app.dependency_overrides[is_administrator] = {}
-        app.dependency_overrides[is_administrator_or_staff] = {}
+        app.dependency_overrides.pop(is_user_authenticated)
+        app.dependency_overrides.pop(is_administrator)
+        app.dependency_overrides.pop(is_administrator_or_staff)
     return wrap
 
 
@@ -100,8 +109,17 @@ async def create_auth_needs_data():
         status='employee',
         is_blocked=False
     )
+    target = User(
+        first_name='Петр',
+        last_name='Петров',
+        username='target',
+        password=AuthenticationService.get_password_hash('12345678'),
+        date_of_birth=date(1993, 5, 17),
+        status='employee',
+        is_blocked=False
+    )
     async with async_session_maker() as session:
-        session.add_all([admin, staff, employee])
+        session.add_all([admin, staff, employee, target])
         await session.commit()
 
 
@@ -135,6 +153,11 @@ async def prepare_database():
     yield
     async with engine_test.begin() as conn:
         await conn.run_sync(metadata.drop_all)
+    TOKEN_CACHE.clear()
+    PRINCIPAL_CACHE.clear()
+    VERSION_CACHE.clear()
+    LOGIN_USERNAME_RATE_LIMITER.clear()
+    LOGIN_IP_RATE_LIMITER.clear()
 
 
 @pytest.fixture(scope='session')
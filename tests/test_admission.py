@@ -0,0 +1,92 @@
+import asyncio
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from uvicorn.middleware.proxy_headers import ProxyHeadersMiddleware
+
+from src.core.exc.custom_exceptions import TooManyRequestsError
+from src.core.services.admission import (LOGIN_IP_RATE_LIMITER,
+                                         LOGIN_USERNAME_RATE_LIMITER,
+                                         ConcurrencyLimiter, RateLimiter)
+
+from .conftest import app, base_url, dependency_overrides
+
+# Адрес контейнера nginx из infra/docker-compose.main.yaml
+NGINX_IP: str = '172.28.0.10'
+
+
+def test_rate_limiter_allows_burst_then_rejects():
+    limiter = RateLimiter(capacity=2, per_minute=1, max_keys=10)
+    limiter.check('user')
+    limiter.check('user')
+    with pytest.raises(TooManyRequestsError) as error:
+        limiter.check('user')
+    assert int(error.value.headers['Retry-After']) > 0
+    limiter.check('another')
+    assert limiter.rejected == 1
+
+
+async def test_concurrency_limiter_rejects_when_queue_is_full():
+    limiter = ConcurrencyLimiter(
+        max_concurrency=1, queue_size=1, retry_after=3
+    )
+    release = asyncio.Event()
+
+    async def operation():
+        async with limiter.acquire():
+            await release.wait()
+
+    first = asyncio.create_task(operation())
+    second = asyncio.create_task(operation())
+    await asyncio.sleep(0)
+    assert (limiter.active, limiter.waiting) == (1, 1)
+    with pytest.raises(TooManyRequestsError) as error:
+        await operation()
+    assert error.value.headers == {'Retry-After': '3'}
+    release.set()
+    await asyncio.gather(first, second)
+    assert (limiter.active, limiter.waiting, limiter.rejected) == (0, 0, 1)
+
+
+@dependency_overrides
+async def test_login_rate_limited_by_username(
+    aclient: AsyncClient, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(LOGIN_USERNAME_RATE_LIMITER, 'capacity', 1)
+    LOGIN_USERNAME_RATE_LIMITER.clear()
+    data = {'username': 'stuffing', 'password': '12345678'}
+    response = await aclient.post('/employees/login/', json=data)
+    assert response.status_code == 404
+    response = await aclient.post('/employees/login/', json=data)
+    assert response.status_code == 429
+    assert int(response.headers['Retry-After']) > 0
+    response = await aclient.get('/metrics/')
+    assert response.status_code == 200
+    assert response.json()['login']['rejected_username_rate'] == 1
+    assert response.json()['login']['queue_depth'] == 0
+
+
+@dependency_overrides
+async def test_spoofed_forwarded_for_does_not_reset_ip_bucket(
+    monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(LOGIN_IP_RATE_LIMITER, 'capacity', 2)
+    LOGIN_IP_RATE_LIMITER.clear()
+    LOGIN_USERNAME_RATE_LIMITER.clear()
+    proxied_app = ProxyHeadersMiddleware(app, trusted_hosts=NGINX_IP)
+    transport = ASGITransport(app=proxied_app, client=(NGINX_IP, 80))
+    async with AsyncClient(transport=transport, base_url=base_url) as client:
+        for attempt in range(3):
+            response = await client.post(
+                '/employees/login/',
+                json={'username': f'spoofer{attempt}', 'password': '12345678'},
+                headers={'X-Forwarded-For': f'10.0.0.{attempt}, 203.0.113.7'}
+            )
+        assert response.status_code == 429
+        response = await client.post(
+            '/employees/login/',
+            json={'username': 'spoofer', 'password': '12345678'},
+            headers={'X-Forwarded-For': '198.51.100.1'}
+        )
+        assert response.status_code == 404
+    LOGIN_IP_RATE_LIMITER.clear()
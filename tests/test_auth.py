@@ -111,7 +111,7 @@ async def test_auth_staff_access_secondary_obj(
         'Authorization': 'Bearer {}'.format(get_tokens['staff'])
     })
     assert response.status_code == 200
-    url = url + str(response.json()[0]['id']) + '/'
+    url = url + str(response.json()['items'][0]['id']) + '/'
     response = await aclient.get(url, headers={
         'Authorization': 'Bearer {}'.format(get_tokens['staff'])
     })
@@ -157,7 +157,7 @@ async def test_auth_admin_access_secondary_obj(
     response = await aclient.get(url, headers={
         'Authorization': 'Bearer {}'.format(get_tokens['admin'])
     })
-    url = url + str(response.json()[0]['id']) + '/'
+    url = url + str(response.json()['items'][0]['id']) + '/'
     assert response.status_code == 200
     response = await aclient.get(url, headers={
         'Authorization': 'Bearer {}'.format(get_tokens['admin'])
@@ -281,17 +281,17 @@ async def test_auth_update_user_status_by_id(
 async def test_auth_block_user_by_id(
     aclient: AsyncClient, get_tokens: dict
 ):
-    response = await aclient.get('/employees/1/block/')
+    response = await aclient.get('/employees/4/block/')
     assert response.status_code == 403
-    response = await aclient.get('/employees/1/block/', headers={
+    response = await aclient.get('/employees/4/block/', headers={
         'Authorization': 'Bearer {}'.format(get_tokens['employee'])
     })
     assert response.status_code == 403
-    response = await aclient.get('/employees/1/block/', headers={
+    response = await aclient.get('/employees/4/block/', headers={
         'Authorization': 'Bearer {}'.format(get_tokens['staff'])
     })
     assert response.status_code == 200
-    response = await aclient.get('/employees/1/block/', headers={
+    response = await aclient.get('/employees/4/block/', headers={
         'Authorization': 'Bearer {}'.format(get_tokens['admin'])
     })
     assert response.status_code == 200
@@ -300,17 +300,17 @@ async def test_auth_block_user_by_id(
 async def test_auth_unblock_user_by_id(
     aclient: AsyncClient, get_tokens: dict
 ):
-    response = await aclient.get('/employees/1/unblock/')
+    response = await aclient.get('/employees/4/unblock/')
     assert response.status_code == 403
-    response = await aclient.get('/employees/1/unblock/', headers={
+    response = await aclient.get('/employees/4/unblock/', headers={
         'Authorization': 'Bearer {}'.format(get_tokens['employee'])
     })
     assert response.status_code == 403
-    response = await aclient.get('/employees/1/unblock/', headers={
+    response = await aclient.get('/employees/4/unblock/', headers={
         'Authorization': 'Bearer {}'.format(get_tokens['staff'])
     })
     assert response.status_code == 200
-    response = await aclient.get('/employees/1/unblock/', headers={
+    response = await aclient.get('/employees/4/unblock/', headers={
         'Authorization': 'Bearer {}'.format(get_tokens['admin'])
     })
     assert response.status_code == 200
@@ -323,10 +323,10 @@ async def test_auth_reset_user_password_by_id(
         'password': '123456789',
         'password_repeat': '123456789'
     }
-    response = await aclient.patch('/employees/1/password_reset/', json=data)
+    response = await aclient.patch('/employees/4/password_reset/', json=data)
     assert response.status_code == 403
     response = await aclient.patch(
-        '/employees/1/password_reset/',
+        '/employees/4/password_reset/',
         json=data,
         headers={
             'Authorization': 'Bearer {}'.format(get_tokens['employee'])
@@ -334,7 +334,7 @@ async def test_auth_reset_user_password_by_id(
     )
     assert response.status_code == 403
     response = await aclient.patch(
-        '/employees/1/password_reset/',
+        '/employees/4/password_reset/',
         json=data,
         headers={
             'Authorization': 'Bearer {}'.format(get_tokens['staff'])
@@ -342,7 +342,7 @@ async def test_auth_reset_user_password_by_id(
     )
     assert response.status_code == 403
     response = await aclient.patch(
-        '/employees/1/password_reset/',
+        '/employees/4/password_reset/',
         json=data,
         headers={
             'Authorization': 'Bearer {}'.format(get_tokens['admin'])
@@ -351,6 +351,29 @@ async def test_auth_reset_user_password_by_id(
     assert response.status_code == 200
 
 
+async def test_auth_password_reset_revokes_token(
+    aclient: AsyncClient, get_tokens: dict
+):
+    response = await aclient.post('/employees/login/', json={
+        'username': 'target',
+        'password': '123456789'
+    })
+    assert response.status_code == 200
+    headers = {
+        'Authorization': 'Bearer {}'.format(response.json()['access_token'])
+    }
+    response = await aclient.get('/employees/me/', headers=headers)
+    assert response.status_code == 200
+    response = await aclient.patch(
+        '/employees/4/password_reset/',
+        json={'password': '12345678', 'password_repeat': '12345678'},
+        headers={'Authorization': 'Bearer {}'.format(get_tokens['admin'])}
+    )
+    assert response.status_code == 200
+    response = await aclient.get('/employees/me/', headers=headers)
+    assert response.status_code == 401
+
+
 async def test_auth_delete_user_by_id(
     aclient: AsyncClient, get_tokens: dict
 ):
@@ -368,3 +391,69 @@ async def test_auth_delete_user_by_id(
         'Authorization': 'Bearer {}'.format(get_tokens['admin'])
     })
     assert response.status_code == 204
+
+
+async def test_auth_recreated_username_rejects_old_token(
+    aclient: AsyncClient, get_tokens: dict
+):
+    admin = {'Authorization': 'Bearer {}'.format(get_tokens['admin'])}
+    data = {
+        'first_name': 'Семен',
+        'last_name': 'Семенов',
+        'username': 'recreated',
+        'password': '12345678',
+        'password_repeat': '12345678',
+        'date_of_birth': '1991-02-03'
+    }
+    credentials = {'username': 'recreated', 'password': '12345678'}
+    response = await aclient.post('/employees/', json=data)
+    assert response.status_code == 201
+    old_id = response.json()['id']
+    response = await aclient.get(
+        '/employees/{}/unblock/'.format(old_id), headers=admin
+    )
+    assert response.status_code == 200
+    response = await aclient.post('/employees/login/', json=credentials)
+    assert response.status_code == 200
+    headers = {
+        'Authorization': 'Bearer {}'.format(response.json()['access_token'])
+    }
+    response = await aclient.post(
+        '/employees/', json=data | {'username': 'recreated_filler'}
+    )
+    assert response.status_code == 201
+    response = await aclient.delete(
+        '/employees/{}/'.format(old_id), headers=admin
+    )
+    assert response.status_code == 204
+    response = await aclient.post('/employees/', json=data)
+    assert response.status_code == 201
+    new_id = response.json()['id']
+    assert new_id != old_id
+    response = await aclient.get(
+        '/employees/{}/unblock/'.format(new_id), headers=admin
+    )
+    assert response.status_code == 200
+    response = await aclient.get('/employees/me/', headers=headers)
+    assert response.status_code == 401
+    response = await aclient.post('/employees/login/', json=credentials)
+    assert response.status_code == 200
+    response = await aclient.get('/employees/me/', headers={
+        'Authorization': 'Bearer {}'.format(response.json()['access_token'])
+    })
+    assert response.status_code == 200
+    assert response.json()['id'] == new_id
+
+
+async def test_auth_status_change_applies_immediately(
+    aclient: AsyncClient, get_tokens: dict
+):
+    headers = {'Authorization': 'Bearer {}'.format(get_tokens['admin'])}
+    response = await aclient.get('/employees/', headers=headers)
+    assert response.status_code == 200
+    response = await aclient.patch(
+        '/employees/1/status/', json={'status': 'employee'}, headers=headers
+    )
+    assert response.status_code == 200
+    response = await aclient.get('/employees/', headers=headers)
+    assert response.status_code == 401
@@ -0,0 +1,85 @@
+import time
+from datetime import datetime, timedelta
+
+import pytest
+from jose import jwt
+
+from src.core.cache import LRUCache
+from src.core.exc.custom_exceptions import UnauthorizedError
+from src.core.services.authentication_service import (ALGORITHM,
+                                                      PRINCIPAL_CACHE,
+                                                      TOKEN_CACHE,
+                                                      AuthenticationService)
+from src.core.settings import settings
+from src.data_base.DTO_models import PrincipalDTO
+from src.data_base.models import User
+
+
+class PrincipalCRUD:
+    """Заглушка CRUD, на время чтения которой кэш может быть сброшен."""
+
+    def __init__(self, invalidate: bool) -> None:
+        self.invalidate = invalidate
+
+    async def get_principal(self, username: str) -> PrincipalDTO:
+        if self.invalidate:
+            AuthenticationService.invalidate_principal(username)
+        return PrincipalDTO(
+            id=1,
+            username=username,
+            status=User.Status.EMPLOYEE,
+            is_blocked=False,
+            token_version=0
+        )
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(max_size=2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    assert cache.get('a') == 1
+    cache.set('c', 3)
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+    assert cache.stats == {'hits': 3, 'misses': 1, 'size': 2}
+
+
+def test_lru_cache_expires_entries():
+    cache = LRUCache(max_size=10, ttl=60)
+    cache.set('fresh', 1)
+    cache.set('stale', 2, expires_at=time.time() - 1)
+    assert cache.get('fresh') == 1
+    assert cache.get('stale') is None
+    assert len(cache) == 1
+
+
+def test_token_cache_hits_on_repeated_token():
+    token = jwt.encode(
+        {'username': 'cached', 'exp': datetime.utcnow() + timedelta(hours=1)},
+        settings.SECRET_KEY,
+        algorithm=ALGORITHM
+    )
+    TOKEN_CACHE.clear()
+    assert AuthenticationService.get_username_from_token(token) == 'cached'
+    assert AuthenticationService.get_username_from_token(token) == 'cached'
+    assert TOKEN_CACHE.stats == {'hits': 1, 'misses': 1, 'size': 1}
+
+
+def test_token_cache_skips_invalid_token():
+    TOKEN_CACHE.clear()
+    with pytest.raises(UnauthorizedError):
+        AuthenticationService.get_username_from_token('not.a.token')
+    assert len(TOKEN_CACHE) == 0
+
+
+async def test_principal_cache_skips_invalidated_read():
+    PRINCIPAL_CACHE.clear()
+    service = AuthenticationService(user_crud=PrincipalCRUD(invalidate=True))
+    principal = await service.get_principal('raced')
+    assert principal.username == 'raced'
+    assert PRINCIPAL_CACHE.get('raced') is None
+    service = AuthenticationService(user_crud=PrincipalCRUD(invalidate=False))
+    await service.get_principal('raced')
+    assert PRINCIPAL_CACHE.get('raced') is not None
+    PRINCIPAL_CACHE.clear()
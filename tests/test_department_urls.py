@@ -1,3 +1,5 @@
+from base64 import urlsafe_b64encode
+
 from httpx import AsyncClient
 
 from .conftest import dependency_overrides
@@ -7,7 +9,7 @@ from .conftest import dependency_overrides
 async def test_read_departments(aclient: AsyncClient):
     response = await aclient.get('/departments/')
     assert response.status_code == 200
-    assert response.json() == []
+    assert response.json() == {'items': [], 'next_cursor': None}
 
 
 @dependency_overrides
@@ -51,3 +53,61 @@ async def test_update_department(aclient: AsyncClient):
 async def test_delete_department(aclient: AsyncClient):
     response = await aclient.delete('/departments/1/')
     assert response.status_code == 204
+
+
+@dependency_overrides
+async def test_read_departments_by_pages(aclient: AsyncClient):
+    for title in ('Бухгалтерия', 'Склад', 'Охрана'):
+        response = await aclient.post('/departments/', json={'title': title})
+        assert response.status_code == 201
+    response = await aclient.get('/departments/', params={'limit': 2})
+    assert response.status_code == 200
+    page = response.json()
+    assert [obj['title'] for obj in page['items']] == [
+        'Бухгалтерия', 'Склад'
+    ]
+    assert page['next_cursor']
+    response = await aclient.get(
+        '/departments/',
+        params={'limit': 2, 'cursor': page['next_cursor']}
+    )
+    assert response.status_code == 200
+    page = response.json()
+    assert [obj['title'] for obj in page['items']] == ['Охрана']
+    assert page['next_cursor'] is None
+
+
+@dependency_overrides
+async def test_read_departments_bad_pagination(aclient: AsyncClient):
+    response = await aclient.get('/departments/', params={'cursor': 'xyz'})
+    assert response.status_code == 400
+    for raw in ('[1e999]', '[1.5]', '[{}]'.format(10 ** 30), '[true]'):
+        cursor = urlsafe_b64encode(raw.encode()).decode()
+        response = await aclient.get(
+            '/departments/', params={'cursor': cursor}
+        )
+        assert response.status_code == 400
+        assert response.json()['detail'] == (
+            'Некорректное значение курсора пагинации'
+        )
+    response = await aclient.get('/departments/', params={'limit': 0})
+    assert response.status_code == 422
+    response = await aclient.get('/departments/', params={'limit': 100000})
+    assert response.status_code == 422
+
+
+@dependency_overrides
+async def test_lookup_departments(aclient: AsyncClient):
+    response = await aclient.post(
+        '/departments/lookup/', json={'ids': [3, 4, 1, 3]}
+    )
+    assert response.status_code == 200
+    assert response.json() == {
+        'items': [
+            {'id': 3, 'title': 'Охрана', 'employees': []},
+            {'id': 1, 'title': 'Бухгалтерия', 'employees': []}
+        ],
+        'missing_ids': [4]
+    }
+    response = await aclient.post('/departments/lookup/', json={'ids': []})
+    assert response.status_code == 422
@@ -0,0 +1,119 @@
+from datetime import date
+
+import pytest
+from httpx import AsyncClient
+
+from src.data_base.models import Department, Salary, User
+
+from .conftest import async_session_maker, dependency_overrides, raise_date
+
+
+@pytest.fixture(scope='module')
+async def create_department_with_employees():
+    department = Department(title='Отдел продаж')
+    department.employees = [
+        User(
+            first_name='Работник',
+            last_name='Продаж',
+            username='seller{}'.format(number),
+            password='hash',
+            date_of_birth=date(1990, 1, 1),
+            is_blocked=False,
+            salary=Salary(amount=1000 + number, raise_date=raise_date)
+        ) for number in range(2)
+    ]
+    async with async_session_maker() as session:
+        session.add(department)
+        await session.commit()
+
+
+async def get_not_modified(
+    aclient: AsyncClient, url: str, if_none_match: str, **params
+) -> int:
+    """Выполняет условный запрос и возвращает код ответа."""
+    response = await aclient.get(
+        url, params=params, headers={'If-None-Match': if_none_match}
+    )
+    if response.status_code == 304:
+        assert response.headers['ETag'] in if_none_match or (
+            if_none_match == '*'
+        )
+        assert response.content == b''
+    return response.status_code
+
+
+@dependency_overrides
+async def test_list_not_modified(
+    aclient: AsyncClient, create_department_with_employees: None
+):
+    response = await aclient.get('/employees/')
+    assert response.status_code == 200
+    etag = response.headers['ETag']
+    assert etag.startswith('"') and etag.endswith('"')
+    assert await get_not_modified(aclient, '/employees/', etag) == 304
+    assert await get_not_modified(
+        aclient, '/employees/', 'W/"other", W/{}'.format(etag)
+    ) == 304
+    assert await get_not_modified(aclient, '/employees/', '*') == 304
+    assert await get_not_modified(aclient, '/employees/', '"other"') == 200
+    stream_response = await aclient.get('/employees/', params={'stream': True})
+    assert stream_response.headers['ETag'] != etag
+
+
+@dependency_overrides
+async def test_list_etag_changes_with_related_data(
+    aclient: AsyncClient, create_department_with_employees: None
+):
+    etag = (await aclient.get('/employees/')).headers['ETag']
+    response = await aclient.patch(
+        '/departments/1/', json={'title': 'Отдел закупок'}
+    )
+    assert response.status_code == 200
+    response = await aclient.get(
+        '/employees/', headers={'If-None-Match': etag}
+    )
+    assert response.status_code == 200
+    assert response.json()['items'][0]['department']['title'] == (
+        'Отдел закупок'
+    )
+    etag = response.headers['ETag']
+    response = await aclient.delete('/salaries/2/')
+    assert response.status_code == 204
+    assert await get_not_modified(aclient, '/employees/', etag) == 200
+
+
+@dependency_overrides
+async def test_detail_not_modified(
+    aclient: AsyncClient, create_department_with_employees: None
+):
+    response = await aclient.get('/employees/1/')
+    assert response.status_code == 200
+    etag = response.headers['ETag']
+    assert await get_not_modified(aclient, '/employees/1/', etag) == 304
+    assert await get_not_modified(
+        aclient, '/employees/1/', etag, fields='id'
+    ) == 200
+    response = await aclient.patch(
+        '/employees/1/', json={'first_name': 'Иван'}
+    )
+    assert response.status_code == 200
+    assert await get_not_modified(aclient, '/employees/1/', etag) == 200
+    response = await aclient.get('/departments/1/')
+    etag = response.headers['ETag']
+    assert await get_not_modified(aclient, '/departments/1/', etag) == 304
+    assert await get_not_modified(aclient, '/departments/999/', etag) == 404
+
+
+@dependency_overrides
+async def test_list_validates_before_not_modified(
+    aclient: AsyncClient, create_department_with_employees: None
+):
+    for url in ('/employees/', '/departments/', '/positions/', '/salaries/'):
+        assert await get_not_modified(aclient, url, '*') == 304
+        assert await get_not_modified(
+            aclient, url, '*', cursor='not-a-cursor'
+        ) == 400
+    assert await get_not_modified(
+        aclient, '/salaries/', '*',
+        date_after='2100-01-02', date_before='2100-01-01'
+    ) == 400
@@ -0,0 +1,53 @@
+import asyncio
+
+import pytest
+
+from src.core.exc.custom_exceptions import ServiceOverloadedError
+from src.core.services.authentication_service import AuthenticationService
+from src.core.services.password_hasher import PASSWORD_HASHER, PasswordHasher
+
+
+async def test_password_hasher_hash_and_verify():
+    hasher = PasswordHasher('thread', max_workers=1, queue_size=1)
+    hashed = await hasher.hash('12345678')
+    assert await hasher.verify('12345678', hashed)
+    assert not await hasher.verify('87654321', hashed)
+    hasher.shutdown()
+
+
+async def test_password_hasher_rejects_when_queue_is_full():
+    hasher = PasswordHasher('thread', max_workers=1, queue_size=1)
+    results = await asyncio.gather(
+        *(hasher.hash('12345678') for _ in range(3)),
+        return_exceptions=True
+    )
+    assert sum(isinstance(r, ServiceOverloadedError) for r in results) == 1
+    assert hasher.rejected == 1
+    assert hasher.pending == 0
+    hasher.shutdown()
+
+
+async def test_password_hasher_process_pool():
+    hasher = PasswordHasher('process', max_workers=1, queue_size=0)
+    hashed = await hasher.hash('12345678')
+    assert await hasher.verify('12345678', hashed)
+    hasher.shutdown()
+
+
+async def test_password_hasher_hash_many_keeps_order():
+    hasher = PasswordHasher('thread', max_workers=2, queue_size=0)
+    passwords = ['password{}'.format(number) for number in range(5)]
+    hashed = await hasher.hash_many(passwords)
+    assert len(hashed) == len(passwords)
+    for password, hashed_password in zip(passwords, hashed):
+        assert await hasher.verify(password, hashed_password)
+    hasher.shutdown()
+
+
+async def test_bulk_hashing_keeps_login_pool_free(
+    monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(PASSWORD_HASHER, 'max_pending', 0)
+    hashed = await AuthenticationService.hash_passwords(['12345678'] * 3)
+    assert len(hashed) == 3
+    assert PASSWORD_HASHER.rejected == 0
@@ -0,0 +1,126 @@
+from datetime import date, timedelta
+
+import pytest
+from httpx import AsyncClient
+
+from src.data_base.models import Department, Position, Salary, User
+
+from .conftest import async_session_maker, dependency_overrides
+
+today: date = date.today()
+date_before: str = (today + timedelta(days=20)).isoformat()
+
+
+@pytest.fixture(scope='module')
+async def create_payroll():
+    sales = Department(title='Отдел продаж')
+    supply = Department(title='Отдел закупок')
+    manager = Position(title='Менеджер')
+    # Отдел, должность, статус и заработная плата (размер, дней до повышения)
+    employees = [
+        (sales, manager, User.Status.EMPLOYEE, (1000, 10)),
+        (sales, None, User.Status.STAFF, (2000, 40)),
+        (supply, manager, User.Status.EMPLOYEE, (3000, 10)),
+        (supply, manager, User.Status.EMPLOYEE, None),
+        (None, None, User.Status.ADMIN, (4000, 10)),
+    ]
+    async with async_session_maker() as session:
+        for instance in (sales, supply, manager):
+            session.add(instance)
+            await session.flush()
+        for number, (department, position, status, salary) in enumerate(
+            employees
+        ):
+            session.add(User(
+                first_name='Работник',
+                last_name='Отдела',
+                username='worker{}'.format(number),
+                password='hash',
+                date_of_birth=date(1990, 1, 1),
+                status=status,
+                department=department,
+                position=position,
+                salary=salary and Salary(
+                    amount=salary[0],
+                    raise_date=today + timedelta(days=salary[1])
+                )
+            ))
+            await session.flush()
+        await session.commit()
+
+
+@dependency_overrides
+async def test_payroll_by_department(
+    aclient: AsyncClient, create_payroll: None
+):
+    response = await aclient.get('/reports/payroll/departments/')
+    assert response.status_code == 200
+    assert response.json() == {
+        'rows': [{
+            'id': 1,
+            'title': 'Отдел продаж',
+            'headcount': 2,
+            'total_amount': 3000,
+            'average_amount': 1500
+        }, {
+            'id': 2,
+            'title': 'Отдел закупок',
+            'headcount': 2,
+            'total_amount': 3000,
+            'average_amount': 3000
+        }, {
+            'id': None,
+            'title': None,
+            'headcount': 1,
+            'total_amount': 4000,
+            'average_amount': 4000
+        }],
+        'headcount': 5,
+        'total_amount': 10000,
+        'average_amount': 2500
+    }
+
+
+@dependency_overrides
+async def test_payroll_by_position_with_dates(aclient: AsyncClient):
+    response = await aclient.get(
+        '/reports/payroll/positions/', params={'date_before': date_before}
+    )
+    assert response.status_code == 200
+    assert response.json() == {
+        'rows': [{
+            'id': 1,
+            'title': 'Менеджер',
+            'headcount': 2,
+            'total_amount': 4000,
+            'average_amount': 2000
+        }, {
+            'id': None,
+            'title': None,
+            'headcount': 1,
+            'total_amount': 4000,
+            'average_amount': 4000
+        }],
+        'headcount': 3,
+        'total_amount': 8000,
+        'average_amount': 2666.67
+    }
+
+
+@dependency_overrides
+async def test_payroll_by_status(aclient: AsyncClient):
+    response = await aclient.get('/reports/payroll/statuses/')
+    assert response.status_code == 200
+    assert {
+        row['status']: (row['headcount'], row['total_amount'])
+        for row in response.json()['rows']
+    } == {'admin': (1, 4000), 'employee': (3, 4000), 'staff': (1, 2000)}
+
+
+@dependency_overrides
+async def test_payroll_with_inverted_window(aclient: AsyncClient):
+    response = await aclient.get('/reports/payroll/statuses/', params={
+        'date_after': date_before,
+        'date_before': (today + timedelta(days=1)).isoformat()
+    })
+    assert response.status_code == 400
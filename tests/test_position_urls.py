@@ -7,7 +7,7 @@ from .conftest import dependency_overrides
 async def test_read_positions(aclient: AsyncClient):
     response = await aclient.get('/positions/')
     assert response.status_code == 200
-    assert response.json() == []
+    assert response.json() == {'items': [], 'next_cursor': None}
 
 
 @dependency_overrides
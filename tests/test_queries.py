@@ -0,0 +1,447 @@
+import json
+from contextlib import contextmanager
+from datetime import date
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import event
+
+from src.core.services.authentication_service import PRINCIPAL_CACHE
+from src.data_base.crud.base_crud import VERSION_CACHE
+from src.data_base.models import Department, Salary, User
+
+from .conftest import (async_session_maker, dependency_overrides,
+                       engine_test, raise_date)
+
+EMPLOYEES_IN_DEPARTMENT: int = 3
+
+
+def is_version_query(statement: str) -> bool:
+    """Проверяет, что запрос читает версию данных списка для ETag."""
+    return statement.startswith('SELECT (SELECT count(') and (
+        'updated_at' in statement
+    )
+
+
+@pytest.fixture(autouse=True)
+def clear_version_cache():
+    """Каждый тест начинается без закэшированных версий данных."""
+    VERSION_CACHE.clear()
+
+
+@contextmanager
+def capture_sql():
+    """Собирает SQL-запросы, отправленные в БД внутри блока."""
+    statements: list = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, *args):
+        statements.append((statement, parameters))
+
+    event.listen(
+        engine_test.sync_engine, 'before_cursor_execute', before_cursor_execute
+    )
+    try:
+        yield statements
+    finally:
+        event.remove(
+            engine_test.sync_engine,
+            'before_cursor_execute',
+            before_cursor_execute
+        )
+
+
+async def count_rows(statement: str, parameters: tuple) -> int:
+    """Возвращает количество строк, которые БД отдает на запрос."""
+    async with engine_test.connect() as conn:
+        result = await conn.exec_driver_sql(statement, parameters)
+        return len(result.fetchall())
+
+
+async def rows_per_statement(statements: list) -> list[tuple[str, int]]:
+    return [
+        (statement, await count_rows(statement, parameters))
+        for statement, parameters in statements
+        if statement.lstrip().upper().startswith('SELECT')
+    ]
+
+
+@pytest.fixture(scope='module')
+async def create_department_with_employees():
+    department = Department(title='Отдел продаж')
+    department.employees = [
+        User(
+            first_name='Работник',
+            last_name='Продаж',
+            username='seller{}'.format(number),
+            password='hash',
+            date_of_birth=date(1990, 1, 1),
+            is_blocked=False,
+            salary=Salary(amount=1000 + number, raise_date=raise_date)
+        ) for number in range(EMPLOYEES_IN_DEPARTMENT)
+    ]
+    async with async_session_maker() as session:
+        session.add(department)
+        await session.commit()
+
+
+@dependency_overrides
+async def test_departments_list_sql(
+    aclient: AsyncClient, create_department_with_employees: None
+):
+    with capture_sql() as statements:
+        response = await aclient.get('/departments/')
+    assert response.status_code == 200
+    assert len(response.json()['items'][0]['employees']) == (
+        EMPLOYEES_IN_DEPARTMENT
+    )
+    rows = await rows_per_statement(statements)
+    assert len(rows) == 3
+    assert is_version_query(rows[0][0])
+    department_query, department_rows = rows[1]
+    employees_query, employees_rows = rows[2]
+    assert 'JOIN' not in department_query
+    assert department_rows == 1
+    assert ' IN ' in employees_query
+    assert employees_rows == EMPLOYEES_IN_DEPARTMENT
+
+
+@dependency_overrides
+async def test_users_list_sql(
+    aclient: AsyncClient, create_department_with_employees: None
+):
+    with capture_sql() as statements:
+        response = await aclient.get('/employees/')
+    assert response.status_code == 200
+    rows = await rows_per_statement(statements)
+    assert len(rows) == 2
+    assert is_version_query(rows[0][0])
+    users_query, users_rows = rows[1]
+    assert users_query.count('LEFT OUTER JOIN') == 3
+    assert users_rows == len(response.json()['items'])
+
+
+@dependency_overrides
+async def test_users_sparse_fields_sql(
+    aclient: AsyncClient, create_department_with_employees: None
+):
+    with capture_sql() as statements:
+        response = await aclient.get('/employees/', params={
+            'fields': 'id,first_name,last_name,department.title'
+        })
+    assert response.status_code == 200
+    assert response.json()['items'][0] == {
+        'id': 1,
+        'first_name': 'Работник',
+        'last_name': 'Продаж',
+        'department': {'title': 'Отдел продаж'}
+    }
+    assert len(statements) == 2
+    assert is_version_query(statements[0][0])
+    users_query = statements[1][0]
+    assert users_query.count('LEFT OUTER JOIN') == 1
+    assert 'password' not in users_query
+    assert 'username' not in users_query
+    assert 'salary' not in users_query
+    with capture_sql() as statements:
+        response = await aclient.get(
+            '/employees/1/', params={'fields': 'username'}
+        )
+    assert response.json() == {'username': 'seller0'}
+    assert 'JOIN' not in statements[0][0]
+
+
+@dependency_overrides
+async def test_departments_sparse_fields_sql(
+    aclient: AsyncClient, create_department_with_employees: None
+):
+    with capture_sql() as statements:
+        response = await aclient.get('/departments/', params={
+            'fields': 'title,employees.last_name'
+        })
+    assert response.status_code == 200
+    assert response.json() == {
+        'items': [{
+            'title': 'Отдел продаж',
+            'employees': [{'last_name': 'Продаж'}] * EMPLOYEES_IN_DEPARTMENT
+        }],
+        'next_cursor': None
+    }
+    queries = [statement for statement, _ in statements]
+    assert len(queries) == 3
+    assert is_version_query(queries[0])
+    assert 'first_name' not in queries[2]
+    with capture_sql() as statements:
+        response = await aclient.get(
+            '/salaries/', params={'fields': 'amount', 'stream': True}
+        )
+    assert response.status_code == 200
+    assert len(response.text.splitlines()) == EMPLOYEES_IN_DEPARTMENT
+    assert all(
+        json.loads(line).keys() == {'amount'}
+        for line in response.text.splitlines()
+    )
+    assert len(statements) == 2
+    assert is_version_query(statements[0][0])
+    assert 'JOIN' not in statements[1][0]
+
+
+@dependency_overrides
+async def test_sparse_fields_validation(aclient: AsyncClient):
+    for fields in ('password', 'department.budget', 'first_name.x', ','):
+        response = await aclient.get(
+            '/employees/', params={'fields': fields}
+        )
+        assert response.status_code == 400
+    response = await aclient.get(
+        '/salaries/1/', params={'fields': 'employee.username'}
+    )
+    assert response.status_code == 400
+
+
+@dependency_overrides
+async def test_salaries_list_sql(
+    aclient: AsyncClient, create_department_with_employees: None
+):
+    with capture_sql() as statements:
+        response = await aclient.get('/salaries/')
+    assert response.status_code == 200
+    rows = await rows_per_statement(statements)
+    assert len(rows) == 2
+    assert is_version_query(rows[0][0])
+    salaries_query, salaries_rows = rows[1]
+    assert salaries_query.count('JOIN') == 1
+    assert salaries_rows == EMPLOYEES_IN_DEPARTMENT
+
+
+async def test_permission_check_sql(aclient: AsyncClient, get_tokens: dict):
+    headers = {'Authorization': 'Bearer {}'.format(get_tokens['staff'])}
+    with capture_sql() as statements:
+        response = await aclient.get('/positions/', headers=headers)
+    assert response.status_code == 200
+    rows = await rows_per_statement(statements)
+    auth_query, auth_rows = rows[0]
+    assert 'JOIN' not in auth_query
+    assert 'password' not in auth_query
+    assert auth_rows == 1
+    assert is_version_query(rows[1][0])
+    with capture_sql() as statements:
+        response = await aclient.get('/positions/', headers=headers)
+    assert response.status_code == 200
+    assert len(await rows_per_statement(statements)) == len(rows) - 2
+
+
+async def test_self_update_principal_sql(
+    aclient: AsyncClient, get_tokens: dict
+):
+    PRINCIPAL_CACHE.clear()
+    headers = {'Authorization': 'Bearer {}'.format(get_tokens['employee'])}
+    with capture_sql() as statements:
+        response = await aclient.patch(
+            '/employees/me/', headers=headers, json={'first_name': 'Иван'}
+        )
+    assert response.status_code == 200
+    assert response.json()['first_name'] == 'Иван'
+    principal_queries = [
+        statement for statement, _ in statements
+        if 'token_version' in statement
+        and statement.lstrip().upper().startswith('SELECT')
+        and 'password' not in statement
+    ]
+    assert len(principal_queries) == 1
+
+
+async def test_login_sql(aclient: AsyncClient, get_tokens: dict):
+    with capture_sql() as statements:
+        response = await aclient.post('/employees/login/', json={
+            'username': 'staff', 'password': 'wrong_password'
+        })
+    assert response.status_code == 400
+    assert len(statements) == 1
+    assert 'JOIN' not in statements[0][0]
+    with capture_sql() as statements:
+        response = await aclient.post('/employees/login/', json={
+            'username': 'staff', 'password': '12345678'
+        })
+    assert response.status_code == 200
+    assert response.json()['username'] == 'staff'
+    assert 'access_token' in response.json()
+    assert len(statements) == 2
+    assert 'JOIN' not in statements[0][0]
+    assert 'password' not in statements[1][0]
+
+
+@dependency_overrides
+async def test_department_update_sql(
+    aclient: AsyncClient, create_department_with_employees: None
+):
+    with capture_sql() as statements:
+        response = await aclient.patch(
+            '/departments/1/', json={'title': 'Отдел закупок'}
+        )
+    assert response.status_code == 200
+    assert response.json()['title'] == 'Отдел закупок'
+    assert len(response.json()['employees']) == EMPLOYEES_IN_DEPARTMENT
+    queries = [statement.lstrip().upper() for statement, _ in statements]
+    assert queries[0].startswith('UPDATE')
+    assert 'RETURNING' in queries[0]
+    assert len(queries) == 2
+    assert ' IN ' in queries[1]
+
+
+@dependency_overrides
+async def test_department_update_missing_sql(aclient: AsyncClient):
+    with capture_sql() as statements:
+        response = await aclient.patch(
+            '/departments/999/', json={'title': 'Отдел кадров'}
+        )
+    assert response.status_code == 404
+    assert len(statements) == 1
+
+
+@dependency_overrides
+async def test_position_create_sql(aclient: AsyncClient):
+    with capture_sql() as statements:
+        response = await aclient.post('/positions/', json={'title': 'Кассир'})
+    assert response.status_code == 201
+    assert response.json()['employees'] == []
+    assert len(statements) == 1
+    assert statements[0][0].lstrip().upper().startswith('INSERT')
+    assert 'RETURNING' in statements[0][0].upper()
+
+
+@dependency_overrides
+async def test_department_delete_sql(
+    aclient: AsyncClient, create_department_with_employees: None
+):
+    with capture_sql() as statements:
+        response = await aclient.delete('/departments/1/')
+    assert response.status_code == 204
+    assert len(statements) == 1
+    assert statements[0][0].lstrip().upper().startswith('DELETE')
+    response = await aclient.get('/employees/')
+    assert all(
+        user['department'] is None for user in response.json()['items']
+    )
+    with capture_sql() as statements:
+        response = await aclient.delete('/departments/1/')
+    assert response.status_code == 404
+    assert len(statements) == 1
+
+
+@dependency_overrides
+async def test_user_update_references_sql(
+    aclient: AsyncClient, create_department_with_employees: None
+):
+    with capture_sql() as statements:
+        response = await aclient.patch(
+            '/employees/1/', json={'position': 1, 'salary': 1}
+        )
+    assert response.status_code == 200
+    queries = [statement.lstrip().upper() for statement, _ in statements]
+    assert queries[0].startswith('UPDATE')
+    assert all(' IN ' in query for query in queries[1:])
+
+
+@dependency_overrides
+async def test_users_bulk_create_sql(aclient: AsyncClient):
+    items = [{
+        'first_name': 'Новый',
+        'last_name': 'Работник',
+        'username': 'bulk{}'.format(number),
+        'password': '12345678',
+        'password_repeat': '12345678',
+        'date_of_birth': '1990-01-01'
+    } for number in range(3)]
+    with capture_sql() as statements:
+        response = await aclient.post('/employees/bulk/', json={
+            'items': items
+        })
+    assert response.status_code == 201
+    assert len(response.json()['items']) == len(items)
+    queries = [statement.lstrip().upper() for statement, _ in statements]
+    assert len(queries) == 2
+    assert queries[0].startswith('SELECT')
+    assert queries[1].startswith('INSERT')
+
+
+@dependency_overrides
+async def test_users_lookup_sql(aclient: AsyncClient):
+    with capture_sql() as statements:
+        response = await aclient.post(
+            '/employees/lookup/', json={'ids': [3, 2, 999]}
+        )
+    assert response.status_code == 200
+    assert [user['id'] for user in response.json()['items']] == [3, 2]
+    assert response.json()['missing_ids'] == [999]
+    rows = await rows_per_statement(statements)
+    assert len(rows) == 1
+    users_query, users_rows = rows[0]
+    assert ' IN ' in users_query
+    assert users_rows == 2
+
+
+@dependency_overrides
+async def test_payroll_report_sql(
+    aclient: AsyncClient, create_department_with_employees: None
+):
+    with capture_sql() as statements:
+        response = await aclient.get('/reports/payroll/departments/')
+    assert response.status_code == 200
+    rows = await rows_per_statement(statements)
+    assert len(rows) == 1
+    report_query, report_rows = rows[0]
+    assert 'GROUP BY' in report_query
+    assert report_rows == len(response.json()['rows'])
+
+
+@dependency_overrides
+async def test_users_stream_sql(
+    aclient: AsyncClient, create_department_with_employees: None
+):
+    page = (await aclient.get('/employees/')).json()['items']
+    with capture_sql() as statements:
+        response = await aclient.get('/employees/', params={'stream': True})
+    assert response.status_code == 200
+    assert response.headers['content-type'] == 'application/x-ndjson'
+    assert [json.loads(line) for line in response.text.splitlines()] == page
+    assert len(statements) == 1
+
+
+@dependency_overrides
+async def test_salaries_stream_by_accept(
+    aclient: AsyncClient, create_department_with_employees: None
+):
+    response = await aclient.get(
+        '/salaries/', headers={'Accept': 'application/x-ndjson'}
+    )
+    assert response.status_code == 200
+    salaries = [json.loads(line) for line in response.text.splitlines()]
+    assert salaries == (await aclient.get('/salaries/')).json()['items']
+    response = await aclient.get('/salaries/', params={
+        'stream': True,
+        'date_after': '2100-01-02',
+        'date_before': '2100-01-01'
+    })
+    assert response.status_code == 400
+
+
+@dependency_overrides
+async def test_not_modified_list_sql(
+    aclient: AsyncClient, create_department_with_employees: None
+):
+    etag = (await aclient.get('/employees/')).headers['ETag']
+    with capture_sql() as statements:
+        response = await aclient.get(
+            '/employees/', headers={'If-None-Match': etag}
+        )
+    assert response.status_code == 304
+    assert statements == []
+    VERSION_CACHE.clear()
+    with capture_sql() as statements:
+        response = await aclient.get(
+            '/employees/', headers={'If-None-Match': etag}
+        )
+    assert response.status_code == 304
+    assert len(statements) == 1
+    assert is_version_query(statements[0][0])
+    assert 'JOIN' not in statements[0][0]
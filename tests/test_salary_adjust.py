@@ -0,0 +1,122 @@
+from datetime import date, timedelta
+
+import pytest
+from httpx import AsyncClient
+
+from src.data_base.models import Department, Position, Salary, User
+
+from .conftest import async_session_maker, dependency_overrides, raise_date
+
+new_raise_date: str = (date.today() + timedelta(days=60)).strftime('%Y-%m-%d')
+
+
+@pytest.fixture(scope='module')
+async def create_staff_with_salaries():
+    sales = Department(title='Отдел продаж')
+    supply = Department(title='Отдел закупок')
+    manager = Position(title='Менеджер')
+    salaries = [
+        Salary(amount=amount, raise_date=raise_date)
+        for amount in (1000, 2000, 3000, 4000)
+    ]
+    async with async_session_maker() as session:
+        for instance in (sales, supply, manager, *salaries):
+            session.add(instance)
+            await session.flush()
+        session.add_all([
+            User(
+                first_name='Работник',
+                last_name='Отдела',
+                username='worker{}'.format(number),
+                password='hash',
+                date_of_birth=date(1990, 1, 1),
+                department=sales if number < 3 else supply,
+                position=manager if number % 2 else None,
+                salary=salary
+            ) for number, salary in enumerate(salaries)
+        ])
+        await session.commit()
+
+
+@dependency_overrides
+async def test_adjust_salaries_dry_run(
+    aclient: AsyncClient, create_staff_with_salaries: None
+):
+    response = await aclient.post('/salaries/adjust/', json={
+        'department': 1,
+        'percent': 10,
+        'raise_date': new_raise_date,
+        'dry_run': True
+    })
+    assert response.status_code == 200
+    assert response.json() == {
+        'affected': 3,
+        'amount_before': 6000,
+        'amount_after': 6600
+    }
+    response = await aclient.get('/salaries/1/')
+    assert response.json()['amount'] == 1000
+
+
+@dependency_overrides
+async def test_adjust_salaries_by_department(aclient: AsyncClient):
+    response = await aclient.post('/salaries/adjust/', json={
+        'department': 1,
+        'percent': 10,
+        'raise_date': new_raise_date
+    })
+    assert response.status_code == 200
+    assert response.json() == {
+        'affected': 3,
+        'amount_before': None,
+        'amount_after': None
+    }
+    response = await aclient.get('/salaries/')
+    assert [
+        (salary['amount'], salary['raise_date'])
+        for salary in response.json()['items']
+    ] == [(4000, raise_date.strftime('%Y-%m-%d'))] + [
+        (amount, new_raise_date) for amount in (1100, 2200, 3300)
+    ]
+
+
+@dependency_overrides
+async def test_adjust_salaries_by_position_and_ids(aclient: AsyncClient):
+    response = await aclient.post('/salaries/adjust/', json={
+        'position': 1,
+        'ids': [1, 2, 3],
+        'delta': -200,
+        'raise_date': new_raise_date
+    })
+    assert response.status_code == 200
+    assert response.json()['affected'] == 1
+    response = await aclient.get('/salaries/2/')
+    assert response.json()['amount'] == 2000
+
+
+@dependency_overrides
+async def test_adjust_salaries_to_non_positive(aclient: AsyncClient):
+    response = await aclient.post('/salaries/adjust/', json={
+        'ids': [1, 2],
+        'delta': -1500,
+        'raise_date': new_raise_date
+    })
+    assert response.status_code == 400
+    response = await aclient.get('/salaries/2/')
+    assert response.json()['amount'] == 2000
+
+
+@dependency_overrides
+async def test_adjust_salaries_bad_request(aclient: AsyncClient):
+    response = await aclient.post('/salaries/adjust/', json={
+        'percent': 10,
+        'raise_date': new_raise_date
+    })
+    assert response.status_code == 422
+    response = await aclient.post('/salaries/adjust/', json={
+        'department': 1,
+        'percent': 10,
+        'delta': 100,
+        'raise_date': new_raise_date
+    })
+    assert response.status_code == 422
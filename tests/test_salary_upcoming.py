@@ -0,0 +1,117 @@
+from datetime import date, timedelta
+
+import pytest
+from httpx import AsyncClient
+
+from src.data_base.models import Department, Salary, User
+
+from .conftest import async_session_maker, dependency_overrides
+
+today: date = date.today()
+# Отдел и смещение даты повышения для каждого работника
+EMPLOYEES: list[tuple[int | None, int]] = [
+    (1, 3), (2, 3), (1, 10), (None, 45), (1, 100)
+]
+
+
+def week_start(days: int) -> str:
+    day = today + timedelta(days=days)
+    return (day - timedelta(days=day.weekday())).isoformat()
+
+
+def month_start(days: int) -> str:
+    return (today + timedelta(days=days)).replace(day=1).isoformat()
+
+
+@pytest.fixture(scope='module')
+async def create_upcoming_raises():
+    departments = [Department(title='Отдел продаж'), Department(title='Склад')]
+    salaries = [
+        Salary(amount=1000 * (number + 1), raise_date=today + timedelta(days))
+        for number, (_, days) in enumerate(EMPLOYEES)
+    ]
+    async with async_session_maker() as session:
+        for instance in (*departments, *salaries):
+            session.add(instance)
+            await session.flush()
+        session.add(Salary(amount=500, raise_date=today + timedelta(5)))
+        session.add_all([
+            User(
+                first_name='Работник',
+                last_name='Отдела',
+                username='worker{}'.format(number),
+                password='hash',
+                date_of_birth=date(1990, 1, 1),
+                department_id=department_id,
+                salary=salary
+            ) for number, ((department_id, _), salary) in enumerate(
+                zip(EMPLOYEES, salaries)
+            )
+        ])
+        await session.commit()
+
+
+@dependency_overrides
+async def test_upcoming_raises_counts_by_week(
+    aclient: AsyncClient, create_upcoming_raises: None
+):
+    response = await aclient.get('/salaries/upcoming/', params={
+        'days': 60, 'period': 'week', 'counts_only': True
+    })
+    assert response.status_code == 200
+    data = response.json()
+    assert data['date_from'] == today.isoformat()
+    assert data['date_to'] == (today + timedelta(60)).isoformat()
+    expected = {}
+    for number, (department_id, days) in enumerate(EMPLOYEES[:4]):
+        count, amount = expected.get((week_start(days), department_id), (0, 0))
+        expected[week_start(days), department_id] = (
+            count + 1, amount + 1000 * (number + 1)
+        )
+    assert {
+        (bucket['period_start'], bucket['department_id']): (
+            bucket['count'], bucket['amount']
+        ) for bucket in data['buckets']
+    } == expected
+    assert [
+        (bucket['period_start'], bucket['department_id'])
+        for bucket in data['buckets']
+    ] == sorted(expected, key=lambda key: (key[0], key[1] is None, key[1]))
+    assert all(bucket['salaries'] is None for bucket in data['buckets'])
+
+
+@dependency_overrides
+async def test_upcoming_raises_by_month(aclient: AsyncClient):
+    response = await aclient.get('/salaries/upcoming/', params={
+        'days': 30
+    })
+    assert response.status_code == 200
+    buckets = response.json()['buckets']
+    assert sum(bucket['count'] for bucket in buckets) == 3
+    for bucket in buckets:
+        assert bucket['count'] == len(bucket['salaries'])
+        assert all(
+            month_start(
+                (date.fromisoformat(salary['raise_date']) - today).days
+            ) == bucket['period_start']
+            for salary in bucket['salaries']
+        )
+    sales = [
+        salary['employee']['id']
+        for bucket in buckets if bucket['department_id'] == 1
+        for salary in bucket['salaries']
+    ]
+    assert sales == [1, 3]
+    assert {
+        bucket['department_title'] for bucket in buckets
+    } == {'Отдел продаж', 'Склад'}
+
+
+@dependency_overrides
+async def test_upcoming_raises_invalid_params(aclient: AsyncClient):
+    response = await aclient.get('/salaries/upcoming/', params={'days': 0})
+    assert response.status_code == 422
+    response = await aclient.get(
+        '/salaries/upcoming/', params={'period': 'year'}
+    )
+    assert response.status_code == 422
@@ -14,7 +14,7 @@ raise_date_next: str = (date.today() + timedelta(days=35)).strftime('%Y-%m-%d')
 async def test_read_salaries(aclient: AsyncClient):
     response = await aclient.get('/salaries/')
     assert response.status_code == 200
-    assert response.json() == []
+    assert response.json() == {'items': [], 'next_cursor': None}
 
 
 @dependency_overrides
@@ -24,7 +24,16 @@ async def test_read_salaries_with_params(aclient: AsyncClient):
         params={'after_date': after_date, 'before_date': before_date}
     )
     assert response.status_code == 200
-    assert response.json() == []
+    assert response.json() == {'items': [], 'next_cursor': None}
+
+
+@dependency_overrides
+async def test_read_salaries_with_inverted_window(aclient: AsyncClient):
+    response = await aclient.get(
+        '/salaries/',
+        params={'date_after': raise_date_next, 'date_before': raise_date}
+    )
+    assert response.status_code == 400
 
 
 @dependency_overrides
@@ -49,12 +58,15 @@ async def test_read_salaries_with_params_again(aclient: AsyncClient):
         params={'after_date': after_date, 'before_date': before_date}
     )
     assert response.status_code == 200
-    assert response.json() == [{
-        'id': 1,
-        'amount': 1000.04,
-        'raise_date': raise_date,
-        'employee': None
-    }]
+    assert response.json() == {
+        'items': [{
+            'id': 1,
+            'amount': 1000.04,
+            'raise_date': raise_date,
+            'employee': None
+        }],
+        'next_cursor': None
+    }
 
 
 @dependency_overrides
@@ -0,0 +1,127 @@
+import inspect
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+from src.api.v1 import response_models
+from src.api.v1.response_models import (bulk, department, page, position,
+                                        report, salary, user)
+from src.api.v1.response_models.serializers import (get_serializer,
+                                                    serialized_response)
+from src.data_base.DTO_models import (LookupDTO, PageDTO, SalaryShortDTO,
+                                      TitledDTO, UpcomingRaisesBucketDTO,
+                                      UpcomingRaisesDTO, UserReadDTO)
+from src.data_base.models import Department, Position, Salary, User
+
+from .conftest import app
+
+sales = Department(id=1, title='Отдел "продаж"')
+manager = Position(id=2, title='Менеджер')
+salary_obj = Salary(
+    id=3, amount=Decimal('1000.50'), raise_date=date(2100, 1, 1)
+)
+employee = User(
+    id=4,
+    first_name='Иван',
+    last_name='Петров',
+    username='ivan',
+    password='hash',
+    date_of_birth=date(1990, 1, 1),
+    is_blocked=False,
+    status=User.Status.STAFF,
+    department=sales,
+    position=manager,
+    salary=salary_obj
+)
+newcomer = User(
+    id=5,
+    first_name='Петр',
+    last_name='Иванов',
+    username='petr',
+    password='hash',
+    date_of_birth=date(2000, 2, 29),
+    is_blocked=True,
+    status=User.Status.EMPLOYEE,
+    department=None,
+    position=None,
+    salary=None
+)
+sales.employees = [employee]
+salary_obj.employee = employee
+employee_dto = UserReadDTO(
+    id=4,
+    first_name='Иван',
+    last_name='Петров',
+    username='ivan',
+    date_of_birth=date(1990, 1, 1),
+    is_blocked=False,
+    status=User.Status.STAFF,
+    department=TitledDTO(1, 'Отдел "продаж"'),
+    position=None,
+    salary=SalaryShortDTO(3, Decimal('1000'), date(2100, 1, 1))
+)
+
+
+def render_validated(model: type[BaseModel], obj) -> bytes:
+    """Возвращает тело ответа, как его формирует `FastAPI` по схеме."""
+    return JSONResponse(jsonable_encoder(model.from_orm(obj))).body
+
+
+@pytest.mark.parametrize('model, obj', [
+    (user.UserResponse, employee),
+    (user.UserResponse, newcomer),
+    (user.UserResponse, employee_dto),
+    (page.PageResponse[user.UserResponse], PageDTO(
+        items=[employee, employee_dto, newcomer], next_cursor='WzVd'
+    )),
+    (department.DepartmentResponse, sales),
+    (page.PageResponse[position.PositionResponse], PageDTO(
+        items=[Position(id=1, title='Кассир', employees=[newcomer])]
+    )),
+    (bulk.LookupResponse[salary.SalaryResponse], LookupDTO(
+        items=[salary_obj], missing_ids=[7, 8]
+    )),
+    (salary.UpcomingRaisesResponse, UpcomingRaisesDTO(
+        date(2100, 1, 1), date(2100, 1, 31), [UpcomingRaisesBucketDTO(
+            date(2100, 1, 1), 1, 'Отдел', 2, Decimal('2001.00'), [salary_obj]
+        ), UpcomingRaisesBucketDTO(
+            date(2100, 1, 1), None, None, 1, Decimal('0.1')
+        )]
+    )),
+])
+def test_serialized_response_matches_validated(model, obj):
+    response = serialized_response(model, obj)
+    assert response.media_type == 'application/json'
+    assert response.body == render_validated(model, obj)
+
+
+def test_all_response_models_are_serializable():
+    models = [
+        member
+        for module in (bulk, department, page, position, report, salary, user)
+        for _, member in inspect.getmembers(module, inspect.isclass)
+        if issubclass(member, BaseModel)
+        and member.__module__.startswith(response_models.__name__)
+        and not getattr(member, '__parameters__', ())
+    ]
+    assert models
+    for model in models:
+        get_serializer(model)
+
+
+def test_openapi_response_schema_is_kept():
+    schema = app.openapi()
+    responses = schema['paths']['/api/v1/employees/']['get']['responses']
+    assert responses['200']['content']['application/json']['schema'] == {
+        '$ref': '#/components/schemas/PageResponse_UserResponse_'
+    }
+    responses = schema['paths']['/api/v1/salaries/{obj_id}/']['get'][
+        'responses'
+    ]
+    assert responses['200']['content']['application/json']['schema'] == {
+        '$ref': '#/components/schemas/SalaryResponse'
+    }
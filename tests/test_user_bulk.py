@@ -0,0 +1,145 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import update
+
+from src.data_base.models import Department, User
+
+from .conftest import async_session_maker
+
+
+def bearer(token: str) -> dict:
+    return {'Authorization': 'Bearer {}'.format(token)}
+
+
+async def login(aclient: AsyncClient, username: str) -> dict:
+    response = await aclient.post('/employees/login/', json={
+        'username': username,
+        'password': '12345678'
+    })
+    assert response.status_code == 200
+    return bearer(response.json()['access_token'])
+
+
+@pytest.fixture(scope='module')
+async def create_departments(get_tokens: dict):
+    async with async_session_maker() as session:
+        session.add(Department(title='Отдел продаж'))
+        await session.flush()
+        session.add(Department(title='Отдел закупок'))
+        await session.flush()
+        await session.execute(
+            update(User)
+            .where(User.username.in_(('employee', 'target')))
+            .values(department_id=1)
+        )
+        await session.commit()
+
+
+async def test_bulk_block_users(
+    aclient: AsyncClient, get_tokens: dict, create_departments: None
+):
+    employee_headers = await login(aclient, 'employee')
+    target_headers = await login(aclient, 'target')
+    response = await aclient.post(
+        '/employees/bulk/block/',
+        json={'department': 1},
+        headers=bearer(get_tokens['employee'])
+    )
+    assert response.status_code == 403
+    response = await aclient.post(
+        '/employees/bulk/block/',
+        json={'department': 1},
+        headers=bearer(get_tokens['staff'])
+    )
+    assert response.status_code == 200
+    assert response.json()['affected'] == 2
+    assert sorted(response.json()['ids']) == [3, 4]
+    for headers in (employee_headers, target_headers):
+        response = await aclient.get('/employees/me/', headers=headers)
+        assert response.status_code == 401
+
+
+async def test_bulk_unblock_users(aclient: AsyncClient, get_tokens: dict):
+    response = await aclient.post(
+        '/employees/bulk/unblock/',
+        json={'ids': [3, 4]},
+        headers=bearer(get_tokens['staff'])
+    )
+    assert response.status_code == 200
+    assert response.json()['affected'] == 2
+    headers = await login(aclient, 'target')
+    response = await aclient.get('/employees/me/', headers=headers)
+    assert response.status_code == 200
+
+
+async def test_bulk_change_users_status(
+    aclient: AsyncClient, get_tokens: dict
+):
+    headers = await login(aclient, 'target')
+    response = await aclient.post(
+        '/employees/bulk/status/',
+        json={'department': 1, 'status': 'staff'},
+        headers=bearer(get_tokens['staff'])
+    )
+    assert response.status_code == 403
+    response = await aclient.post(
+        '/employees/bulk/status/',
+        json={'department': 1, 'status': 'staff'},
+        headers=bearer(get_tokens['admin'])
+    )
+    assert response.status_code == 200
+    assert response.json()['affected'] == 2
+    response = await aclient.get('/employees/me/', headers=headers)
+    assert response.status_code == 401
+    headers = await login(aclient, 'target')
+    response = await aclient.get('/employees/me/', headers=headers)
+    assert response.json()['status'] == 'staff'
+
+
+async def test_bulk_transfer_users(aclient: AsyncClient, get_tokens: dict):
+    response = await aclient.post(
+        '/employees/bulk/transfer/',
+        json={'department': 1},
+        headers=bearer(get_tokens['admin'])
+    )
+    assert response.status_code == 422
+    response = await aclient.post(
+        '/employees/bulk/transfer/',
+        json={'department': 1, 'new_department': 999},
+        headers=bearer(get_tokens['admin'])
+    )
+    assert response.status_code == 404
+    response = await aclient.post(
+        '/employees/bulk/transfer/',
+        json={'department': 1, 'new_department': 2},
+        headers=bearer(get_tokens['admin'])
+    )
+    assert response.status_code == 200
+    assert sorted(response.json()['ids']) == [3, 4]
+    response = await aclient.get(
+        '/employees/4/', headers=bearer(get_tokens['admin'])
+    )
+    assert response.json()['department']['id'] == 2
+
+
+async def test_bulk_delete_users(aclient: AsyncClient, get_tokens: dict):
+    headers = await login(aclient, 'target')
+    response = await aclient.post(
+        '/employees/bulk/delete/',
+        json={},
+        headers=bearer(get_tokens['admin'])
+    )
+    assert response.status_code == 422
+    response = await aclient.post(
+        '/employees/bulk/delete/',
+        json={'ids': [4, 999], 'department': 2},
+        headers=bearer(get_tokens['admin'])
+    )
+    assert response.status_code == 200
+    assert response.json() == {'affected': 1, 'ids': [4]}
+    response = await aclient.get('/employees/me/', headers=headers)
+    assert response.status_code == 403
+    response = await aclient.get(
+        '/employees/4/', headers=bearer(get_tokens['admin'])
+    )
+    assert response.status_code == 404
@@ -1,5 +1,8 @@
+import pytest
 from httpx import AsyncClient
 
+from src.data_base.crud import UserCRUD
+
 from .conftest import dependency_overrides, raise_date
 
 
@@ -7,7 +10,7 @@ from .conftest import dependency_overrides, raise_date
 async def test_read_users(aclient: AsyncClient):
     response = await aclient.get('/employees/')
     assert response.status_code == 200
-    assert response.json() == []
+    assert response.json() == {'items': [], 'next_cursor': None}
 
 
 @dependency_overrides
@@ -97,6 +100,18 @@ async def test_update_user(aclient: AsyncClient, create_secondary_data: None):
     }
 
 
+@dependency_overrides
+async def test_update_user_missing_reference(aclient: AsyncClient):
+    response = await aclient.patch('/employees/1/', json={
+        'department': 1,
+        'position': 999
+    })
+    assert response.status_code == 404
+    assert response.json() == {
+        'detail': 'Объект Position с id 999 не найден'
+    }
+
+
 @dependency_overrides
 async def test_update_status_user(aclient: AsyncClient):
     response = await aclient.patch('/employees/1/status/', json={
@@ -136,6 +151,15 @@ async def test_login_user_admin_unblocked(aclient: AsyncClient):
     assert response.status_code == 200
 
 
+@dependency_overrides
+async def test_login_user_wrong_password(aclient: AsyncClient):
+    response = await aclient.post('/employees/login/', json={
+        'username': 'test',
+        'password': '87654321'
+    })
+    assert response.status_code == 400
+
+
 @dependency_overrides
 async def test_read_self_user_with_token(aclient: AsyncClient):
     token = await aclient.post('/employees/login/', json={
@@ -249,3 +273,87 @@ async def test_update_password_user(aclient: AsyncClient):
 async def test_delete_user(aclient: AsyncClient):
     response = await aclient.delete('/employees/1/')
     assert response.status_code == 204
+
+
+def bulk_user(username: str) -> dict:
+    return {
+        'first_name': 'Новый',
+        'last_name': 'Работник',
+        'username': username,
+        'password': '12345678',
+        'password_repeat': '12345678',
+        'date_of_birth': '1990-01-01'
+    }
+
+
+@dependency_overrides
+async def test_create_users_bulk_atomic(aclient: AsyncClient):
+    response = await aclient.post('/employees/bulk/', json={
+        'items': [bulk_user('new1'), bulk_user('new2'), bulk_user('new1')]
+    })
+    assert response.status_code == 400
+    assert response.json() == {
+        'detail': [{
+            'index': 2,
+            'detail': 'Работник с username new1 уже существует'
+        }]
+    }
+    response = await aclient.get('/employees/')
+    assert response.json()['items'] == []
+
+
+@dependency_overrides
+async def test_create_users_bulk_partial(aclient: AsyncClient):
+    response = await aclient.post('/employees/bulk/', json={
+        'items': [bulk_user('new1'), bulk_user('new1'), bulk_user('new2')],
+        'mode': 'partial'
+    })
+    assert response.status_code == 201
+    assert [user['username'] for user in response.json()['items']] == [
+        'new1', 'new2'
+    ]
+    assert response.json()['errors'] == [{
+        'index': 1,
+        'detail': 'Работник с username new1 уже существует'
+    }]
+    response = await aclient.post('/employees/bulk/', json={
+        'items': [bulk_user('new2'), bulk_user('new3')],
+        'mode': 'partial'
+    })
+    assert response.status_code == 201
+    assert [user['username'] for user in response.json()['items']] == [
+        'new3'
+    ]
+    assert response.json()['errors'][0]['index'] == 0
+
+
+@dependency_overrides
+async def test_create_users_bulk_partial_concurrent_username(
+    aclient: AsyncClient, monkeypatch: pytest.MonkeyPatch
+):
+    async def no_existing_usernames(self, usernames):
+        return set()
+
+    monkeypatch.setattr(
+        UserCRUD, 'get_existing_usernames', no_existing_usernames
+    )
+    response = await aclient.post('/employees/bulk/', json={
+        'items': [bulk_user('new3'), bulk_user('new4')],
+        'mode': 'partial'
+    })
+    assert response.status_code == 201
+    assert [user['username'] for user in response.json()['items']] == [
+        'new4'
+    ]
+    assert response.json()['errors'] == [{
+        'index': 0,
+        'detail': 'Работник с username new3 уже существует'
+    }]
+    response = await aclient.post('/employees/bulk/', json={
+        'items': [bulk_user('new4'), bulk_user('new5')]
+    })
+    assert response.status_code == 400
+    response = await aclient.get('/employees/')
+    assert 'new5' not in [
+        user['username'] for user in response.json()['items']
+    ]